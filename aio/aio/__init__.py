@@ -1,15 +1,73 @@
-from .abc_analysis import abc_analysis
+import importlib
+import sys
+import types
 
-from .xyz_analysis import xyz_analysis
+# public objects by the submodule defining them, the submodules are imported on first access
+# (PEP 562) so that e.g. vault_get_secret does not import pandas or scipy
+_LAZY_IMPORTS = {
+    "abc_analysis": ".abc_analysis",
+    "abc_analysis_parquet": ".abc_analysis",
+    "abc_analysis_sweep": ".abc_analysis",
+    "xyz_analysis": ".xyz_analysis",
+    "xyz_analysis_windows": ".xyz_analysis",
+    "XYZState": ".xyz_state",
+    "abc_xyz_analysis": ".abc_xyz_analysis",
+    "create_time_series": ".create_time_series",
+    "create_time_series_batch": ".create_time_series",
+    "vault_get_secret": ".azure_key_vault",
+    "vault_get_secrets": ".azure_key_vault",
+    "vault_invalidate_secret": ".azure_key_vault",
+    "_vault_set_dbutils": ".azure_key_vault",
+    "_vault_set_client": ".azure_key_vault",
+    "_LocalSecretClient": ".azure_key_vault",
+    "_is_running_on_databricks": ".azure_key_vault",
+    "_is_running_on_devops_pipeline": ".azure_key_vault",
+    "read_and_write": ".read_and_write",
+    "read_and_write_all": ".read_and_write",
+    "read_and_concat": ".read_and_write",
+    "read_all_sheets": ".read_and_write",
+}
 
-from .create_time_series import create_time_series
+_SUBMODULES = {
+    "abc_analysis",
+    "abc_xyz_analysis",
+    "azure_key_vault",
+    "create_time_series",
+    "key_encoding",
+    "polars_backend",
+    "read_and_write",
+    "xyz_analysis",
+    "xyz_state",
+}
 
-from .azure_key_vault import vault_get_secret
-from .azure_key_vault import _vault_set_dbutils
-from .azure_key_vault import _is_running_on_databricks
-from .azure_key_vault import _is_running_on_devops_pipeline
+__all__ = [name for name in _LAZY_IMPORTS if not name.startswith("_")] + ["set_dbutils"]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = globals()[name] = getattr(module, name)
+        return value
+    if name in _SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | _SUBMODULES)
+
+
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name, value):
+        # importing a submodule sets it as attribute of the package, keep the function of the same
+        # name instead, e.g. abc_analysis
+        if isinstance(value, types.ModuleType) and name in _LAZY_IMPORTS:
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyModule
 
-from .read_and_write import read_and_write, read_and_write_all, read_and_concat, read_all_sheets
 
 def set_dbutils(dbutils_var):
     """Allows the vault functions to use the ``dbutils`` variable
@@ -19,4 +77,6 @@ def set_dbutils(dbutils_var):
         dbutils_var
             ``dbutils`` variable from Databricks should be passed here
     """
-    _vault_set_dbutils(dbutils_var)
\ No newline at end of file
+    from .azure_key_vault import _vault_set_dbutils
+
+    _vault_set_dbutils(dbutils_var)
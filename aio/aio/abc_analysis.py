@@ -1,4 +1,11 @@
+import os
+
 import numpy as np
+import pandas as pd
+
+from .key_encoding import _encode_keys, _decode_keys, _join_keys
+from .read_and_write import _filter_frame
+from .polars_backend import _abc_analysis_polars
 
 
 def abc_analysis(
@@ -9,18 +16,24 @@ def abc_analysis(
     A=0.8,
     B=0.95,
     classified_only=False,
+    n_jobs=None,
+    filters=None,
+    backend="pandas",
+    passthrough_dimensions=None,
 ):
     """
     Multi-Dimensional ABC Analysis provides ABC classification for a multi-dimensional, granular input.
 
     Parameters
     ----------
-    df : Pandas.DataFrame
+    df : Pandas.DataFrame or path
         DataFrame holding the object to be classified, if applicable additional secondary_dimensions, and
         numeric values used for classification, e.g.
 
         df.columns = ["product", "country", "quantity"].
 
+        A path to a parquet file or folder is read with the needed columns only.
+
     primary_dimension : string
         Column name in input DataFrame holding object to be classified, e.g. product.
 
@@ -28,8 +41,13 @@ def abc_analysis(
         List of columns names in input DataFrame holding additional attributes of primary_dimension to
         structure classification on a more granular level, e.g. country, region, city
 
-    numeric_dimension : string
-        Column name in input DataFrame holding numeric values to be used for classification.
+    numeric_dimension : string or list of strings
+        Column name in input DataFrame holding numeric values to be used for classification. A list of
+        column names, e.g. quantity, revenue and order lines, classifies by every one of them at once:
+        all of them are aggregated in one groupby and the columns Cumsum_Sec_Dim, Relative_Quantity,
+        Cumsum_Relative_Quantity and Class are returned per numeric column, suffixed with its name,
+        e.g. Class_Revenue. Rows are then ordered by the first numeric column. Requires the pandas
+        backend.
 
     A, B : float = 0.8, 0.95
         Threshold for classification.
@@ -38,6 +56,28 @@ def abc_analysis(
         Provides DataFrame with columns primary_dimension, secondary_dimension, numeric_dimension and class
         in originally provided naming.
 
+    n_jobs : int = None
+        Number of processes the classification runs on. The input is partitioned by secondary
+        dimension and every partition is classified in its own process; the partitions are
+        serialized as Arrow IPC buffers, which are pickled to the processes as raw bytes. -1 uses
+        all CPU cores, None or 1 runs in the calling process. Without secondary dimensions, or with
+        a single secondary dimension value, there is one partition only and the classification
+        runs in the calling process as well.
+
+    filters : list of tuples = None
+        Filters of the input rows, e.g. [("country", "in", ["DE", "FR"])]. A parquet input reads
+        only the matching row groups and rows. See ``pyarrow.parquet.read_table``.
+
+    backend : {"pandas", "polars"} = "pandas"
+        "polars" runs the classification as one multi-threaded lazy polars query and returns a
+        polars.DataFrame with the same columns and classes. The input may then also be a polars
+        DataFrame or LazyFrame or a pyarrow Table. n_jobs is not used. Requires polars.
+
+    passthrough_dimensions : list of strings = None
+        Columns names in input DataFrame holding attributes of primary_dimension, e.g. a product
+        description, added to the output with their first value per primary- & secondary dimensions.
+        All other columns are left out before the aggregation.
+
     Returns
     -------
     df_grouped : Pandas.DataFrame
@@ -64,28 +104,140 @@ def abc_analysis(
     """
     # assign input variables
     A, B = A, B
+    if n_jobs is not None and (n_jobs == 0 or n_jobs < -1):
+        raise ValueError("n_jobs expected: None, -1 or a positive integer")
+    multiple_measures = not isinstance(numeric_dimension, str)
+    measures = list(numeric_dimension) if multiple_measures else [numeric_dimension]
+
+    if backend == "polars":
+        if multiple_measures:
+            raise ValueError("A list of numeric dimensions requires the pandas backend")
+        return _abc_analysis_polars(
+            df,
+            primary_dimension,
+            numeric_dimension,
+            secondary_dimensions,
+            A,
+            B,
+            classified_only,
+            filters,
+            passthrough_dimensions,
+        )
+    elif backend != "pandas":
+        raise ValueError("Backend expected: pandas or polars")
+
+    key_columns = list(secondary_dimensions or []) + [primary_dimension]
+    passthrough_dimensions = list(passthrough_dimensions or [])
+
+    # read only the needed column chunks and row groups of a parquet input
+    if isinstance(df, (str, os.PathLike)):
+        df = pd.read_parquet(
+            df,
+            columns=[primary_dimension]
+            + measures
+            + list(secondary_dimensions or [])
+            + passthrough_dimensions,
+            filters=filters,
+        )
+    elif filters is not None:
+        df = _filter_frame(df, filters)
+
+    # aggregate the needed columns only and join the passthrough dimensions at the end
+    df_passthrough = None
+    if passthrough_dimensions:
+        df_passthrough = (
+            df[key_columns + passthrough_dimensions]
+            .groupby(key_columns, sort=False, dropna=False)
+            .first()
+            .reset_index()
+        )
+    df = df[[primary_dimension] + measures + list(secondary_dimensions or [])]
 
-    columns = {
-        primary_dimension: "primary_dimension",
-        numeric_dimension: "numeric_dimension",
-    }
+    if multiple_measures:
+        # numeric dimensions keep their names, they suffix the columns derived from them
+        columns = {primary_dimension: "primary_dimension"}
+        class_columns = ["Class_" + measure for measure in measures]
+    else:
+        columns = {
+            primary_dimension: "primary_dimension",
+            numeric_dimension: "numeric_dimension",
+        }
+        class_columns = ["Class"]
+        measures = None
     df = df.rename(columns=columns)
 
     if secondary_dimensions is None:
-        df["secondary_dimension"] = "No secondary dimension provided"
-    #         secondary_dimensions=["X"]
-    #         return multi_dim_abc_analysis(df=df,master_dimension=master_dimension,secondary_dimensions="X",numeric_dimension=numeric_dimension)
+        df_secondary = None
+        df["secondary_dimension"] = np.zeros(len(df), dtype=np.int32)
+        secondary_labels = np.array(["No secondary dimension provided"])
     else:
-        # aggregate secondary dimensions into one key column
-        df["secondary_dimension"] = df[secondary_dimensions].agg("-".join, axis=1)
+        # encode secondary dimensions into one integer key column
+        df["secondary_dimension"], df_secondary = _encode_keys(df, secondary_dimensions)
+        df = df.drop(columns=secondary_dimensions)
+        secondary_labels = _join_keys(df_secondary, sep="-")
 
-    # calculate cumsum for secondary dimension
-    df_subsum = (
-        df.groupby("secondary_dimension")
-        .sum()
-        .sort_values(by=(["secondary_dimension", "numeric_dimension"]), ascending=False)
-        .reset_index()
-    )
+    # classify per secondary dimension
+    if n_jobs is None or n_jobs == 1:
+        df_grouped = _classify_abc(df, A, B, measures)
+    else:
+        df_grouped = _classify_abc_parallel(df, A, B, n_jobs, measures)
+
+    # decode secondary dimension to provided names
+    if df_secondary is not None:
+        df_grouped[secondary_dimensions] = _decode_keys(
+            df_grouped["secondary_dimension"], df_secondary, index=df_grouped.index
+        )
+    df_grouped["secondary_dimension"] = secondary_labels[df_grouped["secondary_dimension"]]
+
+    # move classes behind the decoded secondary dimensions
+    for class_column in class_columns:
+        df_grouped[class_column] = df_grouped.pop(class_column)
+
+    # rename columns back to provided names
+    columns_input = dict((v, k) for k, v in columns.items())
+    df_grouped = df_grouped.rename(columns=columns_input)
+
+    if df_passthrough is not None:
+        df_grouped = df_grouped.merge(df_passthrough, on=key_columns, how="left")
+
+    # clean output before return
+    if classified_only:
+        df_grouped = df_grouped.drop(
+            columns=[
+                column + suffix
+                for suffix in (["_" + measure for measure in measures] if multiple_measures else [""])
+                for column in ["Cumsum_Sec_Dim", "Relative_Quantity", "Cumsum_Relative_Quantity"]
+            ]
+            + ["secondary_dimension"]
+        )
+
+    return df_grouped
+
+
+def _classify_abc(df, A, B, measures=None):
+    """Classifies an input DataFrame with renamed and encoded dimensions
+
+    Parameters
+    ----------
+    df : Pandas.DataFrame
+        DataFrame with the columns secondary_dimension (int codes), primary_dimension and
+        numeric_dimension.
+
+    A, B : float
+        Threshold for classification.
+
+    measures : list of strings = None
+        Column names of several numeric dimensions instead of numeric_dimension, see
+        ``_classify_abc_measures``.
+
+    Returns
+    -------
+    df_grouped : Pandas.DataFrame
+        DataFrame grouped by secondary_dimension & primary_dimension with respective
+        classification and cumulative values.
+    """
+    if measures is not None:
+        return _classify_abc_measures(df, measures, A, B)
 
     # create return DataFrame in target grouping
     df_grouped = (
@@ -95,12 +247,12 @@ def abc_analysis(
         .reset_index()
     )
 
-    # prepare DataFrame to calculate relative quantity
-    dict_subsum = {k: list(v.values()) for k, v in df_subsum.to_dict("index").items()}
-    for i in range(len(df_grouped["secondary_dimension"].unique())):
-        df_grouped.loc[
-            df_grouped["secondary_dimension"] == dict_subsum.get(i)[0], "Cumsum_Sec_Dim"
-        ] = dict_subsum.get(i)[1]
+    # calculate total quantity per secondary dimension
+    df_grouped["Cumsum_Sec_Dim"] = (
+        df_grouped.groupby("secondary_dimension")["numeric_dimension"]
+        .transform("sum")
+        .astype(float)
+    )
 
     # calculate relative quantity
     df_grouped["Relative_Quantity"] = (
@@ -125,28 +277,460 @@ def abc_analysis(
     ]
     class_values = ["A", "B", "C"]
 
-    # disagg secondary dimension to provided names
-    df_grouped[secondary_dimensions] = df_grouped["secondary_dimension"].str.split(
-        "-", expand=True
-    )
-
     # assign classes
     df_grouped["Class"] = np.select(class_thresholds, class_values)
 
-    # rename columns back to provided names
-    columns_input = dict((v, k) for k, v in columns.items())
-    df_grouped = df_grouped.rename(columns=columns_input)
+    return df_grouped
+
+
+def _classify_abc_measures(df, measures, A, B):
+    """Classifies an input DataFrame with renamed and encoded dimensions by several numeric dimensions
+
+    All numeric dimensions are aggregated in one groupby. The rows are sorted per numeric dimension
+    within their secondary dimension, the sorted relative quantities of all numeric dimensions are
+    accumulated in one segmented cumsum and scattered back.
+
+    Parameters
+    ----------
+    df : Pandas.DataFrame
+        DataFrame with the columns secondary_dimension (int codes), primary_dimension and the
+        numeric dimensions.
+
+    measures : list of strings
+        Column names of the numeric dimensions.
+
+    A, B : float
+        Threshold for classification.
+
+    Returns
+    -------
+    df_grouped : Pandas.DataFrame
+        DataFrame grouped by secondary_dimension & primary_dimension with the columns Cumsum_Sec_Dim,
+        Relative_Quantity, Cumsum_Relative_Quantity and Class per numeric dimension, suffixed with its
+        name. Rows are ordered as by ``_classify_abc`` for the first numeric dimension.
+    """
+    # aggregate all numeric dimensions at once, rows in order of secondary & primary dimension
+    df_grouped = df.groupby(["secondary_dimension", "primary_dimension"]).sum().reset_index()
+    groups = df_grouped["secondary_dimension"].to_numpy()
+    values = df_grouped[measures].to_numpy(dtype=float)
+
+    # total and relative quantity per secondary dimension, (rows x numeric dimensions)
+    totals = df_grouped[measures].groupby(groups).transform("sum").to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        relative = values / totals
+
+    # descending quantities per secondary dimension and numeric dimension, ties in order of the
+    # primary dimension; the secondary dimensions stay in place so that one segmented cumsum
+    # accumulates all numeric dimensions
+    orders = np.column_stack([np.lexsort((-values[:, i], groups)) for i in range(len(measures))])
+    cumsum_sorted = (
+        pd.DataFrame(np.take_along_axis(relative, orders, axis=0)).groupby(groups).cumsum().to_numpy()
+    )
+    cumsum = np.empty_like(cumsum_sorted)
+    np.put_along_axis(cumsum, orders, cumsum_sorted, axis=0)
+
+    # prepare ABC classification thresholds and classes
+    class_thresholds = [
+        (cumsum <= A),
+        ((cumsum > A) & (cumsum <= B)),
+        (cumsum > B),
+    ]
+    class_values = ["A", "B", "C"]
+    classes = np.select(class_thresholds, class_values)
+
+    columns = {}
+    for i, measure in enumerate(measures):
+        columns["Cumsum_Sec_Dim_" + measure] = totals[:, i]
+        columns["Relative_Quantity_" + measure] = relative[:, i]
+        columns["Cumsum_Relative_Quantity_" + measure] = cumsum[:, i]
+    columns.update({"Class_" + measure: classes[:, i] for i, measure in enumerate(measures)})
+    df_grouped = pd.concat([df_grouped, pd.DataFrame(columns, index=df_grouped.index)], axis=1)
+
+    return df_grouped.sort_values(
+        by=["secondary_dimension", measures[0]], ascending=False
+    ).reset_index(drop=True)
+
+
+def _classify_abc_parallel(df, A, B, n_jobs, measures=None):
+    """Classifies an input DataFrame on a process pool, partitioned by secondary dimension
+
+    Parameters
+    ----------
+    df, A, B, measures
+        See ``_classify_abc``.
+
+    n_jobs : int
+        Number of processes, -1 for all CPU cores.
+
+    Returns
+    -------
+    df_grouped : Pandas.DataFrame
+        Same result as ``_classify_abc``.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if n_jobs < 0:
+        n_jobs = os.cpu_count()
+
+    # hash partition by secondary dimension
+    partitions = df["secondary_dimension"].to_numpy() % n_jobs
+    partition_sizes = np.bincount(partitions, minlength=n_jobs)
+
+    # a single partition, e.g. without secondary dimensions, is not worth a process
+    if np.count_nonzero(partition_sizes) <= 1:
+        return _classify_abc(df, A, B, measures)
+
+    order = np.argsort(partitions, kind="stable")
+    bounds = np.cumsum(partition_sizes)
+    df = df.take(order)
+    buffers = [
+        _to_arrow_buffer(df.iloc[start:end])
+        for start, end in zip(np.append(0, bounds[:-1]), bounds)
+        if end > start
+    ]
+
+    with ProcessPoolExecutor(max_workers=min(n_jobs, len(buffers))) as executor:
+        results = list(
+            executor.map(
+                _classify_abc_buffer,
+                buffers,
+                [A] * len(buffers),
+                [B] * len(buffers),
+                [measures] * len(buffers),
+            )
+        )
+
+    # concatenate partitions in the order of the secondary dimension
+    df_grouped = pd.concat([_from_arrow_buffer(buffer) for buffer in results], ignore_index=True)
+    order = np.argsort(-df_grouped["secondary_dimension"].to_numpy(dtype=np.int64), kind="stable")
+
+    return df_grouped.take(order).reset_index(drop=True)
+
+
+def _classify_abc_buffer(buffer, A, B, measures=None):
+    """Classifies a partition passed as Arrow IPC buffer, runs in a worker process"""
+    return _to_arrow_buffer(_classify_abc(_from_arrow_buffer(buffer), A, B, measures))
+
+
+def _to_arrow_buffer(df):
+    """Serializes a DataFrame into an Arrow IPC stream buffer"""
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def _from_arrow_buffer(buffer):
+    """Deserializes a DataFrame from an Arrow IPC stream buffer"""
+    import pyarrow as pa
+
+    return pa.ipc.open_stream(buffer).read_all().to_pandas()
+
+
+def abc_analysis_parquet(
+    path,
+    primary_dimension,
+    numeric_dimension,
+    secondary_dimensions=None,
+    A=0.8,
+    B=0.95,
+    classified_only=False,
+    batch_size=1_000_000,
+):
+    """
+    Multi-Dimensional ABC Analysis for parquet datasets which do not fit into memory.
+
+    The dataset is streamed in record batches and only the columns needed for the classification
+    are read. Every batch is aggregated per primary- & secondary dimensions and merged into a
+    running aggregate, so the peak memory depends on the number of distinct keys rather than the
+    number of rows. The classification itself runs on the aggregated table with ``abc_analysis``.
+    Numeric dimensions stored as strings, as written by ``read_and_write`` without a schema, are
+    converted to float batch by batch.
+
+    Parameters
+    ----------
+    path : str or path object
+        Parquet file or folder of parquet files, e.g. as written by ``read_and_write``.
+
+    primary_dimension, numeric_dimension, secondary_dimensions, A, B, classified_only
+        See ``abc_analysis``.
+
+    batch_size : int = 1_000_000
+        Maximum number of rows read into memory at once.
+
+    Returns
+    -------
+    df_grouped : Pandas.DataFrame
+        See ``abc_analysis``.
+
+    Examples
+    --------
+    >>> import aio
+    >>> results = aio.abc_analysis_parquet(
+    >>>     "py_transactions.parquet",
+    >>>     primary_dimension="Product",
+    >>>     secondary_dimensions=["Country"],
+    >>>     numeric_dimension="Quantity",
+    >>> )
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    key_columns = [primary_dimension] + list(secondary_dimensions or [])
+    measures = [numeric_dimension] if isinstance(numeric_dimension, str) else list(numeric_dimension)
+
+    dataset = ds.dataset(str(path), format="parquet", exclude_invalid_files=True)
+
+    # aggregate batch by batch and merge the partial sums once they outgrow a batch
+    aggregated, partials, num_partial_rows = None, [], 0
+    for batch in dataset.to_batches(
+        columns=key_columns + measures, batch_size=batch_size
+    ):
+        table = _cast_measures(pa.Table.from_batches([batch]), measures)
+        partials.append(_sum_by_keys(table, key_columns, measures))
+        num_partial_rows += partials[-1].num_rows
+        if num_partial_rows > batch_size:
+            aggregated = _merge_sums(aggregated, partials, key_columns, measures)
+            partials, num_partial_rows = [], 0
+    aggregated = _merge_sums(aggregated, partials, key_columns, measures)
+
+    if aggregated is None:
+        aggregated = _cast_measures(dataset.schema.empty_table().select(key_columns + measures), measures)
+
+    return abc_analysis(
+        aggregated.to_pandas(),
+        primary_dimension=primary_dimension,
+        numeric_dimension=numeric_dimension,
+        secondary_dimensions=secondary_dimensions,
+        A=A,
+        B=B,
+        classified_only=classified_only,
+    )
+
+
+def _cast_measures(table, numeric_dimensions):
+    """Casts numeric dimensions stored as strings in an Arrow table to float64
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+        Table holding the numeric columns.
+
+    numeric_dimensions : list of strings
+        Column names of the values to be summed.
+
+    Returns
+    -------
+    table : pyarrow.Table
+        Table with the numeric dimensions as numbers.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    for numeric_dimension in numeric_dimensions:
+        index = table.schema.get_field_index(numeric_dimension)
+        if not pa.types.is_string(table.schema.field(index).type) and not pa.types.is_large_string(
+            table.schema.field(index).type
+        ):
+            continue
+        try:
+            column = pc.cast(table.column(index), pa.float64())
+        except pa.ArrowInvalid as e:
+            raise ValueError(
+                "Column {} holds values which are not numeric, convert it first, e.g. with "
+                'read_and_write(..., schema="infer")'.format(numeric_dimension)
+            ) from e
+        table = table.set_column(index, numeric_dimension, column)
+    return table
+
+
+def _sum_by_keys(table, key_columns, numeric_dimensions):
+    """Sums the numeric columns of an Arrow table per key
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+        Table holding the key columns and the numeric columns.
+
+    key_columns : list of strings
+        Column names to group by.
+
+    numeric_dimensions : list of strings
+        Column names of the values to be summed.
+
+    Returns
+    -------
+    table : pyarrow.Table
+        Table with one row per key holding the key columns and the summed numeric columns.
+    """
+    aggregated = table.group_by(key_columns).aggregate([(c, "sum") for c in numeric_dimensions])
+    sums = {c + "_sum": c for c in numeric_dimensions}
+    return aggregated.rename_columns(
+        [sums.get(c, c) for c in aggregated.column_names]
+    ).select(key_columns + numeric_dimensions)
+
+
+def _merge_sums(aggregated, partials, key_columns, numeric_dimensions):
+    """Merges partial sums per key into the running aggregate
+
+    Parameters
+    ----------
+    aggregated : pyarrow.Table or None
+        Running aggregate as returned by ``_sum_by_keys``.
+
+    partials : list of pyarrow.Table
+        Partial sums as returned by ``_sum_by_keys``.
+
+    key_columns, numeric_dimensions
+        See ``_sum_by_keys``.
+
+    Returns
+    -------
+    aggregated : pyarrow.Table or None
+        Updated running aggregate, None if there is nothing to aggregate yet.
+    """
+    import pyarrow as pa
+
+    tables = ([aggregated] if aggregated is not None else []) + partials
+    if not tables:
+        return aggregated
+    return _sum_by_keys(pa.concat_tables(tables), key_columns, numeric_dimensions)
+
+
+def abc_analysis_sweep(
+    df,
+    primary_dimension,
+    numeric_dimension,
+    thresholds,
+    secondary_dimensions=None,
+    output="long",
+    classified_only=False,
+    n_jobs=None,
+    filters=None,
+    passthrough_dimensions=None,
+):
+    """
+    Multi-Dimensional ABC Analysis for many A/B thresholds at once.
+
+    The input is grouped, sorted and accumulated once as in ``abc_analysis``; only the classification
+    is repeated for every scenario, as one vectorized comparison of the cumulative relative quantities
+    with all thresholds. The cost is about that of a single ``abc_analysis``.
+
+    Parameters
+    ----------
+    df, primary_dimension, numeric_dimension, secondary_dimensions, classified_only, n_jobs, filters, passthrough_dimensions
+        See ``abc_analysis``.
+
+    thresholds : list of tuples
+        A, B thresholds of every scenario, e.g. [(0.7, 0.9), (0.8, 0.95)].
+
+    output : {"long", "wide"} = "long"
+        "long" returns the rows of ``abc_analysis`` once per scenario with the columns A, B and Class.
+        "wide" returns them once with one column Class_<A>_<B> per scenario. With a list of numeric
+        dimensions the class columns are Class_<numeric dimension> and
+        Class_<numeric dimension>_<A>_<B>.
+
+    Returns
+    -------
+    df_grouped : Pandas.DataFrame
+        input DataFrame grouped by provided primary- & secondary dimensions with the classes of all
+        scenarios and cumulative values.
+
+    Examples
+    --------
+    >>> import aio
+    >>> results = aio.abc_analysis_sweep(
+    >>>     df,
+    >>>     primary_dimension="Product",
+    >>>     numeric_dimension="Quantity",
+    >>>     thresholds=[(a, b) for a in (0.6, 0.7, 0.8) for b in (0.9, 0.95)],
+    >>> )
+    """
+    thresholds = np.asarray(thresholds, dtype=float).reshape(-1, 2)
+    if output not in ("long", "wide"):
+        raise ValueError("Output expected: long or wide")
+    # columns derived from every numeric dimension are suffixed with its name for a list
+    if isinstance(numeric_dimension, str):
+        suffixes = [""]
+    else:
+        suffixes = ["_" + measure for measure in numeric_dimension]
+
+    df_grouped = abc_analysis(
+        df,
+        primary_dimension=primary_dimension,
+        numeric_dimension=numeric_dimension,
+        secondary_dimensions=secondary_dimensions,
+        n_jobs=n_jobs,
+        filters=filters,
+        passthrough_dimensions=passthrough_dimensions,
+    ).drop(columns=["Class" + suffix for suffix in suffixes])
+
+    # classify all scenarios at once, (rows x scenarios) per numeric dimension
+    classes = [
+        _classify_thresholds(
+            df_grouped["Cumsum_Relative_Quantity" + suffix].to_numpy(), thresholds[:, 0], thresholds[:, 1]
+        )
+        for suffix in suffixes
+    ]
 
-    # clean output before return
     if classified_only:
         df_grouped = df_grouped.drop(
             columns=[
-                "Cumsum_Relative_Quantity",
-                "Relative_Quantity",
-                "Cumsum_Sec_Dim",
-                "Cumsum_Relative_Quantity",
-                "secondary_dimension",
+                column + suffix
+                for suffix in suffixes
+                for column in ["Relative_Quantity", "Cumsum_Sec_Dim", "Cumsum_Relative_Quantity"]
             ]
+            + ["secondary_dimension"]
         )
 
-    return df_grouped
+    if output == "wide":
+        df_classes = pd.concat(
+            [
+                pd.DataFrame(
+                    measure_classes,
+                    columns=["Class{}_{:g}_{:g}".format(suffix, A, B) for A, B in thresholds],
+                    index=df_grouped.index,
+                )
+                for suffix, measure_classes in zip(suffixes, classes)
+            ],
+            axis=1,
+        )
+        return pd.concat([df_grouped, df_classes], axis=1)
+
+    num_rows, num_scenarios = classes[0].shape
+    df_long = df_grouped.iloc[np.tile(np.arange(num_rows), num_scenarios)].reset_index(drop=True)
+    df_long["A"] = np.repeat(thresholds[:, 0], num_rows)
+    df_long["B"] = np.repeat(thresholds[:, 1], num_rows)
+    for suffix, measure_classes in zip(suffixes, classes):
+        df_long["Class" + suffix] = measure_classes.T.ravel()
+
+    return df_long
+
+
+def _classify_thresholds(cumsum_relative_quantity, A, B):
+    """Classifies cumulative relative quantities for many thresholds like ``_classify_abc``
+
+    Parameters
+    ----------
+    cumsum_relative_quantity : numpy.ndarray of float
+        Cumulative relative quantity of every row.
+
+    A, B : numpy.ndarray of float
+        Thresholds of every scenario.
+
+    Returns
+    -------
+    classes : numpy.ndarray of str
+        Class of every row (rows) and scenario (columns), "0" for rows without a cumulative
+        relative quantity.
+    """
+    cumsum_relative_quantity = cumsum_relative_quantity[:, np.newaxis]
+    class_codes = np.where(
+        cumsum_relative_quantity <= A, 0, np.where(cumsum_relative_quantity <= B, 1, 2)
+    )
+    class_codes[np.isnan(cumsum_relative_quantity[:, 0])] = 3
+
+    return np.array(["A", "B", "C", "0"])[class_codes]
@@ -0,0 +1,174 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from .key_encoding import _encode_keys, _decode_keys
+from .read_and_write import _filter_frame
+from .xyz_analysis import _period_offsets, _period_matrix, _dense_statistics, _classify_xyz
+
+
+def abc_xyz_analysis(
+    df,
+    primary_dimension_keys,
+    relevant_numeric_dimension,
+    relevant_date_dimension,
+    start_date,
+    periods,
+    frequency,
+    secondary_dimensions=None,
+    A=0.8,
+    B=0.95,
+    X=0.5,
+    Y=1,
+    L=0.4,
+    M=0.7,
+    filters=None,
+):
+    """The ABC-XYZ Analysis combines the ABC value classification and the XYZ variability & frequency
+    classification of a granular time series input dataset into one matrix class per key.
+
+    The input is scanned once: the keys are encoded and the records are pivoted into one (keys x periods)
+    array. The totals of the periods give the ABC value share, the same array gives the XYZ statistics.
+    The results equal those of ``abc_analysis`` on the records within the period range and of
+    ``xyz_analysis`` with method "dense".
+
+    Parameters
+    ----------
+    df : Pandas.DataFrame or path
+        DataFrame holding the objects to be classified, numeric values and dates, e.g.
+        df.columns = ["product", "country", "date", "quantity"]. A path to a parquet file or folder is read
+        with the needed columns only.
+
+    primary_dimension_keys : string or list of strings
+        Column name(s) in the input DataFrame holding the object(s) to be classified, e.g. product, country.
+
+    relevant_numeric_dimension : string
+        Column name in the input DataFrame holding numeric values to be used for classification. Unlike
+        ``abc_analysis``, a single column only.
+
+    relevant_date_dimension : string
+        Column in the input DataFrame holding the dates to the relevant_numeric_dimension values.
+
+    start_date, periods, frequency
+        Period range of the classification, see ``xyz_analysis``.
+
+    secondary_dimensions : list of strings = None
+        Subset of primary_dimension_keys the ABC classification is structured by, e.g. country to classify
+        the products of every country. None classifies all keys together.
+
+    A, B : float = 0.8, 0.95
+        Threshold for ABC classification, see ``abc_analysis``.
+
+    X, Y, L, M : float = 0.5, 1, 0.4, 0.7
+        Threshold for XYZ & frequency classification, see ``xyz_analysis``.
+
+    filters : list of tuples = None
+        Filters of the input rows, e.g. [("country", "in", ["DE", "FR"])]. A parquet input reads
+        only the matching row groups and rows. See ``pyarrow.parquet.read_table``.
+
+    Returns
+    -------
+    df_return : Pandas.DataFrame
+        One row per key with the total of the relevant_numeric_dimension, the ABC columns
+        Relative_Quantity, Cumsum_Relative_Quantity and ABC_Class, the XYZ columns of ``xyz_analysis``
+        and ABC_XYZ_Class, e.g. "AX" or "CN", sorted by the keys. Every key is in one of the 9 cells
+        AX to CZ or without demand in AN, BN or CN: unlike ``xyz_analysis``, constant demand
+        (Coefficient_of_Variation 0) is X, and unlike ``abc_analysis``, keys of a secondary dimension
+        without total are C.
+
+    Examples
+    --------
+    >>> import aio
+    >>> df_return = aio.abc_xyz_analysis(
+    >>>     df,
+    >>>     primary_dimension_keys=["Material", "Country"],
+    >>>     relevant_numeric_dimension="Quantity",
+    >>>     relevant_date_dimension="Date",
+    >>>     start_date="2020-01-01",
+    >>>     periods=12,
+    >>>     frequency="M",
+    >>>     secondary_dimensions=["Country"],
+    >>> )
+    >>> df_return.groupby(["ABC_Class", "XYZ_Class"]).size().unstack()
+    """
+    if not isinstance(relevant_numeric_dimension, str):
+        raise ValueError("relevant_numeric_dimension expected as a single column name")
+    key_columns = [primary_dimension_keys] if isinstance(primary_dimension_keys, str) else list(primary_dimension_keys)
+    secondary_dimensions = list(secondary_dimensions or [])
+    if not set(secondary_dimensions) <= set(key_columns):
+        raise ValueError("secondary_dimensions expected as a subset of primary_dimension_keys")
+    columns = key_columns + [relevant_numeric_dimension, relevant_date_dimension]
+
+    # read only the needed column chunks and row groups of a parquet input
+    if isinstance(df, (str, os.PathLike)):
+        df = pd.read_parquet(df, columns=columns, filters=filters)
+    elif filters is not None:
+        df = _filter_frame(df, filters)
+
+    # encode the keys and pivot the records once
+    codes, df_keys = _encode_keys(df, key_columns)
+    offsets = _period_offsets(df[relevant_date_dimension], start_date, periods, frequency)
+    matrix = _period_matrix(codes, offsets, df[relevant_numeric_dimension], len(df_keys), periods)
+
+    # XYZ statistics from the (keys x periods) array
+    df_return = _dense_statistics(matrix)
+
+    # ABC value share from the totals of the periods
+    if secondary_dimensions:
+        groups, _ = _encode_keys(df_keys, secondary_dimensions)
+    else:
+        groups = np.zeros(len(df_keys), dtype=np.int32)
+    df_abc = _classify_abc_totals(matrix.sum(axis=1), groups, A, B)
+
+    df_return = _classify_xyz(df_return, periods, X, Y, L, M)
+    df_return.loc[df_return["Coefficient_of_Variation"] == 0, "XYZ_Class"] = "X"
+    df_return.insert(0, relevant_numeric_dimension, df_abc["Total"])
+    df_return.insert(1, "Relative_Quantity", df_abc["Relative_Quantity"])
+    df_return.insert(2, "Cumsum_Relative_Quantity", df_abc["Cumsum_Relative_Quantity"])
+    df_return.insert(3, "ABC_Class", df_abc["ABC_Class"])
+    df_return["ABC_XYZ_Class"] = df_return["ABC_Class"] + df_return["XYZ_Class"]
+
+    # bring back inputed dimensions names for better understandable output
+    df_return[df_keys.columns.tolist()] = _decode_keys(df_return["key"], df_keys, index=df_return.index)
+    df_return = df_return.drop(columns="key")
+
+    return df_return
+
+
+def _classify_abc_totals(totals, groups, A, B):
+    """Classifies keys by their share of the total of their group like ``abc_analysis``
+
+    Parameters
+    ----------
+    totals : numpy.ndarray of float
+        Total of every key.
+
+    groups : numpy.ndarray of int
+        Group (secondary dimension) of every key.
+
+    A, B : float
+        Threshold for classification.
+
+    Returns
+    -------
+    df_abc : Pandas.DataFrame
+        Columns Total, Relative_Quantity, Cumsum_Relative_Quantity and ABC_Class in key order. Keys
+        of a group without total are C.
+    """
+    # descending totals per group, ties in key order
+    order = np.lexsort((np.arange(len(totals)), -totals, groups))
+
+    df_abc = pd.DataFrame({"group": groups[order], "Total": totals[order]}, index=order)
+    group_totals = df_abc.groupby("group")["Total"].transform("sum")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        df_abc["Relative_Quantity"] = df_abc["Total"] / group_totals
+    df_abc["Cumsum_Relative_Quantity"] = df_abc.groupby("group")["Relative_Quantity"].cumsum()
+
+    class_thresholds = [
+        (df_abc["Cumsum_Relative_Quantity"] <= A),
+        ((df_abc["Cumsum_Relative_Quantity"] > A) & (df_abc["Cumsum_Relative_Quantity"] <= B)),
+    ]
+    df_abc["ABC_Class"] = np.select(class_thresholds, ["A", "B"], default="C")
+
+    return df_abc.sort_index()
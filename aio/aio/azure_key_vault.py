@@ -1,24 +1,43 @@
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import aio
 
 dbutils = None
 
+# secrets by (scope, key) as (value, expiry time), see vault_get_secret
+_secret_cache = {}
+# events of the secrets being fetched by (scope, key), callers of the same secret wait for one fetch
+_secret_fetches = {}
+# invalidations by (scope, key), a fetch started before an invalidation is not cached
+_secret_generations = {}
+# (credential, client) by vault url
+_secret_clients = {}
+_lock = threading.Lock()
+
 
 def vault_get_secret(
     scope: str,
     key: str,
     databricks=None,
+    ttl: float = 300,
 ) -> str:
     """Get a secret from an Azure Key Vault
 
     This function takes a secret by using either Databricks ``dbutils`` or Azure Python API libraries
 
+    Secrets from Databricks and Azure Key Vault are cached in the process for ``ttl`` seconds. Concurrent
+    calls for the same secret wait for one request. The Azure credential and client are reused per vault.
+
     Parameters
     ----------
     scope : str
         The scope used to get the key. If the function is running on Databricks, it is a Databricks Secret Scope, otherwise it is an Azure Key Vault name.
     key : str
         The name of the secret in a Databricks Secret Scope or Azure Key Vault
+    ttl : float
+        Seconds a secret is taken from the cache, 0 always gets the secret from the vault
 
 
     Returns
@@ -28,18 +47,140 @@ def vault_get_secret(
     """
 
     if aio._is_running_on_databricks():
-        return dbutils.secrets.get(scope=scope, key=key)
+        return _cached_secret(scope, key, ttl, lambda: dbutils.secrets.get(scope=scope, key=key))
     elif aio._is_running_on_devops_pipeline():
         key_right_format = key.upper().replace("-", "_")
         return os.environ[key_right_format]
     else:
-        from azure.keyvault.secrets import SecretClient
-        from azure.identity import AzureCliCredential
-
-        credential = AzureCliCredential()
         vault_url = f"https://{scope}.vault.azure.net/"
-        client = SecretClient(vault_url=vault_url, credential=credential)
-        return client.get_secret(key).value
+        return _cached_secret(scope, key, ttl, lambda: _secret_client(vault_url).get_secret(key).value)
+
+
+def vault_get_secrets(
+    scope: str,
+    keys: list,
+    ttl: float = 300,
+    max_workers: int = None,
+) -> dict:
+    """Get several secrets from an Azure Key Vault in parallel
+
+    The secrets are taken like in ``vault_get_secret``. On Databricks and with the Azure Python API libraries,
+    they are fetched concurrently by a thread pool, so the time is bounded by the slowest secret.
+
+    Parameters
+    ----------
+    scope : str
+        The scope used to get the keys. If the function is running on Databricks, it is a Databricks Secret Scope, otherwise it is an Azure Key Vault name.
+    keys : list of str
+        The names of the secrets in a Databricks Secret Scope or Azure Key Vault
+    ttl : float
+        Seconds a secret is taken from the cache, 0 always gets the secrets from the vault
+    max_workers : int
+        Number of secrets fetched at the same time, by default all up to 32
+
+    Returns
+    -------
+    dict
+        Returns the secrets as strings by key
+    """
+    keys = list(keys)
+    if not keys:
+        return {}
+
+    if aio._is_running_on_databricks() or not aio._is_running_on_devops_pipeline():
+        with ThreadPoolExecutor(max_workers=max_workers or min(32, len(keys))) as executor:
+            secrets = list(executor.map(lambda key: vault_get_secret(scope, key, ttl=ttl), keys))
+    else:
+        secrets = [vault_get_secret(scope, key) for key in keys]
+    return dict(zip(keys, secrets))
+
+
+def vault_invalidate_secret(scope: str = None, key: str = None):
+    """Removes secrets from the cache of ``vault_get_secret``
+
+    Parameters
+    ----------
+    scope : str
+        The scope of the secrets to remove, all scopes if None
+    key : str
+        The name of the secret to remove, all secrets of the scope if None
+    """
+    with _lock:
+        for cache_key in list(_secret_cache):
+            if (scope is None or cache_key[0] == scope) and (key is None or cache_key[1] == key):
+                del _secret_cache[cache_key]
+        for cache_key in _secret_fetches:
+            if (scope is None or cache_key[0] == scope) and (key is None or cache_key[1] == key):
+                _secret_generations[cache_key] = _secret_generations.get(cache_key, 0) + 1
+
+
+def _cached_secret(scope: str, key: str, ttl: float, fetch) -> str:
+    """Returns a cached secret or fetches it once for all concurrent callers
+
+    Parameters
+    ----------
+    scope, key, ttl
+        See ``vault_get_secret``
+    fetch
+        Function without arguments returning the secret from the vault
+
+    Returns
+    -------
+    str
+        Returns the secret as a string
+    """
+    if not ttl or ttl <= 0:
+        return fetch()
+
+    cache_key = (scope, key)
+    while True:
+        with _lock:
+            cached = _secret_cache.get(cache_key)
+            if cached is not None and cached[1] > time.monotonic():
+                return cached[0]
+            fetching = _secret_fetches.get(cache_key)
+            if fetching is None:
+                fetching = _secret_fetches[cache_key] = threading.Event()
+                generation = _secret_generations.get(cache_key, 0)
+                break
+        # another caller fetches the secret, take it from the cache afterwards or fetch it
+        # if that call failed
+        fetching.wait()
+
+    try:
+        value = fetch()
+        with _lock:
+            # keep an invalidation during the fetch, the value may be stale
+            if _secret_generations.get(cache_key, 0) == generation:
+                _secret_cache[cache_key] = (value, time.monotonic() + ttl)
+        return value
+    finally:
+        with _lock:
+            del _secret_fetches[cache_key]
+            _secret_generations.pop(cache_key, None)
+        fetching.set()
+
+
+def _secret_client(vault_url: str):
+    """Returns the Azure Key Vault client of a vault, created once per vault url
+
+    Parameters
+    ----------
+    vault_url : str
+        The url of the Azure Key Vault
+    """
+    with _lock:
+        if vault_url in _secret_clients:
+            return _secret_clients[vault_url][1]
+
+    # create the client outside of the lock, the first one published is used by all callers
+    from azure.keyvault.secrets import SecretClient
+    from azure.identity import AzureCliCredential
+
+    credential = AzureCliCredential()
+    client = SecretClient(vault_url=vault_url, credential=credential)
+    with _lock:
+        return _secret_clients.setdefault(vault_url, (credential, client))[1]
 
 
 def _vault_set_dbutils(dbutils_var: str):
@@ -57,6 +198,59 @@ def _vault_set_dbutils(dbutils_var: str):
     dbutils = dbutils_var
 
 
+def _vault_set_client(scope: str, client):
+    """Sets the client used to get the secrets of an Azure Key Vault
+
+    Parameters
+    ----------
+        scope
+            Azure Key Vault name
+        client
+            Object with a ``get_secret(name)`` method like ``azure.keyvault.secrets.SecretClient`` or
+            ``_LocalSecretClient``, None to use the Azure client again
+
+    This function allows to get secrets without the Azure Python API libraries, e.g. in tests.
+    """
+    vault_url = f"https://{scope}.vault.azure.net/"
+    with _lock:
+        if client is None:
+            _secret_clients.pop(vault_url, None)
+        else:
+            _secret_clients[vault_url] = (None, client)
+
+
+class _LocalSecret:
+    """Secret returned by ``_LocalSecretClient`` with the ``value`` like ``azure.keyvault.secrets.KeyVaultSecret``"""
+
+    def __init__(self, name: str, value: str):
+        self.name = name
+        self.value = value
+
+
+class _LocalSecretClient:
+    """Stand-in for ``azure.keyvault.secrets.SecretClient`` holding the secrets in memory
+
+    Parameters
+    ----------
+        secrets
+            Secrets as strings by name
+        delay
+            Seconds every ``get_secret`` call takes, to simulate the network round trip
+    """
+
+    def __init__(self, secrets: dict, delay: float = 0):
+        self.secrets = dict(secrets)
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get_secret(self, name: str) -> _LocalSecret:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return _LocalSecret(name, self.secrets[name])
+
+
 def _is_running_on_devops_pipeline():
     """Tests if a script is running on an Azure DevOps pipeline
 
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 import datetime
+from functools import lru_cache
 from scipy.stats import norm, uniform, poisson
 
 
@@ -25,6 +26,10 @@ def create_time_series(
     num_periods : int = 365
         number of increments the time series must be created for
 
+    periodicity : str = "D"
+        D | day, W | week, M | month, Q | quarter or Y | year, the Date column holds periods
+        of this frequency as used by ``xyz_analysis``
+
     start_date : str = "2020-01-01"
         reference start date | format yyyy-mm-dd
 
@@ -75,20 +80,154 @@ def create_time_series(
         quantity = np.round(poisson.rvs(p_mean, size=num_periods))
     else:
         raise Exception("Distribution expected: const, normal, uniform or poisson")
-    try:
-        base_date = datetime.date.fromisoformat(start_date)
-    except:
-        raise Exception("Date format expected: yyyy-mm-dd")
+    dates = _period_index(start_date, num_periods, periodicity)
 
     df["Quantity"] = quantity
 
     df.loc[df["Quantity"].sample(frac=intermittency).index] = 0
 
-    df["Date"] = pd.date_range(base_date, periods=num_periods, freq="D")
+    df["Date"] = dates
 
     df["Value"] = df["Quantity"] * standard_price
 
     df["KEY"] = actual_material_number
     df["Material"] = actual_material_number
 
-    return df
\ No newline at end of file
+    return df
+
+
+def create_time_series_batch(
+    num_materials=100,
+    distribution="uniform",
+    p_mean=10,
+    p_std=1,
+    num_periods=365,
+    periodicity="D",
+    start_date="2020-01-01",
+    material_numbers=None,
+    standard_price=1,
+    intermittency=0,
+    random_state=None,
+    output="pandas",
+):
+    """Creates time series with a given distribution for many materials at once
+
+    All quantities are drawn in one call as a (num_materials x num_periods) array and
+    returned as one DataFrame in long format with the columns of ``create_time_series``.
+
+    Parameters
+    ----------
+    num_materials : int = 100
+        number of materials the time series must be created for
+
+    distribution : str = "uniform"
+        const | p_mean, normal | p_mean, p_std, uniform | p_mean, p_std or poisson | p_mean
+
+    num_periods : int = 365
+        number of increments every time series must be created for
+
+    periodicity : str = "D"
+        D | day, W | week, M | month, Q | quarter or Y | year, the Date column holds periods
+        of this frequency as used by ``xyz_analysis``
+
+    start_date : str = "2020-01-01"
+        reference start date | format yyyy-mm-dd
+
+    material_numbers : list of str = None
+        material identifier of every time series, default Mat-ID-generated-<number>
+
+    standard_price : int = 1
+        any float/integer value as price of 1 quantity unit
+
+    intermittency : float = 0.0
+        percentage of quantity data points = 0 per material | range 0 to 1, format e.g. 0.4 ~ 40 %
+
+    random_state : int or numpy.random.Generator = None
+        seed or generator to get reproducible time series
+
+    output : str = "pandas"
+        pandas | Pandas.DataFrame or arrow | pyarrow.Table
+
+    Examples
+    --------
+    >>> df = aio.create_time_series_batch(
+    >>>     num_materials=100,
+    >>>     distribution="normal",
+    >>>     p_mean=1000,
+    >>>     p_std=300,
+    >>>     num_periods=12,
+    >>>     start_date="2020-01-01",
+    >>>     intermittency=0.2,
+    >>>     random_state=42,
+    >>> )
+    >>> df.head()
+    """
+    rng = _random_state(random_state)
+    size = (num_materials, num_periods)
+
+    if distribution == "const":  # constant
+        quantity = np.full(size, p_mean, dtype=float)
+    elif distribution == "normal":  # normal distributed mean = P1, standard dev = P2
+        quantity = np.round(norm.rvs(p_mean, p_std, size=size, random_state=rng))
+    elif (
+        distribution == "uniform"
+    ):  # uniform distributed between min = P1, max = P1 + P2
+        quantity = np.round(uniform.rvs(p_mean, p_std, size=size, random_state=rng))
+    elif distribution == "poisson":  # Poisson distributed  mean = P1
+        quantity = np.round(poisson.rvs(p_mean, size=size, random_state=rng)).astype(float)
+    else:
+        raise Exception("Distribution expected: const, normal, uniform or poisson")
+    dates = _period_index(start_date, num_periods, periodicity)
+
+    if material_numbers is None:
+        width = len(str(max(num_materials - 1, 0)))
+        material_numbers = ["Mat-ID-generated-{:0{}d}".format(i, width) for i in range(num_materials)]
+    elif len(material_numbers) != num_materials:
+        raise Exception("Number of material numbers expected: num_materials")
+
+    # same number of zero periods for every material, at random positions
+    num_zeros = int(round(intermittency * num_periods))
+    if num_zeros > 0:
+        zero_periods = rng.random(size).argsort(axis=1)[:, :num_zeros]
+        np.put_along_axis(quantity, zero_periods, 0, axis=1)
+
+    quantity = quantity.ravel()
+    materials = np.repeat(np.asarray(material_numbers, dtype=object), num_periods)
+
+    columns = {
+        "Material": materials,
+        "Date": pd.arrays.PeriodArray(np.tile(dates.asi8, num_materials), dtype=dates.dtype),
+        "Value": quantity * standard_price,
+        "Quantity": quantity,
+        "KEY": materials,
+    }
+
+    if output == "pandas":
+        return pd.DataFrame(columns)
+    elif output == "arrow":
+        import pyarrow as pa
+
+        return pa.table(columns)
+    else:
+        raise Exception("Output expected: pandas or arrow")
+
+
+@lru_cache(maxsize=32)
+def _period_index(start_date, num_periods, periodicity):
+    """Returns the periods of a time series, created once per start date, length and
+    periodicity and shared by all materials"""
+    try:
+        base_date = datetime.date.fromisoformat(start_date)
+    except:
+        raise Exception("Date format expected: yyyy-mm-dd")
+    if periodicity not in ("D", "W", "M", "Q", "Y"):
+        raise Exception("Periodicity expected: D, W, M, Q or Y")
+
+    return pd.period_range(base_date, periods=num_periods, freq=periodicity)
+
+
+def _random_state(random_state=None):
+    """Returns a numpy Generator for a seed, an existing Generator or None"""
+    if isinstance(random_state, np.random.Generator):
+        return random_state
+    return np.random.default_rng(random_state)
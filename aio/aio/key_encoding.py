@@ -0,0 +1,81 @@
+import numpy as np
+
+
+def _encode_keys(df, columns):
+    """Encodes one or more key columns into dense integer codes
+
+    The codes follow the sorted order of the key values, so sorting by code is the same
+    as sorting by the original columns. Missing values are kept as a key of their own.
+
+    Parameters
+    ----------
+    df : Pandas.DataFrame
+        DataFrame holding the key columns.
+
+    columns : string or list of strings
+        Column name(s) in the input DataFrame forming the key.
+
+    Returns
+    -------
+    codes : numpy.ndarray of int32
+        Code of the key for every row of the input DataFrame.
+
+    df_keys : Pandas.DataFrame
+        Lookup table with one row per code holding the original key values.
+    """
+    if isinstance(columns, str):
+        columns = [columns]
+
+    grouped = df.groupby(list(columns), sort=True, dropna=False, observed=True)
+    codes = grouped.ngroup().to_numpy(dtype=np.int32)
+    df_keys = grouped.size().index.to_frame(index=False)
+
+    return codes, df_keys
+
+
+def _decode_keys(codes, df_keys, index=None):
+    """Brings back the original key columns for an array of codes
+
+    Parameters
+    ----------
+    codes : array-like of int
+        Codes as returned by ``_encode_keys``.
+
+    df_keys : Pandas.DataFrame
+        Lookup table as returned by ``_encode_keys``.
+
+    index : Pandas.Index = None
+        Index of the returned DataFrame, e.g. the index of the DataFrame the key columns
+        are assigned to. Defaults to a RangeIndex.
+
+    Returns
+    -------
+    df_decoded : Pandas.DataFrame
+        Original key columns, one row per code.
+    """
+    df_decoded = df_keys.take(np.asarray(codes))
+    if index is None:
+        df_decoded = df_decoded.reset_index(drop=True)
+    else:
+        df_decoded.index = index
+
+    return df_decoded
+
+
+def _join_keys(df_keys, sep="-"):
+    """Joins the key columns of a lookup table into one readable string label per code
+
+    Parameters
+    ----------
+    df_keys : Pandas.DataFrame
+        Lookup table as returned by ``_encode_keys``.
+
+    sep : string = "-"
+        Separator placed between the values of the key columns.
+
+    Returns
+    -------
+    labels : numpy.ndarray of str
+        Label for every code.
+    """
+    return df_keys.astype(str).agg(sep.join, axis=1).to_numpy()
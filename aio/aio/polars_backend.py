@@ -0,0 +1,311 @@
+import os
+
+
+def _import_polars():
+    """Imports polars, which is an optional dependency of the polars backend"""
+    try:
+        import polars as pl
+    except ImportError as e:
+        raise ImportError('The polars backend requires polars, install it with: pip install "polars>=1.24"') from e
+    # join with nulls_equal and maintain_order
+    if tuple(int(v) for v in pl.__version__.split(".")[:2]) < (1, 24):
+        raise ImportError(
+            'The polars backend requires polars>=1.24, update it with: pip install -U "polars>=1.24"'
+        )
+    return pl
+
+
+def _lazy_frame(df, columns, filters=None):
+    """Converts the input of an analysis into a polars LazyFrame holding the needed columns only
+
+    Parameters
+    ----------
+    df : Pandas.DataFrame, polars.DataFrame, polars.LazyFrame, pyarrow.Table or path
+        Input of the analysis, a path to a parquet file or folder is read with pyarrow.
+
+    columns : list of strings
+        Column names needed by the analysis.
+
+    filters : list of tuples = None
+        Filters of the input rows, a parquet input reads only the matching row groups and rows. See
+        ``pyarrow.parquet.read_table``.
+
+    Returns
+    -------
+    lf : polars.LazyFrame
+        The needed columns of the input.
+    """
+    pl = _import_polars()
+
+    if isinstance(df, (str, os.PathLike)):
+        import pyarrow.parquet as pq
+
+        return pl.from_arrow(pq.read_table(df, columns=columns, filters=filters)).lazy()
+    if isinstance(df, pl.DataFrame):
+        df = df.lazy()
+    if isinstance(df, pl.LazyFrame):
+        return (df if filters is None else df.filter(_polars_filter(filters))).select(columns)
+    if hasattr(df, "to_pandas") and hasattr(df, "select"):
+        # pyarrow.Table
+        if filters is not None:
+            import pyarrow.parquet as pq
+
+            df = df.filter(pq.filters_to_expression(filters))
+        return pl.from_arrow(df.select(columns)).lazy()
+    if filters is not None:
+        from .read_and_write import _filter_frame
+
+        df = _filter_frame(df, filters)
+    return pl.from_pandas(df[columns]).lazy()
+
+
+def _polars_filter(filters):
+    """Polars expression of filters in disjunctive normal form as used by ``pyarrow.parquet``"""
+    pl = _import_polars()
+
+    operators = {
+        "=": lambda x, v: x == v,
+        "==": lambda x, v: x == v,
+        "!=": lambda x, v: x != v,
+        "<": lambda x, v: x < v,
+        ">": lambda x, v: x > v,
+        "<=": lambda x, v: x <= v,
+        ">=": lambda x, v: x >= v,
+        "in": lambda x, v: x.is_in(list(v)),
+        "not in": lambda x, v: ~x.is_in(list(v)),
+    }
+    if filters and isinstance(filters[0], tuple):
+        filters = [filters]
+    expression = pl.lit(False)
+    for conjunction in filters:
+        conjunction_expression = pl.lit(True)
+        for column, op, value in conjunction:
+            if op not in operators:
+                raise ValueError("Filter operator expected: {}".format(", ".join(operators)))
+            conjunction_expression &= operators[op](pl.col(column), value).fill_null(False)
+        expression |= conjunction_expression
+    return expression
+
+
+def _abc_analysis_polars(
+    df,
+    primary_dimension,
+    numeric_dimension,
+    secondary_dimensions,
+    A,
+    B,
+    classified_only,
+    filters,
+    passthrough_dimensions=None,
+):
+    """Multi-dimensional ABC analysis as one lazy polars query
+
+    Parameters and results are the same as for ``abc_analysis`` with the pandas backend, the result is a
+    polars.DataFrame.
+    """
+    pl = _import_polars()
+
+    secondary_dimensions = list(secondary_dimensions or [])
+    passthrough_dimensions = list(passthrough_dimensions or [])
+    lf = _lazy_frame(
+        df, [primary_dimension, numeric_dimension] + secondary_dimensions + passthrough_dimensions, filters
+    )
+    lf_passthrough = _passthrough(lf, secondary_dimensions + [primary_dimension], passthrough_dimensions)
+    lf = lf.select([primary_dimension, numeric_dimension] + secondary_dimensions)
+
+    if secondary_dimensions:
+        group = secondary_dimensions
+        secondary_label = pl.concat_str(
+            [pl.col(c).cast(pl.String).fill_null("nan") for c in secondary_dimensions], separator="-"
+        )
+    else:
+        group = ["secondary_dimension"]
+        secondary_label = pl.lit("No secondary dimension provided")
+        lf = lf.with_columns(secondary_label.alias("secondary_dimension"))
+
+    # group by secondary & primary dimension, descending quantities per secondary dimension, ties in order
+    # of the primary dimension
+    lf = (
+        lf.filter(pl.col(primary_dimension).is_not_null())
+        .group_by(group + [primary_dimension])
+        .agg(pl.col(numeric_dimension).sum())
+        .sort(
+            group + [numeric_dimension, primary_dimension],
+            descending=[True] * len(group) + [True, False],
+            nulls_last=[False] * len(group) + [False, True],
+        )
+    )
+
+    cumsum_relative_quantity = pl.col("Cumsum_Relative_Quantity").fill_nan(None)
+    lf = (
+        lf.with_columns(pl.col(numeric_dimension).sum().over(group).cast(pl.Float64).alias("Cumsum_Sec_Dim"))
+        .with_columns((pl.col(numeric_dimension) / pl.col("Cumsum_Sec_Dim")).alias("Relative_Quantity"))
+        .with_columns(pl.col("Relative_Quantity").cum_sum().over(group).alias("Cumsum_Relative_Quantity"))
+        .with_columns(
+            pl.when(cumsum_relative_quantity <= A)
+            .then(pl.lit("A"))
+            .when((cumsum_relative_quantity > A) & (cumsum_relative_quantity <= B))
+            .then(pl.lit("B"))
+            .when(cumsum_relative_quantity > B)
+            .then(pl.lit("C"))
+            .otherwise(pl.lit("0"))
+            .alias("Class")
+        )
+    )
+
+    if classified_only:
+        columns = [primary_dimension, numeric_dimension] + secondary_dimensions + ["Class"]
+    else:
+        columns = [
+            secondary_label.alias("secondary_dimension"),
+            primary_dimension,
+            numeric_dimension,
+            "Cumsum_Sec_Dim",
+            "Relative_Quantity",
+            "Cumsum_Relative_Quantity",
+        ] + secondary_dimensions + ["Class"]
+
+    lf = lf.select(columns)
+    if lf_passthrough is not None:
+        lf = lf.join(
+            lf_passthrough,
+            on=secondary_dimensions + [primary_dimension],
+            how="left",
+            nulls_equal=True,
+            maintain_order="left",
+        )
+    return lf.collect()
+
+
+def _passthrough(lf, keys, passthrough_dimensions):
+    """First non-null value of the passthrough dimensions per key, None without passthrough dimensions"""
+    if not passthrough_dimensions:
+        return None
+    pl = _import_polars()
+    return lf.group_by(keys).agg(pl.col(passthrough_dimensions).drop_nulls().first())
+
+
+def _xyz_analysis_polars(
+    df,
+    primary_dimension_keys,
+    relevant_numeric_dimension,
+    relevant_date_dimension,
+    start_date,
+    periods,
+    frequency,
+    X,
+    Y,
+    L,
+    M,
+    filters,
+    passthrough_dimensions=None,
+):
+    """XYZ analysis as lazy polars queries on the periods with demand
+
+    Parameters and results are the same as for ``xyz_analysis`` with the "dense" or "sparse" method, the
+    result is a polars.DataFrame.
+    """
+    pl = _import_polars()
+    from .xyz_analysis import _period_offsets
+
+    keys = [primary_dimension_keys] if isinstance(primary_dimension_keys, str) else list(primary_dimension_keys)
+    passthrough_dimensions = list(passthrough_dimensions or [])
+    lf = _lazy_frame(
+        df, keys + [relevant_numeric_dimension, relevant_date_dimension] + passthrough_dimensions, filters
+    )
+    lf_passthrough = _passthrough(lf, keys, passthrough_dimensions)
+    lf = lf.select(keys + [relevant_numeric_dimension, relevant_date_dimension]).rename(
+        {relevant_numeric_dimension: "numeric_dimension", relevant_date_dimension: "Date"}
+    )
+
+    # map the distinct dates to period offsets once, records outside of the period range get -1
+    unique_dates = lf.select(pl.col("Date").unique()).collect().to_series()
+    date_offsets = pl.LazyFrame(
+        {
+            "Date": unique_dates,
+            "offset": _period_offsets(unique_dates.to_pandas(), start_date, periods, frequency),
+        }
+    )
+    values = pl.col("numeric_dimension").cast(pl.Float64).fill_nan(None).fill_null(0)
+
+    # aggregate records to deal with > 1 record per key and period
+    cells = (
+        lf.join(date_offsets, on="Date", how="left", nulls_equal=True)
+        .filter((pl.col("offset") >= 0) & (values != 0))
+        .group_by(keys + ["offset"])
+        .agg(values.sum().alias("value"))
+    )
+
+    # squared deviations of the periods with demand, those of the implicit zeros are added below
+    statistics = (
+        cells.with_columns((pl.col("value").sum().over(keys) / periods).alias("Mean"))
+        .group_by(keys)
+        .agg(
+            pl.col("Mean").first(),
+            ((pl.col("value") - pl.col("Mean")) ** 2).sum().alias("Squared_Deviations"),
+            pl.len().alias("Period_Count"),
+            (pl.col("value") > 0).sum().cast(pl.Int64).alias("Non_Zero_Count"),
+        )
+    )
+
+    coefficient_of_variation = pl.col("Coefficient_of_Variation")
+    relative_non_zero_period_count = pl.col("Relative_Non_Zero_Period_Count")
+    lf = (
+        lf.select(keys)
+        .unique()
+        .join(statistics, on=keys, how="left", nulls_equal=True)
+        .with_columns(pl.col("Mean", "Squared_Deviations", "Period_Count", "Non_Zero_Count").fill_null(0))
+        .with_columns(
+            (
+                (pl.col("Squared_Deviations") + (periods - pl.col("Period_Count")) * pl.col("Mean") ** 2)
+                / (periods - 1)
+            )
+            .sqrt()
+            .alias("Standard_Deviation")
+        )
+        .with_columns(
+            pl.when(pl.col("Mean") <= 0)
+            .then(None)
+            .otherwise(pl.col("Standard_Deviation") / pl.col("Mean"))
+            .fill_nan(None)
+            .alias("Coefficient_of_Variation"),
+            (pl.col("Non_Zero_Count") / periods).alias("Relative_Non_Zero_Period_Count"),
+        )
+        .with_columns(
+            pl.when(coefficient_of_variation.is_null())
+            .then(pl.lit("N"))
+            .when((coefficient_of_variation > 0) & (coefficient_of_variation <= X))
+            .then(pl.lit("X"))
+            .when((coefficient_of_variation > X) & (coefficient_of_variation <= Y))
+            .then(pl.lit("Y"))
+            .when(coefficient_of_variation > Y)
+            .then(pl.lit("Z"))
+            .otherwise(pl.lit("0"))
+            .alias("XYZ_Class"),
+            pl.when(relative_non_zero_period_count <= L)
+            .then(pl.lit("Low"))
+            .when((relative_non_zero_period_count > L) & (relative_non_zero_period_count <= M))
+            .then(pl.lit("Medium"))
+            .when(relative_non_zero_period_count > M)
+            .then(pl.lit("High"))
+            .otherwise(pl.lit("0"))
+            .alias("Frequency_Class"),
+        )
+        .sort(keys, nulls_last=True)
+    )
+
+    lf = lf.select(
+        [
+            "Mean",
+            "Standard_Deviation",
+            "Non_Zero_Count",
+            "Coefficient_of_Variation",
+            "Relative_Non_Zero_Period_Count",
+            "XYZ_Class",
+            "Frequency_Class",
+        ]
+        + keys
+    )
+    if lf_passthrough is not None:
+        lf = lf.join(lf_passthrough, on=keys, how="left", nulls_equal=True, maintain_order="left")
+    return lf.collect()
@@ -1,10 +1,14 @@
 # Author: Maryam
 
+import bisect
+import csv
+import io
 import pandas as pd
 import os
 from os import listdir
 from os.path import isfile, join
 from pathlib import Path
+import time
 import warnings
 
 
@@ -38,25 +42,79 @@ def _write(data,
     """
     if to == 'csv' or to == 'both':
         # save as csv
-        csv_file_name = 'py_' + Path(str(file_name)).stem + '.csv'
-        if (file_location is None) and (write_directory is None):
-            data.to_csv(csv_file_name, index=False)
-        elif write_directory is None:
-            data.to_csv(join(file_location, csv_file_name), index=False)
-        else:
-            data.to_csv(join(write_directory, csv_file_name), index=False)
+        csv_file_path = _output_path(file_name, '.csv', file_location, write_directory)
+        data.to_csv(csv_file_path, index=False)
         if verbose:
-            print("{} is saved to the directory".format(csv_file_name))
+            print("{} is saved to the directory".format(Path(csv_file_path).name))
     if to == 'parquet' or to == 'both':
-        parquet_file_name = 'py_' + Path(str(file_name)).stem + '.parquet'
-        if (file_location is None) and (write_directory is None):
-            data.to_parquet(parquet_file_name, index=False)
-        elif write_directory is None:
-            data.to_parquet(join(file_location, parquet_file_name), index=False)
-        else:
-            data.to_parquet(join(write_directory, parquet_file_name), index=False)
+        parquet_file_path = _output_path(file_name, '.parquet', file_location, write_directory)
+        data.to_parquet(parquet_file_path, index=False)
+        if verbose:
+            print("{} is saved to the directory".format(Path(parquet_file_path).name))
+
+
+def _write_table(table,
+                 file_name,
+                 file_location=None,
+                 write_directory=None,
+                 to='both',
+                 verbose=False):
+    """
+    Save Arrow table to the directory as parquet, csv or both
+    without converting it to a DataFrame
+
+    Parameters
+    ----------
+    table: pyarrow.Table
+        The table to be written (saved).
+    file_name, file_location, write_directory, to, verbose
+        See _write.
+    """
+    import pyarrow.csv as pv
+    import pyarrow.parquet as pq
+
+    if to == 'csv' or to == 'both':
+        csv_file_path = _output_path(file_name, '.csv', file_location, write_directory)
+        pv.write_csv(table, csv_file_path)
+        if verbose:
+            print("{} is saved to the directory".format(Path(csv_file_path).name))
+    if to == 'parquet' or to == 'both':
+        parquet_file_path = _output_path(file_name, '.parquet', file_location, write_directory)
+        pq.write_table(table, parquet_file_path)
         if verbose:
-            print("{} is saved to the directory".format(parquet_file_name))
+            print("{} is saved to the directory".format(Path(parquet_file_path).name))
+
+
+def _output_path(file_name,
+                 extension,
+                 file_location=None,
+                 write_directory=None):
+    """
+    Build the path of a written file: 'py_' + name of the data
+    file with the given extension, in write_directory if given,
+    else in file_location.
+
+    Parameters
+    ----------
+    file_name: str
+        The name of a data file (e.g: 'data.csv').
+    extension: str
+        The extension of the written file (e.g: '.parquet').
+    file_location, write_directory
+        See _write.
+
+    Returns
+    -------
+    str:
+        The path of the written file.
+    """
+    output_file_name = 'py_' + Path(str(file_name)).stem + extension
+    if (file_location is None) and (write_directory is None):
+        return output_file_name
+    elif write_directory is None:
+        return join(file_location, output_file_name)
+    else:
+        return join(write_directory, output_file_name)
 
 
 def read_and_write(file_name,
@@ -64,7 +122,12 @@ def read_and_write(file_name,
                    write_directory=None,
                    to='both',
                    sep=',',
-                   verbose=False):
+                   verbose=False,
+                   engine='python',
+                   chunksize=None,
+                   row_group_size=None,
+                   schema=None,
+                   encoding='utf-8'):
     """
     Read CSV or Excel files by removing bad lines and save them
     as parquet, csv or both
@@ -83,6 +146,31 @@ def read_and_write(file_name,
         Delimiter to use. 
     verbose: bool, default False
         Informs when writing the file is successful.
+    engine: {'python', 'c', 'pyarrow'}, default 'python'
+        Parser engine for CSV files. 'c' and 'pyarrow' are several
+        times faster than 'python'. With 'pyarrow' the file is read
+        into an Arrow table and written without a pandas round trip.
+        All engines remove lines with too many fields, pad lines with
+        too few fields with nulls and keep all columns as strings.
+    chunksize: int, optional. Default None
+        If not None, CSV files are streamed in chunks of this many
+        rows instead of being read at once, so the memory stays
+        bounded whatever the file size. With the 'pyarrow' engine
+        the record batches of the Arrow reader are regrouped into
+        chunks of this many rows.
+    row_group_size: int, optional. Default None
+        Number of rows per row group of the streamed parquet file.
+        Default is chunksize.
+    schema: 'infer' or dict, optional. Default None
+        If None, all columns are kept as strings. If 'infer', numeric,
+        date and categorical columns are inferred from a sample of the
+        data and widened (integer to float to string) until all rows
+        fit. A dict maps column names to 'string', 'integer', 'float',
+        'category', 'date' or a date format (e.g: '%d.%m.%Y').
+        Categorical columns are dictionary encoded in parquet files.
+    encoding: str, default 'utf-8'
+        Encoding of CSV files. A byte order mark at the start of a
+        UTF-8 file is not part of the first column name.
 
     Raises
     -------
@@ -101,8 +189,30 @@ def read_and_write(file_name,
             f_path = file_name #os.path.abspath(file_name)
 
     # try to read the file
-    if 'csv' in str(file_name):
-        df = pd.read_csv(f_path, sep=sep, error_bad_lines=False, engine="python", dtype=str)
+    if 'csv' in str(file_name) and chunksize is not None:
+        _stream_csv(f_path,
+                    file_name,
+                    file_location=file_location,
+                    write_directory=write_directory,
+                    to=to,
+                    sep=sep,
+                    engine=engine,
+                    chunksize=chunksize,
+                    row_group_size=row_group_size,
+                    schema=schema,
+                    encoding=encoding,
+                    verbose=verbose)
+    elif 'csv' in str(file_name) and engine == 'pyarrow' and schema is None:
+        table = _read_csv_arrow(f_path, sep=sep, encoding=encoding)
+        # Save to directory
+        _write_table(table,
+                     file_name,
+                     file_location=file_location,
+                     write_directory=write_directory,
+                     to=to,
+                     verbose=verbose)
+    elif 'csv' in str(file_name):
+        df = _apply_schema(_read_csv(f_path, sep=sep, engine=engine, encoding=encoding), schema)
         # Save to directory
         _write(df,
                 file_name,
@@ -111,7 +221,7 @@ def read_and_write(file_name,
                 to=to,
                 verbose=verbose)
     elif "xls" in str(file_name).lower():
-        df = pd.read_excel(f_path, dtype=str)
+        df = _apply_schema(pd.read_excel(f_path, dtype=str), schema)
         # Save to directory
         _write(df,
                 file_name,
@@ -123,6 +233,646 @@ def read_and_write(file_name,
         raise ValueError("Could not read {}, because {} is not .csv or excel file".format(file_name, file_name))
 
 
+def _read_csv(f_path, sep=',', engine='python', chunksize=None, encoding='utf-8'):
+    """
+    Read a CSV file with pandas by removing bad lines and keeping
+    all columns as strings
+
+    Parameters
+    ----------
+    f_path: str or path object
+        The path of the CSV file.
+    sep: str, default ‘,’
+        Delimiter to use.
+    engine: {'python', 'c', 'pyarrow'}, default 'python'
+        Parser engine to use.
+    chunksize: int, optional. Default None
+        If not None, the file is read in chunks of this many rows.
+    encoding: str, default 'utf-8'
+        Encoding of the file.
+
+    Returns
+    -------
+    df: DataFrame or iterator of DataFrame
+        The content of the CSV file, in chunks if chunksize is
+        not None.
+    """
+    if engine == 'python':
+        return pd.read_csv(f_path, sep=sep, error_bad_lines=False, engine="python", dtype=str,
+                           chunksize=chunksize, encoding=encoding)
+    elif engine == 'c':
+        return pd.read_csv(f_path, sep=sep, on_bad_lines='skip', engine="c", dtype=str,
+                           chunksize=chunksize, encoding=encoding)
+    elif engine == 'pyarrow' and chunksize is None:
+        return _read_csv_arrow(f_path, sep=sep, encoding=encoding).to_pandas()
+    else:
+        raise ValueError("Engine expected: python, c or pyarrow")
+
+
+def _read_csv_arrow(f_path, sep=',', encoding='utf-8'):
+    """
+    Read a CSV file with pyarrow by removing bad lines and keeping
+    all columns as strings
+
+    The file is read by the streaming reader of pyarrow, which
+    numbers the rows with too few fields so that they are padded
+    in place, see _ShortRows.
+
+    Parameters
+    ----------
+    f_path: str or path object
+        The path of the CSV file.
+    sep: str, default ‘,’
+        Delimiter to use.
+    encoding: str, default 'utf-8'
+        Encoding of the file.
+
+    Returns
+    -------
+    table: pyarrow.Table
+        The content of the CSV file.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pv
+
+    short_rows = _ShortRows(sep)
+    options = _arrow_csv_options(f_path, sep=sep, encoding=encoding, invalid_row_handler=short_rows)
+    arrow_schema = _arrow_csv_schema(options)
+    try:
+        tables = list(_pad_short_rows(pv.open_csv(f_path, **options), short_rows, arrow_schema))
+    except pa.ArrowInvalid:
+        # parse errors of pyarrow, e.g. a row larger than a block
+        return pa.Table.from_pandas(_read_csv(f_path, sep=sep, engine='c', encoding=encoding),
+                                    schema=arrow_schema,
+                                    preserve_index=False)
+    return pa.concat_tables(tables) if tables else arrow_schema.empty_table()
+
+
+def _csv_arrow_tables(f_path, sep=',', chunksize=100000, encoding='utf-8'):
+    """
+    Read a CSV file with pyarrow as a stream of Arrow tables by
+    removing bad lines and keeping all columns as strings
+
+    Parameters
+    ----------
+    f_path: str or path object
+        The path of the CSV file.
+    sep: str, default ‘,’
+        Delimiter to use.
+    chunksize: int, default 100000
+        Number of rows per table, the last table may be shorter.
+    encoding: str, default 'utf-8'
+        Encoding of the file.
+
+    Returns
+    -------
+    arrow_schema: pyarrow.Schema
+        The schema shared by all tables.
+    tables: iterator of pyarrow.Table
+        The content of the CSV file.
+    """
+    short_rows = _ShortRows(sep)
+    options = _arrow_csv_options(f_path, sep=sep, encoding=encoding, invalid_row_handler=short_rows)
+    arrow_schema = _arrow_csv_schema(options)
+    tables = _csv_arrow_stream(f_path, sep, chunksize, options, arrow_schema, short_rows)
+    return arrow_schema, _rebatch(tables, chunksize)
+
+
+def _rebatch(tables, chunksize):
+    """
+    Regroup a stream of Arrow tables into tables of chunksize rows
+    without copying, the last table may be shorter
+
+    Parameters
+    ----------
+    tables: iterator of pyarrow.Table
+        Tables of any number of rows with the same schema.
+    chunksize: int
+        Number of rows per table.
+
+    Returns
+    -------
+    tables: iterator of pyarrow.Table
+    """
+    import pyarrow as pa
+
+    buffered, num_buffered = [], 0
+    for table in tables:
+        buffered.append(table)
+        num_buffered += table.num_rows
+        while num_buffered >= chunksize:
+            table = pa.concat_tables(buffered)
+            yield table.slice(0, chunksize)
+            buffered = [table.slice(chunksize)]
+            num_buffered -= chunksize
+    if num_buffered:
+        yield pa.concat_tables(buffered)
+
+
+def _csv_arrow_stream(f_path, sep, chunksize, options, arrow_schema, short_rows):
+    """
+    Generator of _csv_arrow_tables, continues with the c engine
+    after the rows already read on a parse error of pyarrow
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pv
+
+    num_rows = 0
+    try:
+        for table in _pad_short_rows(pv.open_csv(f_path, **options), short_rows, arrow_schema):
+            num_rows += table.num_rows
+            yield table
+    except pa.ArrowInvalid:
+        # all engines read the same rows up to the parse error
+        encoding = options['read_options'].encoding
+        for chunk in _read_csv(f_path, sep=sep, engine='c', chunksize=chunksize, encoding=encoding):
+            skipped = min(num_rows, len(chunk))
+            num_rows -= skipped
+            if skipped < len(chunk):
+                yield pa.Table.from_pandas(chunk.iloc[skipped:],
+                                           schema=arrow_schema,
+                                           preserve_index=False)
+
+
+def _stream_csv(f_path,
+                file_name,
+                file_location=None,
+                write_directory=None,
+                to='both',
+                sep=',',
+                engine='python',
+                chunksize=100000,
+                row_group_size=None,
+                schema=None,
+                encoding='utf-8',
+                verbose=False):
+    """
+    Convert a CSV file chunk by chunk to parquet, csv or both
+    by removing bad lines. At most one chunk and one row group
+    are held in memory.
+
+    Parameters
+    ----------
+    f_path: str or path object
+        The path of the CSV file.
+    file_name, file_location, write_directory, to, verbose
+        See _write.
+    sep, engine, chunksize, row_group_size, schema, encoding
+        See read_and_write.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pv
+    import pyarrow.parquet as pq
+
+    if row_group_size is None:
+        row_group_size = chunksize
+
+    arrow_schema, tables = _csv_tables(f_path,
+                                       sep=sep,
+                                       engine=engine,
+                                       chunksize=chunksize,
+                                       schema=schema,
+                                       encoding=encoding)
+
+    csv_writer, parquet_writer = None, None
+    if to == 'csv' or to == 'both':
+        csv_file_path = _output_path(file_name, '.csv', file_location, write_directory)
+        csv_writer = pv.CSVWriter(csv_file_path, arrow_schema)
+    if to == 'parquet' or to == 'both':
+        parquet_file_path = _output_path(file_name, '.parquet', file_location, write_directory)
+        parquet_writer = pq.ParquetWriter(parquet_file_path, arrow_schema)
+
+    # buffer chunks until a row group is complete
+    buffered, num_buffered = [], 0
+    for table in tables:
+        if csv_writer is not None:
+            csv_writer.write_table(table)
+        if parquet_writer is not None:
+            buffered.append(table)
+            num_buffered += table.num_rows
+            if num_buffered >= row_group_size:
+                table = pa.concat_tables(buffered)
+                num_complete = num_buffered - num_buffered % row_group_size
+                parquet_writer.write_table(table.slice(0, num_complete),
+                                           row_group_size=row_group_size)
+                buffered = [table.slice(num_complete)]
+                num_buffered -= num_complete
+    if parquet_writer is not None and num_buffered:
+        parquet_writer.write_table(pa.concat_tables(buffered),
+                                   row_group_size=row_group_size)
+
+    if csv_writer is not None:
+        csv_writer.close()
+        if verbose:
+            print("{} is saved to the directory".format(Path(csv_file_path).name))
+    if parquet_writer is not None:
+        parquet_writer.close()
+        if verbose:
+            print("{} is saved to the directory".format(Path(parquet_file_path).name))
+
+
+def _csv_tables(f_path, sep=',', engine='python', chunksize=100000, schema=None, encoding='utf-8'):
+    """
+    Read a CSV file as a stream of Arrow tables by removing bad
+    lines
+
+    Parameters
+    ----------
+    f_path: str or path object
+        The path of the CSV file.
+    sep, engine, chunksize, schema, encoding
+        See read_and_write. An inferred schema has to fit all
+        chunks before the first one is converted, so the file is
+        read twice.
+
+    Returns
+    -------
+    arrow_schema: pyarrow.Schema
+        The schema shared by all tables.
+    tables: iterator of pyarrow.Table
+        The content of the CSV file chunk by chunk.
+    """
+    import itertools
+    import pyarrow as pa
+
+    if engine == 'pyarrow' and schema is None:
+        return _csv_arrow_tables(f_path, sep=sep, chunksize=chunksize, encoding=encoding)
+
+    if isinstance(schema, str) and schema == 'infer':
+        # widen the types inferred from the first chunk until all chunks fit
+        chunks = _csv_chunks(f_path, sep=sep, engine=engine, chunksize=chunksize, encoding=encoding)
+        schema = _infer_schema(next(chunks))
+        for chunk in chunks:
+            schema = _widen_schema(chunk, schema)
+
+    chunks = _csv_chunks(f_path, sep=sep, engine=engine, chunksize=chunksize, encoding=encoding)
+    first_chunk = next(chunks)
+    # keep the pandas metadata so that the nullable integers read back as Int64
+    arrow_schema = _arrow_schema(first_chunk.columns, schema).with_metadata(
+        pa.Schema.from_pandas(_apply_schema(first_chunk, schema), preserve_index=False).metadata)
+    tables = (pa.Table.from_pandas(_apply_schema(chunk, schema),
+                                   schema=arrow_schema,
+                                   preserve_index=False)
+              for chunk in itertools.chain([first_chunk], chunks))
+    return arrow_schema, tables
+
+
+def _csv_chunks(f_path, sep=',', engine='python', chunksize=100000, encoding='utf-8'):
+    """
+    Read a CSV file chunk by chunk by removing bad lines and
+    keeping all columns as strings
+
+    Parameters
+    ----------
+    f_path: str or path object
+        The path of the CSV file.
+    sep, engine, chunksize, encoding
+        See read_and_write.
+
+    Returns
+    -------
+    chunks: iterator of DataFrame
+        The content of the CSV file, at least one chunk.
+    """
+    if engine != 'pyarrow':
+        yield from _read_csv(f_path, sep=sep, engine=engine, chunksize=chunksize, encoding=encoding)
+        return
+
+    arrow_schema, tables = _csv_arrow_tables(f_path, sep=sep, chunksize=chunksize, encoding=encoding)
+    empty = True
+    for table in tables:
+        empty = False
+        yield table.to_pandas()
+    if empty:
+        yield arrow_schema.empty_table().to_pandas()
+
+
+def _arrow_csv_options(f_path, sep=',', encoding='utf-8', invalid_row_handler=None):
+    """
+    Options of pyarrow.csv to skip bad lines and read all columns
+    of a CSV file as strings. Rows with too many fields are
+    skipped like by pandas. Rows with too few fields are handled
+    by the invalid_row_handler, by default they raise an
+    ArrowInvalid error as pyarrow cannot pad them with nulls.
+
+    Parameters
+    ----------
+    f_path: str or path object
+        The path of the CSV file.
+    sep: str, default ‘,’
+        Delimiter to use.
+    encoding: str, default 'utf-8'
+        Encoding of the file.
+    invalid_row_handler: callable, optional. Default None
+        Handler of the rows with too few or too many fields, e.g.
+        a _ShortRows. If None, _skip_long_rows.
+
+    Returns
+    -------
+    dict:
+        Keyword arguments read_options, parse_options and
+        convert_options.
+    """
+    import codecs
+    import pyarrow as pa
+    import pyarrow.csv as pv
+
+    # read the header to declare every column as string, without
+    # the byte order mark of a UTF-8 file like pandas
+    header_encoding = 'utf-8-sig' if codecs.lookup(encoding).name == 'utf-8' else encoding
+    with open(f_path, newline='', encoding=header_encoding) as f:
+        column_names = next(csv.reader(f, delimiter=sep), [])
+    # name unnamed columns like pandas does
+    column_names = [name if name else 'Unnamed: {}'.format(i)
+                    for i, name in enumerate(column_names)]
+
+    return {
+        'read_options': pv.ReadOptions(column_names=column_names,
+                                       skip_rows=1,
+                                       encoding=encoding),
+        'parse_options': pv.ParseOptions(delimiter=sep,
+                                         invalid_row_handler=invalid_row_handler or _skip_long_rows),
+        'convert_options': pv.ConvertOptions(
+            column_types={name: pa.string() for name in column_names},
+            strings_can_be_null=True),
+    }
+
+
+def _skip_long_rows(row):
+    """Invalid row handler of pyarrow.csv, see _arrow_csv_options"""
+    return 'skip' if row.actual_columns > row.expected_columns else 'error'
+
+
+class _ShortRows:
+    """
+    Invalid row handler of pyarrow.csv skipping all bad lines and
+    keeping the rows with too few fields padded with nulls, for
+    _pad_short_rows to put them back in place
+
+    Only the streaming reader of pyarrow numbers the rows, a row
+    with too few fields without number raises an ArrowInvalid
+    error like _skip_long_rows.
+
+    Parameters
+    ----------
+    sep: str, default ‘,’
+        Delimiter of the CSV file.
+    """
+
+    def __init__(self, sep=','):
+        import pyarrow.csv as pv
+
+        self.sep = sep
+        self.null_values = set(pv.ConvertOptions().null_values)
+        # numbers of the skipped rows and (number, fields) of the short rows, in file order
+        self.skipped = []
+        self.rows = []
+
+    def __call__(self, row):
+        if row.actual_columns > row.expected_columns:
+            bisect.insort(self.skipped, row.number or 0)
+            return 'skip'
+        if row.number is None:
+            return 'error'
+        fields = next(csv.reader(io.StringIO(row.text, newline=''), delimiter=self.sep), [])
+        fields = [None if field in self.null_values else field for field in fields]
+        fields += [None] * (row.expected_columns - len(fields))
+        bisect.insort(self.skipped, row.number)
+        bisect.insort(self.rows, (row.number, fields))
+        return 'skip'
+
+    def position(self, i):
+        """Number of rows read before the i-th short row"""
+        number = self.rows[i][0]
+        # the header is row 1
+        return number - 2 - bisect.bisect_left(self.skipped, number)
+
+
+def _pad_short_rows(batches, short_rows, arrow_schema):
+    """
+    Put the rows with too few fields skipped by a _ShortRows back
+    in place among the record batches of pyarrow.csv.open_csv
+
+    Parameters
+    ----------
+    batches: iterator of pyarrow.RecordBatch
+        Record batches read with short_rows as invalid row handler.
+    short_rows: _ShortRows
+        The invalid row handler of the reader.
+    arrow_schema: pyarrow.Schema
+        The schema of the batches.
+
+    Returns
+    -------
+    tables: iterator of pyarrow.Table
+    """
+    import pyarrow as pa
+
+    def short_row(i):
+        return pa.Table.from_pylist([dict(zip(arrow_schema.names, short_rows.rows[i][1]))],
+                                    schema=arrow_schema)
+
+    num_rows, i = 0, 0
+    for batch in batches:
+        table = pa.Table.from_batches([batch], schema=arrow_schema)
+        start = 0
+        # the short rows of a batch are known once the batch is read
+        while i < len(short_rows.rows) and short_rows.position(i) - num_rows < batch.num_rows:
+            end = short_rows.position(i) - num_rows
+            if end > start:
+                yield table.slice(start, end - start)
+            yield short_row(i)
+            start, i = end, i + 1
+        if start < batch.num_rows:
+            yield table.slice(start)
+        num_rows += batch.num_rows
+    # short rows at the end of the file
+    for i in range(i, len(short_rows.rows)):
+        yield short_row(i)
+
+
+def _arrow_csv_schema(options):
+    """Arrow schema of a CSV file read with _arrow_csv_options"""
+    import pyarrow as pa
+
+    return pa.schema([(name, pa.string()) for name in options['read_options'].column_names])
+
+
+# months like '2020-01' are periods rather than dates and stay strings
+_DATE_FORMATS = ['%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%d.%m.%Y', '%d.%m.%Y %H:%M:%S',
+                 '%m/%d/%Y', '%d/%m/%Y']
+
+
+def _infer_schema(df, sample_size=10000, max_category_ratio=0.1):
+    """
+    Infer the type of every string column from a sample of rows
+    and widen it until all rows fit, see _widen_schema
+
+    Parameters
+    ----------
+    df: DataFrame
+        The data with string columns.
+    sample_size: int, default 10000
+        Number of rows the types are inferred from.
+    max_category_ratio: float, default 0.1
+        Maximum ratio of distinct to non-missing values of a
+        categorical column.
+
+    Returns
+    -------
+    schema: dict
+        Type of every column, see read_and_write.
+    """
+    schema = {}
+    for column in df.columns:
+        values = df[column].head(sample_size).dropna().astype(str)
+        schema[column] = 'string'
+        if values.empty:
+            continue
+        numbers = pd.to_numeric(values, errors='coerce')
+        # keep identifiers with leading zeros (e.g. material numbers) as strings
+        if numbers.notna().all() and not values.str.match(r'^[+-]?0\d').any():
+            schema[column] = 'integer' if (numbers % 1 == 0).all() else 'float'
+            continue
+        date_format = next((f for f in _DATE_FORMATS
+                            if _to_datetime(values, f).notna().all()),
+                           None)
+        if date_format is not None:
+            schema[column] = date_format
+        elif values.nunique() <= max_category_ratio * len(values):
+            schema[column] = 'category'
+    return _widen_schema(df, schema)
+
+
+def _widen_schema(df, schema):
+    """
+    Widen the inferred types of a schema until all values of a
+    DataFrame fit: integer to float to string and dates to string
+
+    Parameters
+    ----------
+    df: DataFrame
+        The data with string columns.
+    schema: dict
+        Type of every column, see read_and_write.
+
+    Returns
+    -------
+    schema: dict
+        Type of every column, no value becomes a missing value
+        when it is converted.
+    """
+    schema = dict(schema)
+    for column, kind in schema.items():
+        if column not in df.columns or kind in ('string', 'category'):
+            continue
+        values = df[column].dropna().astype(str)
+        if kind in ('integer', 'float'):
+            numbers = pd.to_numeric(values, errors='coerce')
+            if numbers.isna().any() or values.str.match(r'^[+-]?0\d').any():
+                kind = 'string'
+            elif kind == 'integer' and not ((numbers % 1 == 0).all()
+                                            and (numbers.abs() < 2 ** 63).all()):
+                kind = 'float'
+        elif _to_datetime(values, kind).isna().any():
+            kind = 'string'
+        schema[column] = kind
+    return schema
+
+
+def _to_datetime(values, date_format):
+    """
+    Parse strings with a date format, values which do not have
+    a number for every field of the format become missing values
+
+    Parameters
+    ----------
+    values: Series of str
+        The strings to parse.
+    date_format: str
+        The date format (e.g: '%d.%m.%Y').
+
+    Returns
+    -------
+    dates: Series of datetime64
+    """
+    dates = pd.to_datetime(values, format=date_format, errors='coerce')
+    # ISO formats also parse partial dates like '2020-01'
+    return dates.where(values.str.count(r'\d+') == date_format.count('%'))
+
+
+def _apply_schema(df, schema):
+    """
+    Convert the string columns of a DataFrame to the types of a
+    schema
+
+    Parameters
+    ----------
+    df: DataFrame
+        The data with string columns.
+    schema: None, 'infer' or dict
+        See read_and_write. Values which cannot be converted to
+        the type of a dict become missing values, inferred types
+        fit all values.
+
+    Returns
+    -------
+    df: DataFrame
+        The data with typed columns.
+    """
+    if schema is None:
+        return df
+    if isinstance(schema, str) and schema == 'infer':
+        schema = _infer_schema(df)
+    df = df.copy()
+    for column, kind in schema.items():
+        if column not in df.columns or kind == 'string':
+            continue
+        elif kind == 'integer':
+            df[column] = pd.to_numeric(df[column], errors='coerce').astype('Int64')
+        elif kind == 'float':
+            df[column] = pd.to_numeric(df[column], errors='coerce').astype(float)
+        elif kind == 'category':
+            df[column] = df[column].astype('category')
+        elif kind == 'date':
+            df[column] = pd.to_datetime(df[column], errors='coerce')
+        elif kind.startswith('%'):
+            df[column] = pd.to_datetime(df[column], format=kind, errors='coerce')
+        else:
+            raise ValueError("Column type expected: string, integer, float, category, "
+                             "date or a date format starting with %")
+    return df
+
+
+def _arrow_schema(columns, schema):
+    """
+    Arrow schema of the columns after _apply_schema
+
+    Parameters
+    ----------
+    columns: list of str
+        The column names.
+    schema: None or dict
+        See read_and_write.
+
+    Returns
+    -------
+    pyarrow.Schema
+    """
+    import pyarrow as pa
+
+    types = {'string': pa.string(),
+             'integer': pa.int64(),
+             'float': pa.float64(),
+             'category': pa.dictionary(pa.int32(), pa.string()),
+             'date': pa.timestamp('ns')}
+    schema = schema or {}
+    return pa.schema([(str(column),
+                       types['date'] if str(schema.get(column, '')).startswith('%')
+                       else types[schema.get(column, 'string')])
+                      for column in columns])
+
+
 def _check_file(file_name):
     """
     Check if the file name is csv or xls or it has not
@@ -151,7 +901,8 @@ def _check_file(file_name):
 def read_and_write_all(folder_path,
                        to='both',
                        write_directory=None,
-                       verbose=False):
+                       verbose=False,
+                       max_workers=None):
     """
     Read CSV or Excel files in the folder by removing bad lines
     and save them as parquet, csv or both
@@ -166,21 +917,131 @@ def read_and_write_all(folder_path,
         The desired path to save the new file (folder).
     verbose: bool, default False
         Informs when writing the file is successful.
+    max_workers: int, optional. Default None
+        If not None, the files are converted on a process pool with
+        this many processes. A file which cannot be converted is
+        reported in the summary instead of stopping the other files.
+
+    Returns
+    -------
+    summary: DataFrame
+        One row per file with the columns File, Status ('ok' or
+        'failed'), Seconds and Error.
 
     Raises
     ----------
-    Error when the file name does not contain csv or xls.
+    Error when the file name does not contain csv or xls
+    and max_workers is None.
+    """
+    files = [f for f in listdir(folder_path)
+             if isfile(join(folder_path, f)) and _check_file(f)]
+    if max_workers is None:
+        results = []
+        for i, f in enumerate(files):
+            if verbose:
+                print("{}: Reading {} ...".format(i, f))
+            results.append(_read_and_write_timed(f,
+                                                 folder_path,
+                                                 write_directory,
+                                                 to=to,
+                                                 verbose=verbose,
+                                                 raise_errors=True))
+    else:
+        results = _read_and_write_pool(files,
+                                       folder_path,
+                                       write_directory,
+                                       to=to,
+                                       verbose=verbose,
+                                       max_workers=max_workers)
+    return pd.DataFrame(results, columns=['File', 'Status', 'Seconds', 'Error'])
+
+
+def _read_and_write_pool(files,
+                         folder_path,
+                         write_directory,
+                         to,
+                         verbose,
+                         max_workers):
+    """
+    Convert files on a process pool with at most two pending
+    files per process
+
+    Parameters
+    ----------
+    files: list of str
+        The names of the data files in folder_path.
+    folder_path, write_directory, to, verbose, max_workers
+        See read_and_write_all.
+
+    Returns
+    -------
+    results: list of dict
+        Summary of every file in the order of files.
     """
-    for i, f in enumerate(listdir(folder_path)):
-        f_path = join(folder_path, f)
-        if isfile(f_path) and _check_file(f):
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+    results = [None] * len(files)
+    pending = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for i, f in enumerate(files):
+            # bound the queue to keep the memory of the pending tasks small
+            if len(pending) >= 2 * max_workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[pending.pop(future)] = future.result()
             if verbose:
                 print("{}: Reading {} ...".format(i, f))
-            read_and_write(f,
-                           folder_path,
-                           write_directory,
-                           to=to,
-                           verbose=verbose)
+            future = executor.submit(_read_and_write_timed,
+                                     f,
+                                     folder_path,
+                                     write_directory,
+                                     to=to,
+                                     verbose=verbose,
+                                     raise_errors=False)
+            pending[future] = i
+        for future in wait(pending).done:
+            results[pending[future]] = future.result()
+    return results
+
+
+def _read_and_write_timed(file_name,
+                          file_location,
+                          write_directory,
+                          to='both',
+                          verbose=False,
+                          raise_errors=True):
+    """
+    Run read_and_write for one file and measure the time
+
+    Parameters
+    ----------
+    file_name, file_location, write_directory, to, verbose
+        See read_and_write.
+    raise_errors: bool, default True
+        If False, an error is reported in the summary instead of
+        being raised.
+
+    Returns
+    -------
+    result: dict
+        Summary with the keys File, Status, Seconds and Error.
+    """
+    start = time.perf_counter()
+    try:
+        read_and_write(file_name,
+                       file_location,
+                       write_directory,
+                       to=to,
+                       verbose=verbose)
+        status, error = 'ok', None
+    except Exception as e:
+        if raise_errors:
+            raise
+        status, error = 'failed', "{}: {}".format(type(e).__name__, e)
+    return {'File': file_name,
+            'Status': status,
+            'Seconds': time.perf_counter() - start,
+            'Error': error}
 
 
 def read_and_concat(list_of_files,
@@ -189,7 +1050,12 @@ def read_and_concat(list_of_files,
                     parquet=True,
                     by_row=True,
                     save_by=None,
-                    sep=','):
+                    sep=',',
+                    schema=None,
+                    backend='pandas',
+                    columns=None,
+                    filters=None,
+                    encoding='utf-8'):
     """
     Read a list of parquet or csv file and concatenate them by row
     or by column. The file is written in the directory under the
@@ -212,6 +1078,34 @@ def read_and_concat(list_of_files,
         file_location under this name.
     sep: str, default ‘,’
         Delimiter to use. 
+    schema: 'infer' or dict, optional. Default None
+        If None, all columns are kept as strings. If 'infer', numeric,
+        date and categorical columns are inferred from a sample of the
+        data and widened (integer to float to string) until all rows
+        fit. A dict maps column names to 'string', 'integer', 'float',
+        'category', 'date' or a date format (e.g: '%d.%m.%Y').
+        Categorical columns are dictionary encoded in parquet files.
+    backend: {'pandas', 'pyarrow'}, default 'pandas'
+        With 'pyarrow', the files are read concurrently as one
+        pyarrow dataset and concatenated by row before the
+        conversion to a dataframe.
+    columns: list of str, optional. Default None
+        If not None, only these columns are read.
+    filters: list of tuples or pyarrow.compute.Expression, optional
+        If not None, only rows matching the filters are read
+        (e.g: [('Country', '=', 'DE'), ('Year', 'in', ['2020', '2021'])]).
+        A list of lists of tuples combines the inner lists with or.
+        Parquet files skip the row groups not matching the filters.
+        CSV columns are strings, so their filters compare strings.
+        Expressions are only supported by the 'pyarrow' backend.
+    encoding: str, default 'utf-8'
+        Encoding of csv files.
+
+    Raises
+    ------
+    ValueError
+        If the backend is not supported or the 'pyarrow' backend
+        has to concatenate by column.
 
     Returns
     -------
@@ -223,17 +1117,37 @@ def read_and_concat(list_of_files,
         list_of_files_path = [join(file_location, f) for f in list_of_files]
     else:
         list_of_files_path = [os.path.abspath(f) for f in list_of_files]
-    lists_of_dfs = []
-    if parquet:
-        for file in list_of_files_path:
-            lists_of_dfs.append(pd.read_parquet(file))
-    else:
-        for file in list_of_files_path:
-            lists_of_dfs.append(pd.read_csv(file, sep=sep, dtype=str))
-    if by_row:
-        concat_output = pd.concat(lists_of_dfs, axis=0)
+    if backend == 'pyarrow':
+        if not by_row:
+            raise ValueError("Backend 'pyarrow' concatenates by row only")
+        table = _read_dataset(list_of_files_path,
+                              parquet=parquet,
+                              sep=sep,
+                              columns=columns,
+                              filters=filters,
+                              encoding=encoding)
+        concat_output = table.to_pandas(split_blocks=True, self_destruct=True)
+    elif backend == 'pandas':
+        lists_of_dfs = []
+        if parquet:
+            for file in list_of_files_path:
+                lists_of_dfs.append(pd.read_parquet(file, columns=columns, filters=filters))
+        else:
+            # read the filtered columns as well and drop them after filtering
+            usecols = None
+            if columns is not None:
+                usecols = list(columns) + [c for c in _filter_columns(filters) if c not in columns]
+            for file in list_of_files_path:
+                df = pd.read_csv(file, sep=sep, dtype=str, usecols=usecols, encoding=encoding)
+                df = _filter_frame(df, filters)
+                lists_of_dfs.append(df if columns is None else df[list(columns)])
+        if by_row:
+            concat_output = pd.concat(lists_of_dfs, axis=0)
+        else:
+            concat_output = pd.concat(lists_of_dfs, axis=1)
     else:
-        concat_output = pd.concat(lists_of_dfs, axis=1)
+        raise ValueError("Backend expected: pandas or pyarrow")
+    concat_output = _apply_schema(concat_output, schema)
     if save_by is not None:
         if parquet:
             to = 'parquet'
@@ -248,12 +1162,121 @@ def read_and_concat(list_of_files,
     return concat_output
 
 
+def _read_dataset(list_of_files_path,
+                  parquet=True,
+                  sep=',',
+                  columns=None,
+                  filters=None,
+                  encoding='utf-8'):
+    """
+    Read a list of parquet or csv files as one pyarrow dataset
+
+    The files are scanned concurrently by the threads of pyarrow
+    and the record batches of all files form one table without a
+    copy.
+
+    Parameters
+    ----------
+    list_of_files_path: list of str
+        The paths of the files.
+    parquet, sep, columns, filters, encoding
+        See read_and_concat.
+
+    Returns
+    -------
+    table: pyarrow.Table
+        The rows of all files.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    list_of_files_path = [str(f) for f in list_of_files_path]
+    if parquet:
+        file_format = ds.ParquetFileFormat()
+        # files may have different columns, like with pd.concat
+        dataset_schema = pa.unify_schemas([pq.read_schema(f) for f in list_of_files_path])
+    else:
+        options = _arrow_csv_options(list_of_files_path[0], sep=sep, encoding=encoding)
+        file_format = ds.CsvFileFormat(**options)
+        dataset_schema = _arrow_csv_schema(options)
+    dataset = ds.dataset(list_of_files_path, schema=dataset_schema, format=file_format)
+
+    if filters is not None and not isinstance(filters, ds.Expression):
+        filters = pq.filters_to_expression(filters)
+    try:
+        return dataset.to_table(columns=columns, filter=filters, use_threads=True)
+    except pa.ArrowInvalid:
+        if parquet:
+            raise
+        # rows with too few fields are not numbered by the dataset scanner, read the files
+        # one by one to pad them with nulls in place
+        table = pa.concat_tables([_read_csv_arrow(f, sep=sep, encoding=encoding) for f in list_of_files_path])
+        return ds.dataset(table).to_table(columns=columns, filter=filters)
+
+
+def _filter_columns(filters):
+    """
+    Names of the columns used by filters in disjunctive normal
+    form, see _filter_frame
+    """
+    if not filters:
+        return []
+    if isinstance(filters[0], tuple):
+        filters = [filters]
+    return list(dict.fromkeys(column for conjunction in filters for column, _, _ in conjunction))
+
+
+def _filter_frame(df, filters):
+    """
+    Select the rows of a dataframe matching filters in disjunctive
+    normal form as used by pyarrow.parquet
+
+    Parameters
+    ----------
+    df: DataFrame
+        The data to filter.
+    filters: list of tuples or list of lists of tuples
+        See read_and_concat.
+
+    Returns
+    -------
+    df: DataFrame
+        The matching rows.
+    """
+    if not filters:
+        return df
+    if isinstance(filters[0], tuple):
+        filters = [filters]
+    operators = {
+        '=': lambda x, v: x == v,
+        '==': lambda x, v: x == v,
+        '!=': lambda x, v: x != v,
+        '<': lambda x, v: x < v,
+        '>': lambda x, v: x > v,
+        '<=': lambda x, v: x <= v,
+        '>=': lambda x, v: x >= v,
+        'in': lambda x, v: x.isin(v),
+        'not in': lambda x, v: ~x.isin(v),
+    }
+    mask = pd.Series(False, index=df.index)
+    for conjunction in filters:
+        conjunction_mask = pd.Series(True, index=df.index)
+        for column, op, value in conjunction:
+            if op not in operators:
+                raise ValueError("Filter operator expected: {}".format(', '.join(operators)))
+            conjunction_mask &= operators[op](df[column], value).fillna(False)
+        mask |= conjunction_mask
+    return df[mask]
+
+
 def read_all_sheets(excel_file,
                     file_location=None,
                     write_directory=None,
                     by_row=True,
                     save_by=None,
-                    to='both'):
+                    to='both',
+                    schema=None):
     """
     Read an excel file with multiple sheets and concatenate the sheets
 
@@ -272,6 +1295,13 @@ def read_all_sheets(excel_file,
         file_location under this name.
     to: {'csv', 'parquet', 'both'}, optional
         The format to save the data. Default is 'both'.
+    schema: 'infer' or dict, optional. Default None
+        If None, all columns are kept as strings. If 'infer', numeric,
+        date and categorical columns are inferred from a sample of the
+        data and widened (integer to float to string) until all rows
+        fit. A dict maps column names to 'string', 'integer', 'float',
+        'category', 'date' or a date format (e.g: '%d.%m.%Y').
+        Categorical columns are dictionary encoded in parquet files.
 
     Returns
     -------
@@ -285,6 +1315,9 @@ def read_all_sheets(excel_file,
         excel_file_path = os.path.abspath(excel_file)
     all_sheets = pd.read_excel(excel_file_path, None, dtype=str)
     list_of_dfs = list(all_sheets.values())
+    if isinstance(schema, str) and schema == 'infer':
+        schema = _infer_schema(pd.concat(list_of_dfs, axis=0 if by_row else 1))
+    list_of_dfs = [_apply_schema(df, schema) for df in list_of_dfs]
     if by_row:
         concat_output = pd.concat(list_of_dfs, axis=0)
     else:
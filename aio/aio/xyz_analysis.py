@@ -1,7 +1,13 @@
+import os
+
 import numpy as np
 import pandas as pd
 import itertools
 
+from .key_encoding import _encode_keys, _decode_keys
+from .polars_backend import _xyz_analysis_polars
+from .read_and_write import _filter_frame
+
 
 def xyz_analysis(
     df,
@@ -15,15 +21,20 @@ def xyz_analysis(
     Y=1,
     L=0.4,
     M=0.7,
+    method="expanded",
+    filters=None,
+    backend="pandas",
+    passthrough_dimensions=None,
 ):
     """The XYZ Analysis provides a XYZ variability & frequency classification for a multi-dimensional,
     granular time series input dataset.
 
     Parameters
     ----------
-    df : Pandas.DataFrame
+    df : Pandas.DataFrame or path
         DataFrame holding the object to be classified, if applicable additional secondary_dimensions, and
         numeric values used for classification, e.g. df.columns = ["product", "country", "quantity"].
+        A path to a parquet file or folder is read with the needed columns only.
 
     primary_dimension_keys : string or list of strings
         Column name(s) in the input DataFrame holding the object(s) to be classified, e.g. a product number.
@@ -58,6 +69,29 @@ def xyz_analysis(
         Threshold values to distinct the provided data into three frequency classes Low, Medium, High.
         e.g. Low =< 0.5; 0.5 < Medium =< 1; High > 1
 
+    method : {"expanded", "dense", "sparse"} = "expanded"
+        Computation of the statistics per key. "expanded" joins the input on a long DataFrame of
+        keys times periods. "dense" pivots the input into a (keys x periods) NumPy array indexed by
+        key codes and period offsets, which needs far less memory and time for many keys. "sparse"
+        only touches the periods with demand and accounts for the periods without demand
+        analytically, which is the fastest option for intermittent demand. "dense" and "sparse"
+        give the same results; they map dates to the period they fall into and do not consider
+        records outside of the period range.
+
+    filters : list of tuples = None
+        Filters of the input rows, e.g. [("country", "in", ["DE", "FR"])]. A parquet input reads
+        only the matching row groups and rows. See ``pyarrow.parquet.read_table``.
+
+    backend : {"pandas", "polars"} = "pandas"
+        "polars" runs the analysis as multi-threaded lazy polars queries and returns a polars.DataFrame
+        with the results of the "dense" and "sparse" methods, method is not used. The input may then
+        also be a polars DataFrame or LazyFrame or a pyarrow Table. Requires polars.
+
+    passthrough_dimensions : list of strings = None
+        Column names in the input DataFrame holding attributes of the primary_dimension_keys, e.g. a
+        product description, added to the output with their first value per key. All other columns
+        are left out before the aggregation.
+
     Returns
     -------
     df_return : Pandas.DataFrame
@@ -88,8 +122,6 @@ def xyz_analysis(
     >>> # post process sample data 
     >>> df = df.reset_index()
     >>> df = df.drop(columns=["Value", "index"])
-    >>> # shorten date format from YYYY-MM-DD to YYYY-MM
-    >>> df["Date"] = df["Date"].astype("str").str[:5] + df["Date"].astype("str").str[-2:]
     >>> # split key return from function create_time_series into three columns
     >>> df[["Material","Country", "Region"]] = df["Material"].str.split('-', expand=True)
     >>> # sort columns into more logical order
@@ -128,38 +160,259 @@ def xyz_analysis(
     >>> 3	561.583333	676.746959	        6	            1.205070	                0.500000                   Z	        Medium	        0459     18       00004
     >>> 4	327.333333	516.059780	        4	            1.576557	                0.333333                   Z	        Low             0498     16       00002
     """
-    # create key
-    if type(primary_dimension_keys)==list:
-        df["key"] = df[primary_dimension_keys].apply(lambda row: "~~~".join(row.values.astype(str)), axis=1)
-    elif type(primary_dimension_keys)==str:
-        df["key"] = df[primary_dimension_keys]
-      
+    if backend == "polars":
+        return _xyz_analysis_polars(
+            df,
+            primary_dimension_keys,
+            relevant_numeric_dimension,
+            relevant_date_dimension,
+            start_date,
+            periods,
+            frequency,
+            X,
+            Y,
+            L,
+            M,
+            filters,
+            passthrough_dimensions,
+        )
+    elif backend != "pandas":
+        raise ValueError("Backend expected: pandas or polars")
+
+    key_columns = [primary_dimension_keys] if isinstance(primary_dimension_keys, str) else list(primary_dimension_keys)
+    passthrough_dimensions = list(passthrough_dimensions or [])
+
+    # read only the needed column chunks and row groups of a parquet input
+    if isinstance(df, (str, os.PathLike)):
+        df = pd.read_parquet(
+            df,
+            columns=key_columns + [relevant_numeric_dimension, relevant_date_dimension] + passthrough_dimensions,
+            filters=filters,
+        )
+    elif filters is not None:
+        df = _filter_frame(df, filters)
+
+    # aggregate the needed columns only and join the passthrough dimensions at the end
+    df_passthrough = None
+    if passthrough_dimensions:
+        df_passthrough = (
+            df[key_columns + passthrough_dimensions]
+            .groupby(key_columns, sort=False, dropna=False)
+            .first()
+            .reset_index()
+        )
+    df = df[key_columns + [relevant_numeric_dimension, relevant_date_dimension]]
+
     # rename provided column names of input DataFrame
     d_columns = {
         relevant_numeric_dimension: "numeric_dimension",
         relevant_date_dimension: "Date"
     }
-    
+
     df = df.rename(columns=d_columns)
 
+    # encode key columns into one integer key column
+    codes, df_keys = _encode_keys(df, primary_dimension_keys)
+    df = df.drop(columns=df_keys.columns).assign(key=codes)
+
+    # statistical analysis as preparation for classification
+    if method == "expanded":
+        df_return = _expanded_statistics(df, start_date, periods, frequency)
+    elif method == "dense":
+        offsets = _period_offsets(df["Date"], start_date, periods, frequency)
+        matrix = _period_matrix(
+            df["key"].to_numpy(), offsets, df["numeric_dimension"], len(df_keys), periods
+        )
+        df_return = _dense_statistics(matrix)
+    elif method == "sparse":
+        offsets = _period_offsets(df["Date"], start_date, periods, frequency)
+        df_return = _sparse_statistics(
+            df["key"].to_numpy(), offsets, df["numeric_dimension"], len(df_keys), periods
+        )
+    else:
+        raise ValueError("Method expected: expanded, dense or sparse")
+
+    # classify variability & frequency
+    df_return = _classify_xyz(df_return, periods, X, Y, L, M)
+
+    # bring back inputed dimensions names for better understandable output
+    df_return[df_keys.columns.tolist()] = _decode_keys(df_return["key"], df_keys, index=df_return.index)
+    df_return = df_return.drop(columns="key")
+
+    if df_passthrough is not None:
+        df_return = df_return.merge(df_passthrough, on=key_columns, how="left")
+
+    return df_return
+
+
+def xyz_analysis_windows(
+    df,
+    primary_dimension_keys,
+    relevant_numeric_dimension,
+    relevant_date_dimension,
+    windows,
+    frequency,
+    X=0.5,
+    Y=1,
+    L=0.4,
+    M=0.7,
+    filters=None,
+):
+    """The XYZ Analysis for many period ranges (windows) at once, e.g. the last 6, 12 and 24 months or
+    rolling start dates.
+
+    The input is pivoted into one (keys x periods) array over all windows. Prefix sums of the values,
+    squared values and non-zero periods along the periods give the statistics of every window by
+    subtraction, so the cost after the pivot is one step per key and window. The results equal those
+    of ``xyz_analysis`` with method "dense" for every window, up to rounding errors, which are zero
+    for constant values.
+
+    Parameters
+    ----------
+    df, primary_dimension_keys, relevant_numeric_dimension, relevant_date_dimension, frequency, X, Y, L, M, filters
+        See ``xyz_analysis``.
+
+    windows : list of tuples
+        start_date and periods of every window, e.g. [("2021-07", 6), ("2021-01", 12), ("2020-01", 24)].
+
+    Returns
+    -------
+    df_return : Pandas.DataFrame
+        History of the classification with one row per window and key, the window is given by the
+        columns Start_Date (first period) and Periods.
+
+    Examples
+    --------
+    >>> import aio
+    >>> # last 6, 12 and 24 months up to December 2021
+    >>> windows = [(str(pd.Period("2021-12", freq="M") - periods + 1), periods) for periods in (6, 12, 24)]
+    >>> df_return = aio.xyz_analysis_windows(
+    >>>     df,
+    >>>     primary_dimension_keys=["Material"],
+    >>>     relevant_numeric_dimension="Quantity",
+    >>>     relevant_date_dimension="Date",
+    >>>     windows=windows,
+    >>>     frequency="M",
+    >>> )
+    """
+    key_columns = [primary_dimension_keys] if isinstance(primary_dimension_keys, str) else list(primary_dimension_keys)
+    columns = key_columns + [relevant_numeric_dimension, relevant_date_dimension]
+
+    # read only the needed column chunks and row groups of a parquet input
+    if isinstance(df, (str, os.PathLike)):
+        df = pd.read_parquet(df, columns=columns, filters=filters)
+    elif filters is not None:
+        df = _filter_frame(df, filters)
+    df = df[columns]
+
+    # first period and length of every window relative to the first period of all windows
+    start_periods = [pd.Period(start_date, freq=frequency) for start_date, _ in windows]
+    window_periods = np.array([periods for _, periods in windows], dtype=np.int64)
+    first_period = min(start_periods)
+    window_starts = np.array([period.ordinal - first_period.ordinal for period in start_periods], dtype=np.int64)
+    window_ends = window_starts + window_periods
+    total_periods = int(window_ends.max())
+
+    # pivot once over all windows
+    codes, df_keys = _encode_keys(df, key_columns)
+    offsets = _period_offsets(df[relevant_date_dimension], str(first_period), total_periods, frequency)
+    matrix = _period_matrix(codes, offsets, df[relevant_numeric_dimension], len(df_keys), total_periods)
+
+    # the values are shifted by their mean per key to keep the sums of squares small, which does not
+    # change the deviations
+    shifted = matrix - matrix.mean(axis=1, keepdims=True)
+    sums = _window_sums(matrix, window_starts, window_ends)
+    shifted_sums = _window_sums(shifted, window_starts, window_ends)
+    shifted_squares = _window_sums(shifted ** 2, window_starts, window_ends)
+    non_zero_counts = _window_sums(matrix > 0, window_starts, window_ends)
+
+    # sums of squared deviations within rounding error of the sums of squares are zero
+    m2 = shifted_squares - shifted_sums ** 2 / window_periods
+    m2 = np.where((shifted_squares > 0) & (m2 > 1e-10 * shifted_squares), m2, 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = m2 / (window_periods - 1)
+
+    # one row per window and key, window by window
+    num_keys, num_windows = sums.shape
+    df_return = pd.DataFrame()
+    df_return["Start_Date"] = np.repeat([str(period) for period in start_periods], num_keys)
+    df_return["Periods"] = np.repeat(window_periods, num_keys)
+    df_return["key"] = np.tile(np.arange(num_keys), num_windows)
+    df_return["Mean"] = (sums / window_periods).T.ravel()
+    df_return["Standard_Deviation"] = np.sqrt(variance).T.ravel()
+    df_return["Non_Zero_Count"] = non_zero_counts.T.ravel().astype(int)
+
+    # classify variability & frequency
+    df_return = _classify_xyz(df_return, df_return["Periods"], X, Y, L, M)
+
+    # bring back inputed dimensions names for better understandable output
+    df_return[df_keys.columns.tolist()] = _decode_keys(df_return["key"], df_keys, index=df_return.index)
+    df_return = df_return.drop(columns="key")
+
+    return df_return
+
+
+def _window_sums(matrix, window_starts, window_ends):
+    """Sums the periods of every window per key with prefix sums along the periods
+
+    Parameters
+    ----------
+    matrix : numpy.ndarray
+        Values per key (rows) and period (columns) as returned by ``_period_matrix``.
+
+    window_starts, window_ends : numpy.ndarray of int
+        First and behind last period offset of every window.
+
+    Returns
+    -------
+    sums : numpy.ndarray of float64
+        Sum of the values per key (rows) and window (columns).
+    """
+    prefix_sums = np.zeros((matrix.shape[0], matrix.shape[1] + 1))
+    np.cumsum(matrix, axis=1, out=prefix_sums[:, 1:])
+
+    return prefix_sums[:, window_ends] - prefix_sums[:, window_starts]
+
+
+def _expanded_statistics(df, start_date, periods, frequency):
+    """Calculates mean, standard deviation and non-zero count per key on a long DataFrame
+    expanded by keys times periods
+
+    Parameters
+    ----------
+    df : Pandas.DataFrame
+        DataFrame with columns key, Date and numeric_dimension.
+
+    start_date, periods, frequency
+        Period range as described in ``xyz_analysis``.
+
+    Returns
+    -------
+    df_return : Pandas.DataFrame
+        DataFrame with columns key, Mean, Standard_Deviation and Non_Zero_Count.
+    """
     # generate list of keys for df_expanded by periods times keys
     l_keys_in_df = (
         df["key"].unique().tolist()
-    )  # get a list of all the distinct keys from the input DataFrame    
-    
+    )  # get a list of all the distinct keys from the input DataFrame
+
     l_keys_in_df_x_periods = [[key] * periods for key in l_keys_in_df]
     l_keys = list(itertools.chain(*l_keys_in_df_x_periods))
-    
+
     # construct complete DataFrame for statistical analysis
     df_expanded = pd.DataFrame(l_keys, columns=["key"])
 
     # generate periods ("Date") Series by key times periods
     period_range = pd.period_range(start=start_date, periods=periods, freq=frequency)
     df_periods = pd.DataFrame(period_range.to_series(name="Date").astype(str).reset_index().drop(columns=["index"]))
-    
+
     # add ("Date") Series to df_expanded
     df_expanded["Date"] = pd.concat([df_periods ]*len(l_keys_in_df), ignore_index=True)
 
+    # periods (e.g. from create_time_series) are joined on their string representation
+    if isinstance(df["Date"].dtype, pd.PeriodDtype):
+        df = df.assign(Date=df["Date"].astype(str))
+
     # aggregate input DataFrame to deal with > 1 record per period
     df = df.groupby(["key","Date"]).sum()
 
@@ -173,7 +426,7 @@ def xyz_analysis(
     # statistical analysis as preparation for classification
     df_return = pd.DataFrame()
     df_return = (
-        df_expanded.groupby("key")
+        df_expanded.groupby("key")["numeric_dimension"]
         .agg(["mean", "std"])
         .reset_index()
         .rename(
@@ -184,9 +437,9 @@ def xyz_analysis(
         )
         .reset_index()
     )
-  
+
     df_return.columns = ["index", "key", "Mean", "Standard_Deviation"]
-    
+
     df_return = df_return.merge(
         df_expanded.groupby("key")["numeric_dimension"]
         .apply(lambda x: (x > 0).sum())
@@ -195,17 +448,194 @@ def xyz_analysis(
         right_on="key",
         how="outer",
     )
+    df_return = df_return.drop(columns=["index"])
+
+    return df_return
+
+
+def _period_offsets(dates, start_date, periods, frequency):
+    """Maps dates to integer offsets within the period range of the classification
+
+    Every distinct date is converted to a period once, so the cost is driven by the number
+    of distinct dates rather than the number of rows.
+
+    Parameters
+    ----------
+    dates : Pandas.Series
+        Dates as strings (e.g. "2020-01" or "2020-01-15"), datetimes or periods.
+
+    start_date, periods, frequency
+        Period range as described in ``xyz_analysis``. With periods = None the range has no end.
+
+    Returns
+    -------
+    offsets : numpy.ndarray of int64
+        Offset of the period of every date from the first period, -1 for missing dates and
+        dates outside of the period range.
+    """
+    date_codes, unique_dates = pd.factorize(dates)
+    first_period = pd.Period(start_date, freq=frequency)
+
+    if isinstance(unique_dates, pd.PeriodIndex):
+        unique_periods = unique_dates.to_timestamp().to_period(frequency)
+    elif isinstance(unique_dates, pd.DatetimeIndex):
+        unique_periods = unique_dates.to_period(frequency)
+    else:
+        unique_periods = pd.PeriodIndex(
+            [pd.Period(date, freq=frequency) for date in unique_dates], freq=frequency
+        )
+
+    unique_offsets = unique_periods.asi8 - first_period.ordinal
+    unique_offsets[unique_offsets < 0] = -1
+    if periods is not None:
+        unique_offsets[unique_offsets >= periods] = -1
+
+    offsets = np.append(unique_offsets, -1)[date_codes]
+
+    return offsets
+
+
+def _period_matrix(key_codes, offsets, values, num_keys, periods):
+    """Pivots records into a dense (keys x periods) array of summed values
+
+    Parameters
+    ----------
+    key_codes : numpy.ndarray of int
+        Key code of every record.
+
+    offsets : numpy.ndarray of int
+        Period offset of every record as returned by ``_period_offsets``. Records with an
+        offset of -1 are left out.
+
+    values : array-like of float
+        Numeric value of every record, missing values count as 0.
+
+    num_keys, periods : int
+        Shape of the returned array.
+
+    Returns
+    -------
+    matrix : numpy.ndarray of float64
+        Sum of the values per key (rows) and period (columns), 0 where there is no record.
+    """
+    in_range = offsets >= 0
+    cells = key_codes[in_range].astype(np.int64) * periods + offsets[in_range]
+    weights = np.nan_to_num(np.asarray(values, dtype=float)[in_range])
+
+    matrix = np.bincount(cells, weights=weights, minlength=num_keys * periods)
+
+    return matrix.reshape(num_keys, periods)
+
+
+def _dense_statistics(matrix):
+    """Calculates mean, sample standard deviation and non-zero count per row of a
+    (keys x periods) array
+
+    Parameters
+    ----------
+    matrix : numpy.ndarray
+        Values per key (rows) and period (columns) as returned by ``_period_matrix``.
+
+    Returns
+    -------
+    df_return : Pandas.DataFrame
+        DataFrame with columns key, Mean, Standard_Deviation and Non_Zero_Count.
+    """
+    df_return = pd.DataFrame()
+    df_return["key"] = np.arange(matrix.shape[0])
+    df_return["Mean"] = matrix.mean(axis=1)
+    df_return["Standard_Deviation"] = matrix.std(axis=1, ddof=1)
+    df_return["Non_Zero_Count"] = np.count_nonzero(matrix > 0, axis=1)
+
+    return df_return
+
+
+def _sparse_statistics(key_codes, offsets, values, num_keys, periods):
+    """Calculates mean, sample standard deviation and non-zero count per key from the
+    records with demand only
+
+    Periods without a record are implicit zeros. They add nothing to the sums but are
+    counted in the number of periods, so the results equal those of ``_dense_statistics``
+    without building the (keys x periods) array.
+
+    Parameters
+    ----------
+    key_codes : numpy.ndarray of int
+        Key code of every record.
+
+    offsets : numpy.ndarray of int
+        Period offset of every record as returned by ``_period_offsets``. Records with an
+        offset of -1 are left out.
+
+    values : array-like of float
+        Numeric value of every record, missing values count as 0.
+
+    num_keys, periods : int
+        Number of keys and periods the statistics are calculated for.
+
+    Returns
+    -------
+    df_return : Pandas.DataFrame
+        DataFrame with columns key, Mean, Standard_Deviation and Non_Zero_Count.
+    """
+    values = np.nan_to_num(np.asarray(values, dtype=float))
+    observed = (offsets >= 0) & (values != 0)
+    cells = key_codes[observed].astype(np.int64) * periods + offsets[observed]
+
+    # aggregate records to deal with > 1 record per key and period
+    cells, inverse = np.unique(cells, return_inverse=True)
+    cell_values = np.bincount(inverse, weights=values[observed], minlength=len(cells))
+    cell_keys = cells // periods
+
+    sums = np.bincount(cell_keys, weights=cell_values, minlength=num_keys)
+    counts = np.bincount(cell_keys, minlength=num_keys)
+    mean = sums / periods
+
+    # squared deviations of the observed periods plus those of the implicit zeros
+    squared_deviations = np.bincount(
+        cell_keys, weights=(cell_values - mean[cell_keys]) ** 2, minlength=num_keys
+    )
+    squared_deviations += (periods - counts) * mean ** 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = squared_deviations / (periods - 1)
+
+    df_return = pd.DataFrame()
+    df_return["key"] = np.arange(num_keys)
+    df_return["Mean"] = mean
+    df_return["Standard_Deviation"] = np.sqrt(variance)
+    df_return["Non_Zero_Count"] = np.bincount(
+        cell_keys, weights=cell_values > 0, minlength=num_keys
+    ).astype(int)
+
+    return df_return
+
+
+def _classify_xyz(df_return, periods, X, Y, L, M):
+    """Derives the coefficient of variation and the XYZ & frequency classes from the
+    statistics per key
+
+    Parameters
+    ----------
+    df_return : Pandas.DataFrame
+        DataFrame with columns Mean, Standard_Deviation and Non_Zero_Count.
+
+    periods : int
+        Number of periods the statistics are calculated for.
 
-#     df_return["Coefficient_of_Variation"] = (df_return["Standard_Deviation"]) / (
-#         df_return["Mean"]
-#     )
+    X, Y, L, M : float
+        Threshold values as described in ``xyz_analysis``.
 
+    Returns
+    -------
+    df_return : Pandas.DataFrame
+        Input DataFrame with the additional columns Coefficient_of_Variation,
+        Relative_Non_Zero_Period_Count, XYZ_Class and Frequency_Class.
+    """
     df_return["Coefficient_of_Variation"] = np.where(df_return["Mean"] <= 0, float("NaN") , (df_return["Standard_Deviation"]) / (
         df_return["Mean"]
     ))
     
     df_return["Relative_Non_Zero_Period_Count"] = df_return["Non_Zero_Count"] / periods
-    df_return = df_return.drop(columns=["index"])
 
     # prepare XYZ classification thresholds and classes
   
@@ -240,8 +670,4 @@ def xyz_analysis(
     # classify frequency
     df_return["Frequency_Class"] = np.select(class_thresholds_freq, class_values_freq)
 
-    # bring back inputed dimensions names for better understandable output
-    df_return[primary_dimension_keys] = df_return["key"].str.split("~~~", expand=True)
-    df_return = df_return.drop(columns="key")
-
-    return df_return
\ No newline at end of file
+    return df_return
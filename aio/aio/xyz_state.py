@@ -0,0 +1,320 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from .key_encoding import _encode_keys, _decode_keys
+from .xyz_analysis import _period_offsets, _classify_xyz
+
+
+class XYZState:
+    """Per-key state of the XYZ Analysis which is updated incrementally with new periods
+
+    The state holds the demand per key and period of the classification window together with
+    the count, sum, sum of squares, sum of squared deviations and non-zero count per key. New
+    batches of records only touch the keys and periods they contain; the moments of the touched
+    keys are recomputed from their demand per period, so no cancellation error builds up over
+    many updates and the XYZ & frequency classes can be re-derived without rescanning the
+    history. With ``rolling=True`` the window
+    moves forward when records of a newer period arrive and the oldest periods are dropped.
+
+    Parameters
+    ----------
+    primary_dimension_keys : string or list of strings
+        Column name(s) holding the object(s) to be classified, see ``xyz_analysis``.
+
+    relevant_numeric_dimension : string
+        Column name holding the numeric values to be used for classification.
+
+    relevant_date_dimension : string
+        Column name holding the dates to the relevant_numeric_dimension values.
+
+    start_date : string
+        Start date of the classification window in format YYYY-MM or YYYY-MM-DD.
+
+    periods : int
+        Number of periods of the classification window.
+
+    frequency : string
+        Frequency of the periods, e.g. "D" for days, "W" for weeks, "M" for months.
+
+    rolling : bool = False
+        If True, records after the end of the window move the window forward. Otherwise
+        records outside of the window are not considered, as in ``xyz_analysis``.
+
+    Examples
+    --------
+    >>> import aio
+    >>> state = aio.XYZState(
+    >>>     primary_dimension_keys=["Material", "Plant"],
+    >>>     relevant_numeric_dimension="Quantity",
+    >>>     relevant_date_dimension="Date",
+    >>>     start_date="2020-01",
+    >>>     periods=12,
+    >>>     frequency="M",
+    >>>     rolling=True,
+    >>> )
+    >>> state.update(df_history)
+    >>> state.save("xyz_state.parquet")
+    >>> # next night
+    >>> state = aio.XYZState.load("xyz_state.parquet")
+    >>> state.update(df_new_period)
+    >>> result = state.classify()
+    """
+
+    def __init__(
+        self,
+        primary_dimension_keys,
+        relevant_numeric_dimension,
+        relevant_date_dimension,
+        start_date,
+        periods,
+        frequency,
+        rolling=False,
+    ):
+        if isinstance(primary_dimension_keys, str):
+            primary_dimension_keys = [primary_dimension_keys]
+
+        self.primary_dimension_keys = list(primary_dimension_keys)
+        self.relevant_numeric_dimension = relevant_numeric_dimension
+        self.relevant_date_dimension = relevant_date_dimension
+        self.periods = periods
+        self.frequency = frequency
+        self.rolling = rolling
+        self.start_period = pd.Period(start_date, freq=frequency)
+
+        # demand per key and period, the period with offset p is stored in column p % periods
+        self.df_keys = pd.DataFrame(columns=self.primary_dimension_keys)
+        self.values = np.zeros((0, periods))
+        self.sums = np.zeros(0)
+        self.sums_of_squares = np.zeros(0)
+        self.m2 = np.zeros(0)
+        self.non_zero_count = np.zeros(0, dtype=np.int64)
+        self._start_offset = 0
+
+    @property
+    def count(self):
+        """Number of periods every key is classified on"""
+        return self.periods
+
+    @property
+    def mean(self):
+        """Mean demand per key over the window"""
+        return self.sums / self.count
+
+    @property
+    def end_period(self):
+        """Last period of the classification window"""
+        return self.start_period + (self.periods - 1)
+
+    def update(self, df):
+        """Adds a batch of records to the state
+
+        Records of periods which are already part of the window are added to the demand of
+        those periods. Records outside of the window are not considered, but their keys are
+        added to the state without demand, as in ``xyz_analysis``.
+
+        Parameters
+        ----------
+        df : Pandas.DataFrame
+            DataFrame holding the primary_dimension_keys, relevant_numeric_dimension and
+            relevant_date_dimension columns.
+
+        Returns
+        -------
+        self : XYZState
+        """
+        key_codes = self._register_keys(df)
+        offsets = _period_offsets(
+            df[self.relevant_date_dimension],
+            self.start_period - self._start_offset,
+            None,
+            self.frequency,
+        )
+        in_window = offsets >= self._start_offset
+        if self.rolling:
+            if in_window.any():
+                self._move_window(offsets[in_window].max() - self.periods + 1)
+            in_window = offsets >= self._start_offset
+        else:
+            in_window &= offsets < self._start_offset + self.periods
+        if not in_window.any():
+            return self
+
+        df = df[in_window]
+        offsets = offsets[in_window]
+        key_codes = key_codes[in_window]
+
+        # aggregate the batch per key and touched period
+        touched, columns = np.unique(offsets % self.periods, return_inverse=True)
+        batch = np.zeros((len(self.df_keys), len(touched)))
+        np.add.at(
+            batch,
+            (key_codes, columns),
+            np.nan_to_num(df[self.relevant_numeric_dimension].to_numpy(dtype=float)),
+        )
+
+        self.values[:, touched] += batch
+        self._recompute_moments(np.unique(key_codes))
+
+        return self
+
+    def classify(self, X=0.5, Y=1, L=0.4, M=0.7):
+        """Derives the XYZ & frequency classes from the state
+
+        Parameters
+        ----------
+        X, Y, L, M : float = 0.5, 1, 0.4, 0.7
+            Threshold values as described in ``xyz_analysis``.
+
+        Returns
+        -------
+        df_return : Pandas.DataFrame
+            Same columns as returned by ``xyz_analysis``, one row per key.
+        """
+        order = self.df_keys.sort_values(self.primary_dimension_keys).index.to_numpy()
+
+        df_return = pd.DataFrame()
+        df_return["key"] = order
+        df_return["Mean"] = self.mean[order]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            df_return["Standard_Deviation"] = np.sqrt(self.m2[order] / (self.count - 1))
+        df_return["Non_Zero_Count"] = self.non_zero_count[order]
+
+        df_return = _classify_xyz(df_return, self.periods, X, Y, L, M)
+
+        df_return[self.primary_dimension_keys] = _decode_keys(
+            df_return["key"], self.df_keys, index=df_return.index
+        )
+        df_return = df_return.drop(columns="key")
+
+        return df_return
+
+    def save(self, path):
+        """Writes the state to a parquet file
+
+        Parameters
+        ----------
+        path : str or path object
+            Path of the parquet file.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        df = self.df_keys.reset_index(drop=True).copy()
+        window = self._window()
+        for i in range(self.periods):
+            df[str(self.start_period + i)] = window[:, i]
+        df["Sum"] = self.sums
+        df["Sum_of_Squares"] = self.sums_of_squares
+        df["M2"] = self.m2
+        df["Non_Zero_Count"] = self.non_zero_count
+
+        metadata = {
+            "primary_dimension_keys": self.primary_dimension_keys,
+            "relevant_numeric_dimension": self.relevant_numeric_dimension,
+            "relevant_date_dimension": self.relevant_date_dimension,
+            "start_date": str(self.start_period),
+            "periods": self.periods,
+            "frequency": self.frequency,
+            "rolling": self.rolling,
+        }
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), b"aio.xyz_state": json.dumps(metadata).encode()}
+        )
+        pq.write_table(table, str(path))
+
+    @classmethod
+    def load(cls, path):
+        """Reads a state written by ``XYZState.save``
+
+        Parameters
+        ----------
+        path : str or path object
+            Path of the parquet file.
+
+        Returns
+        -------
+        state : XYZState
+        """
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(str(path))
+        metadata = json.loads(table.schema.metadata[b"aio.xyz_state"])
+        df = table.to_pandas()
+
+        state = cls(**metadata)
+        state.df_keys = df[state.primary_dimension_keys].reset_index(drop=True)
+        state.values = df[[str(state.start_period + i) for i in range(state.periods)]].to_numpy(
+            dtype=float
+        )
+        state.sums = df["Sum"].to_numpy(dtype=float)
+        state.sums_of_squares = df["Sum_of_Squares"].to_numpy(dtype=float)
+        state.m2 = df["M2"].to_numpy(dtype=float)
+        state.non_zero_count = df["Non_Zero_Count"].to_numpy(dtype=np.int64)
+
+        return state
+
+    def _window(self):
+        """Returns the demand per key and period in chronological order"""
+        return np.roll(self.values, -(self._start_offset % self.periods), axis=1)
+
+    def _register_keys(self, df):
+        """Returns the state's key codes of the records and adds unseen keys to the state"""
+        codes, df_batch_keys = _encode_keys(df, self.primary_dimension_keys)
+
+        df_known = self.df_keys.assign(_state_code=np.arange(len(self.df_keys)))
+        df_batch_keys = df_batch_keys.merge(df_known, how="left", on=self.primary_dimension_keys)
+        state_codes = df_batch_keys["_state_code"].to_numpy(dtype=float)
+        unseen = np.isnan(state_codes)
+
+        # unseen keys are appended in the order of the batch
+        num_unseen = int(unseen.sum())
+        state_codes = np.where(unseen, len(self.df_keys) + np.cumsum(unseen) - 1, state_codes)
+        if num_unseen:
+            df_unseen_keys = df_batch_keys.loc[unseen, self.primary_dimension_keys]
+            if len(self.df_keys):
+                self.df_keys = pd.concat([self.df_keys, df_unseen_keys], ignore_index=True)
+            else:
+                self.df_keys = df_unseen_keys.reset_index(drop=True)
+            # unseen keys had no demand in any period of the window
+            self.values = np.vstack([self.values, np.zeros((num_unseen, self.periods))])
+            self.sums = np.append(self.sums, np.zeros(num_unseen))
+            self.sums_of_squares = np.append(self.sums_of_squares, np.zeros(num_unseen))
+            self.m2 = np.append(self.m2, np.zeros(num_unseen))
+            self.non_zero_count = np.append(self.non_zero_count, np.zeros(num_unseen, dtype=np.int64))
+
+        return state_codes.astype(np.int64)[codes]
+
+    def _move_window(self, start_offset):
+        """Moves the window forward so that it starts at the given period offset"""
+        shift = min(start_offset - self._start_offset, self.periods)
+        if shift <= 0:
+            return
+
+        # the dropped periods are replaced by new periods without demand, only the keys with
+        # demand in the dropped periods change
+        dropped = (self._start_offset + np.arange(shift)) % self.periods
+        touched = np.flatnonzero((self.values[:, dropped] != 0).any(axis=1))
+        self.values[:, dropped] = 0
+        self._recompute_moments(touched)
+
+        self.start_period += start_offset - self._start_offset
+        self._start_offset = start_offset
+
+    def _recompute_moments(self, rows):
+        """Recomputes the moments of the given keys from their demand per period"""
+        block = self.values[rows]
+        _, _, self.m2[rows] = _moments(block)
+        self.sums[rows] = block.sum(axis=1)
+        self.sums_of_squares[rows] = (block ** 2).sum(axis=1)
+        self.non_zero_count[rows] = np.count_nonzero(block > 0, axis=1)
+
+
+def _moments(block):
+    """Returns count, mean and sum of squared deviations per row of a (keys x periods) array"""
+    count = block.shape[1]
+    mean = block.mean(axis=1) if count else np.zeros(block.shape[0])
+    m2 = ((block - mean[:, None]) ** 2).sum(axis=1)
+    return count, mean, m2
@@ -0,0 +1,131 @@
+import pytest
+import numpy as np
+import pandas as pd
+import aio
+
+
+def _sample_data(num_rows, num_segments, num_products=50):
+    np.random.seed(seed=0)
+    df = pd.DataFrame()
+    df["Product"] = np.random.randint(num_products, size=num_rows).astype(str)
+    df["Country"] = np.random.randint(num_segments, size=num_rows).astype(str)
+    df["Quantity"] = np.random.randint(1000, size=num_rows)
+    return df
+
+
+def test_abc_analysis_10k_segments(benchmark):
+    df = _sample_data(num_rows=200_000, num_segments=10_000)
+
+    results = benchmark(
+        aio.abc_analysis,
+        df,
+        primary_dimension="Product",
+        secondary_dimensions=["Country"],
+        numeric_dimension="Quantity",
+    )
+
+    assert results["Country"].nunique() == 10_000
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2, 4, -1])
+def test_abc_analysis_n_jobs(benchmark, n_jobs):
+    df = _sample_data(num_rows=2_000_000, num_segments=10_000, num_products=2000)
+
+    benchmark.pedantic(
+        aio.abc_analysis,
+        args=(df,),
+        kwargs=dict(
+            primary_dimension="Product",
+            secondary_dimensions=["Country"],
+            numeric_dimension="Quantity",
+            n_jobs=n_jobs,
+        ),
+        rounds=3,
+    )
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_abc_analysis(measure, time_series, backend):
+    if backend == "polars":
+        pytest.importorskip("polars")
+
+    results = measure(
+        aio.abc_analysis,
+        time_series[["Material", "Country", "Quantity"]],
+        primary_dimension="Material",
+        secondary_dimensions=["Country"],
+        numeric_dimension="Quantity",
+        backend=backend,
+        input_bytes=time_series.memory_usage(deep=True).sum(),
+        memory_factor=4,
+    )
+
+    assert len(set(results["Material"])) == time_series["Material"].nunique()
+
+
+def test_abc_analysis_parquet(measure, time_series, tmp_path_factory):
+    path = tmp_path_factory.mktemp("abc") / "time_series.parquet"
+    time_series.to_parquet(path, row_group_size=100_000)
+
+    measure(
+        aio.abc_analysis_parquet,
+        path,
+        primary_dimension="Material",
+        secondary_dimensions=["Country"],
+        numeric_dimension="Quantity",
+        batch_size=1_000_000,
+        input_bytes=time_series.memory_usage(deep=True).sum(),
+        memory_factor=2,
+    )
+
+
+def test_abc_analysis_50_columns(measure, wide_time_series):
+    results = measure(
+        aio.abc_analysis,
+        wide_time_series,
+        primary_dimension="Material",
+        secondary_dimensions=["Country"],
+        numeric_dimension="Quantity",
+        passthrough_dimensions=["Description"],
+        input_bytes=wide_time_series[["Material", "Country", "Quantity", "Description"]]
+        .memory_usage(deep=True)
+        .sum(),
+        memory_factor=4,
+    )
+
+    assert results.shape[1] == 9
+
+
+def test_abc_analysis_sweep_20_scenarios(measure, time_series):
+    thresholds = [(A, B) for A in np.linspace(0.6, 0.85, 5) for B in np.linspace(0.9, 0.99, 4)]
+
+    results = measure(
+        aio.abc_analysis_sweep,
+        time_series[["Material", "Country", "Quantity"]],
+        primary_dimension="Material",
+        secondary_dimensions=["Country"],
+        numeric_dimension="Quantity",
+        thresholds=thresholds,
+        output="wide",
+        input_bytes=time_series.memory_usage(deep=True).sum(),
+        memory_factor=4,
+    )
+
+    assert results.shape[1] == 7 + 20
+
+
+def test_abc_analysis_3_numeric_dimensions(measure, time_series):
+    df = time_series[["Material", "Country", "Quantity"]].assign(
+        Revenue=time_series["Quantity"] * 2.5, Order_Lines=1
+    )
+    results = measure(
+        aio.abc_analysis,
+        df,
+        primary_dimension="Material",
+        secondary_dimensions=["Country"],
+        numeric_dimension=["Quantity", "Revenue", "Order_Lines"],
+        input_bytes=df.memory_usage(deep=True).sum(),
+        memory_factor=4,
+    )
+
+    assert {"Class_Quantity", "Class_Revenue", "Class_Order_Lines"} <= set(results.columns)
@@ -0,0 +1,20 @@
+import aio
+
+
+def test_abc_xyz_analysis(measure, time_series):
+    df = time_series[["Material", "Country", "Date", "Quantity"]]
+    results = measure(
+        aio.abc_xyz_analysis,
+        df,
+        primary_dimension_keys=["Material", "Country"],
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        start_date="2020-01-01",
+        periods=100,
+        frequency="D",
+        secondary_dimensions=["Country"],
+        input_bytes=df.memory_usage(deep=True).sum(),
+        memory_factor=4,
+    )
+
+    assert len(results) == len(df[["Material", "Country"]].drop_duplicates())
@@ -0,0 +1,31 @@
+import pytest
+
+import aio
+
+NUM_SECRETS = 100
+
+
+@pytest.fixture
+def vault(monkeypatch):
+    """Local vault with NUM_SECRETS secrets and a round trip of 1 ms, outside of Databricks and DevOps"""
+    monkeypatch.delenv("SYSTEM_JOBID", raising=False)
+    monkeypatch.setattr(aio.azure_key_vault, "_secret_clients", {})
+    aio.vault_invalidate_secret()
+    secrets = {"secret-{}".format(i): "value-{}".format(i) for i in range(NUM_SECRETS)}
+    aio._vault_set_client("local-vault", aio._LocalSecretClient(secrets, delay=0.001))
+    yield secrets
+    aio.vault_invalidate_secret()
+
+
+@pytest.mark.parametrize("ttl", [0, 300])
+def test_vault_get_secret(measure, vault, ttl):
+    secret = measure(aio.vault_get_secret, "local-vault", "secret-0", ttl=ttl, memory_factor=0)
+
+    assert secret == "value-0"
+
+
+@pytest.mark.parametrize("ttl", [0, 300])
+def test_vault_get_secrets(measure, vault, ttl):
+    secrets = measure(aio.vault_get_secrets, "local-vault", list(vault), ttl=ttl, memory_factor=0)
+
+    assert secrets == vault
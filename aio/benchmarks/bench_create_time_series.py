@@ -0,0 +1,40 @@
+import pytest
+
+import aio
+from conftest import SCALES
+
+
+def test_create_time_series_batch(measure, scale):
+    num_materials = SCALES[scale]["num_materials"]
+    num_periods = SCALES[scale]["num_periods"]
+
+    df = measure(
+        aio.create_time_series_batch,
+        num_materials=num_materials,
+        distribution="normal",
+        p_mean=1000,
+        p_std=300,
+        num_periods=num_periods,
+        intermittency=0.2,
+        random_state=0,
+        input_bytes=num_materials * num_periods * 8,
+        memory_factor=8,
+    )
+
+    assert len(df) == num_materials * num_periods
+
+
+@pytest.mark.parametrize("num_periods", [365, 36_500])
+def test_create_time_series(measure, num_periods):
+    df = measure(
+        aio.create_time_series,
+        distribution="poisson",
+        p_mean=10,
+        num_periods=num_periods,
+        periodicity="D",
+        intermittency=0.2,
+        input_bytes=num_periods * 8,
+        memory_factor=16,
+    )
+
+    assert len(df) == num_periods
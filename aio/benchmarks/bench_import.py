@@ -0,0 +1,29 @@
+import os
+import subprocess
+import sys
+
+# the subprocesses import aio from the folder of the benchmarks' pythonpath, see pytest.ini
+AIO_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code):
+    pythonpath = os.pathsep.join(filter(None, [AIO_PATH, os.environ.get("PYTHONPATH")]))
+    env = dict(os.environ, SYSTEM_JOBID="1", MY_KEY="secret", PYTHONPATH=pythonpath)
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+
+def test_import_aio(benchmark):
+    benchmark.pedantic(_run, args=("import aio",), rounds=10)
+
+
+def test_import_aio_and_vault_get_secret(benchmark):
+    code = (
+        "import sys, aio; "
+        "aio.vault_get_secret('scope', 'my-key'); "
+        "assert not {'pandas', 'scipy'} & set(sys.modules)"
+    )
+    benchmark.pedantic(_run, args=(code,), rounds=10)
+
+
+def test_import_aio_and_abc_analysis(benchmark):
+    benchmark.pedantic(_run, args=("import aio; aio.abc_analysis",), rounds=10)
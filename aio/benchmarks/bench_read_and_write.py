@@ -0,0 +1,98 @@
+import pandas as pd
+import pytest
+import aio
+
+
+@pytest.fixture(scope="module")
+def csv_file(time_series, tmp_path_factory):
+    path = tmp_path_factory.mktemp("csv") / "time_series.csv"
+    time_series.to_csv(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize("engine", ["python", "c", "pyarrow"])
+def test_read_and_write(measure, csv_file, scale, engine, tmp_path):
+    if engine == "python" and scale == "10M":
+        pytest.skip("the python engine is too slow for 10M rows")
+
+    measure(
+        aio.read_and_write,
+        csv_file.name,
+        csv_file.parent,
+        tmp_path,
+        to="parquet",
+        engine=engine,
+        input_bytes=csv_file.stat().st_size,
+        memory_factor=None if engine == "pyarrow" else 20,
+    )
+
+
+def test_read_and_write_chunksize(measure, csv_file, tmp_path):
+    measure(
+        aio.read_and_write,
+        csv_file.name,
+        csv_file.parent,
+        tmp_path,
+        to="parquet",
+        engine="c",
+        chunksize=100_000,
+        input_bytes=csv_file.stat().st_size,
+        memory_factor=4,
+    )
+
+
+@pytest.mark.parametrize("backend", ["pandas", "pyarrow"])
+def test_read_and_concat(measure, time_series, tmp_path_factory, backend):
+    folder = tmp_path_factory.mktemp("concat")
+    file_names = []
+    for i in range(4):
+        file_names.append(folder / "part_{}.parquet".format(i))
+        time_series.iloc[i::4].astype(str).to_parquet(file_names[-1])
+
+    results = measure(
+        aio.read_and_concat,
+        file_names,
+        backend=backend,
+        input_bytes=time_series.astype(str).memory_usage(deep=True).sum(),
+        memory_factor=4,
+    )
+
+    assert len(results) == len(time_series)
+
+
+def test_read_and_write_all(measure, csv_file, tmp_path_factory):
+    folder = tmp_path_factory.mktemp("all")
+    for i in range(4):
+        (folder / "part_{}.csv".format(i)).write_bytes(csv_file.read_bytes())
+
+    measure(
+        aio.read_and_write_all,
+        str(folder),
+        to="parquet",
+        write_directory=str(tmp_path_factory.mktemp("all_out")),
+    )
+
+
+@pytest.fixture(scope="module")
+def excel_file(time_series, tmp_path_factory):
+    """time_series in 4 sheets of 10k rows at most, writing larger workbooks takes minutes"""
+    path = tmp_path_factory.mktemp("excel") / "time_series.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        for i in range(4):
+            time_series.iloc[i * 10_000:(i + 1) * 10_000].to_excel(writer, sheet_name="Sheet{}".format(i), index=False)
+    return path
+
+
+def test_read_all_sheets(measure, excel_file, tmp_path):
+    list_of_dfs = measure(
+        aio.read_all_sheets,
+        excel_file.name,
+        excel_file.parent,
+        tmp_path,
+        save_by="time_series",
+        to="parquet",
+        input_bytes=excel_file.stat().st_size,
+        memory_factor=200,
+    )
+
+    assert len(list_of_dfs) == 4
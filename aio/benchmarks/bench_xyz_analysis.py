@@ -0,0 +1,96 @@
+import pytest
+import pandas as pd
+import aio
+
+
+@pytest.mark.parametrize(
+    "method, backend",
+    [("expanded", "pandas"), ("dense", "pandas"), ("sparse", "pandas"), ("sparse", "polars")],
+)
+def test_xyz_analysis(measure, time_series, scale, method, backend):
+    if method == "expanded" and scale == "10M":
+        pytest.skip("the expanded method is too slow for 10M rows")
+    if backend == "polars":
+        pytest.importorskip("polars")
+
+    df = time_series[["Material", "Date", "Quantity"]]
+    results = measure(
+        aio.xyz_analysis,
+        df,
+        primary_dimension_keys=["Material"],
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        start_date="2020-01-01",
+        periods=100,
+        frequency="D",
+        method=method,
+        backend=backend,
+        input_bytes=df.memory_usage(deep=True).sum(),
+        memory_factor=20 if method == "expanded" else 4,
+    )
+
+    assert len(results) == df["Material"].nunique()
+
+
+def test_xyz_state_update(measure, time_series):
+    df = time_series[["Material", "Date", "Quantity"]]
+
+    def update_and_classify():
+        state = aio.XYZState(
+            primary_dimension_keys=["Material"],
+            relevant_numeric_dimension="Quantity",
+            relevant_date_dimension="Date",
+            start_date="2020-01-01",
+            periods=100,
+            frequency="D",
+        )
+        state.update(df)
+        return state.classify()
+
+    measure(
+        update_and_classify,
+        input_bytes=df.memory_usage(deep=True).sum(),
+        memory_factor=4,
+    )
+
+
+def test_xyz_analysis_50_columns(measure, wide_time_series):
+    results = measure(
+        aio.xyz_analysis,
+        wide_time_series,
+        primary_dimension_keys=["Material"],
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        start_date="2020-01-01",
+        periods=100,
+        frequency="D",
+        method="dense",
+        passthrough_dimensions=["Description"],
+        input_bytes=wide_time_series[["Material", "Date", "Quantity", "Description"]]
+        .memory_usage(deep=True)
+        .sum(),
+        memory_factor=4,
+    )
+
+    assert results.shape[1] == 9
+
+
+def test_xyz_analysis_windows(measure, time_series):
+    df = time_series[["Material", "Date", "Quantity"]]
+    # rolling 30 day windows and the whole range
+    windows = [(str(pd.Period("2020-01-01", freq="D") + start), 30) for start in range(0, 70, 7)]
+    windows.append(("2020-01-01", 100))
+
+    results = measure(
+        aio.xyz_analysis_windows,
+        df,
+        primary_dimension_keys=["Material"],
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        windows=windows,
+        frequency="D",
+        input_bytes=df.memory_usage(deep=True).sum(),
+        memory_factor=6,
+    )
+
+    assert len(results) == len(windows) * df["Material"].nunique()
@@ -0,0 +1,104 @@
+"""
+Benchmarks of the public functions of aio
+
+The benchmarks run with pytest-benchmark (pip install -e "aio[bench]")
+on synthetic data of create_time_series_batch at the scales 1k, 100k and
+10M rows (10, 1000 and 100k keys). Save a baseline before a change and compare against it
+afterwards, the comparison fails when the mean time regresses by more
+than 20 %:
+
+    pytest benchmarks --benchmark-autosave
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:20%
+
+The 10M rows scale only runs with the environment variable
+AIO_BENCHMARK_LARGE=1. Every benchmark records the peak memory traced by
+tracemalloc as extra_info and fails when it exceeds its memory budget.
+Memory allocated by pyarrow is not traced.
+
+pytest.ini puts the aio folder on the python path (pytest >= 7), so the
+benchmarks import the aio package next to them without installing it, from
+the benchmarks folder or with pytest -c benchmarks/pytest.ini.
+"""
+import os
+import tracemalloc
+
+import numpy as np
+import pytest
+
+import aio
+
+SCALES = {
+    "1k": dict(num_materials=10, num_periods=100, rounds=20),
+    "100k": dict(num_materials=1000, num_periods=100, rounds=5),
+    "10M": dict(num_materials=100_000, num_periods=100, rounds=1),
+}
+
+# allocations of imports, caches and small intermediate results
+MEMORY_OVERHEAD = 64 * 2**20
+
+
+@pytest.fixture(scope="session", params=list(SCALES))
+def scale(request):
+    if request.param == "10M" and os.environ.get("AIO_BENCHMARK_LARGE") != "1":
+        pytest.skip("10M rows scale runs with AIO_BENCHMARK_LARGE=1")
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def time_series(scale):
+    """Daily time series with the columns Material, Country, Date and Quantity"""
+    num_materials = SCALES[scale]["num_materials"]
+    num_periods = SCALES[scale]["num_periods"]
+    df = aio.create_time_series_batch(
+        num_materials=num_materials,
+        distribution="poisson",
+        p_mean=10,
+        num_periods=num_periods,
+        periodicity="D",
+        intermittency=0.3,
+        random_state=0,
+    )
+    df["Country"] = np.repeat(np.arange(num_materials) % 20, num_periods).astype(str)
+    return df[["Material", "Country", "Date", "Quantity"]]
+
+
+@pytest.fixture(scope="session")
+def wide_time_series(time_series):
+    """time_series with 50 columns, e.g. an ERP extract, the extra columns are not needed by the analyses"""
+    rng = np.random.default_rng(0)
+    extra_columns = {}
+    for i in range(23):
+        extra_columns["Attribute_{:02d}".format(i)] = rng.choice(["a", "b", "c", "d"], size=len(time_series))
+        extra_columns["Figure_{:02d}".format(i)] = rng.random(len(time_series))
+    extra_columns["Description"] = "Material " + time_series["Material"]
+    return time_series.assign(**extra_columns)
+
+
+@pytest.fixture
+def measure(benchmark, request):
+    """Benchmarks a function and checks its peak memory
+
+    The peak memory of one run is ``input_bytes * memory_factor`` at most, plus a fixed
+    overhead.
+    """
+    scale = request.getfixturevalue("scale") if "scale" in request.fixturenames else "100k"
+
+    def run(func, *args, input_bytes=0, memory_factor=None, **kwargs):
+        tracemalloc.start()
+        try:
+            result = func(*args, **kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        benchmark.extra_info["peak_memory_mb"] = round(peak / 2**20, 2)
+        if memory_factor is not None:
+            budget = MEMORY_OVERHEAD + memory_factor * input_bytes
+            assert peak <= budget, "peak memory of {:.1f} MB exceeds the budget of {:.1f} MB".format(
+                peak / 2**20, budget / 2**20
+            )
+
+        benchmark.pedantic(func, args=args, kwargs=kwargs, rounds=SCALES[scale]["rounds"])
+        return result
+
+    return run
@@ -42,4 +42,8 @@ setuptools.setup(
         "scipy",
         "openpyxl",
     ],
+    extras_require={
+        "polars": ["polars>=1.24"],
+        "bench": ["pytest>=7", "pytest-benchmark"],
+    },
 )
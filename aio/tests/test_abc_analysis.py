@@ -1,6 +1,7 @@
 import numpy as np
 import aio
 import pandas as pd
+import pytest
 
 
 def test_abc_analysis_w_multiple_dimensions():
@@ -52,3 +53,329 @@ def test_abc_analysis_wo_additional_dimensions():
     )
 
     assert len(results)
+
+
+def test_abc_analysis_totals_per_secondary_dimension():
+    # create sample data with many small secondary dimension segments
+    np.random.seed(seed=0)
+    df = pd.DataFrame()
+    df["Product"] = ["{:04d}".format(i) for i in np.random.randint(20, size=5000)]
+    df["Country"] = ["{:03d}".format(i) for i in np.random.randint(500, size=5000)]
+    df["Quantity"] = np.random.randint(1, 1000, size=5000)
+
+    results = aio.abc_analysis(
+        df,
+        primary_dimension="Product",
+        secondary_dimensions=["Country"],
+        numeric_dimension="Quantity",
+    )
+
+    totals = df.groupby("Country")["Quantity"].sum()
+    assert (results["Cumsum_Sec_Dim"] == results["Country"].map(totals)).all()
+    last_per_segment = results.groupby("Country")["Cumsum_Relative_Quantity"].last()
+    assert np.allclose(last_per_segment, 1)
+
+
+def test_abc_analysis_separator_in_secondary_dimensions():
+    df = pd.DataFrame()
+    df["Product"] = ["0001", "0002", "0001", "0002"]
+    df["Country"] = ["DE-North", "DE-North", "DE", "DE"]
+    df["Region"] = ["01", "01", "North-01", "North-01"]
+    df["Quantity"] = [10, 30, 5, 1]
+
+    results = aio.abc_analysis(
+        df,
+        primary_dimension="Product",
+        secondary_dimensions=["Country", "Region"],
+        numeric_dimension="Quantity",
+    )
+
+    assert len(results) == 4
+    assert set(zip(results["Country"], results["Region"])) == {
+        ("DE-North", "01"),
+        ("DE", "North-01"),
+    }
+    assert (results["Cumsum_Sec_Dim"] == [40, 40, 6, 6]).all()
+
+
+def test_abc_analysis_parquet(tmp_path):
+    np.random.seed(seed=0)
+    df = pd.DataFrame()
+    df["Product"] = ["{:04d}".format(i) for i in np.random.randint(15, size=1000)]
+    df["Country"] = ["{:03d}".format(i) for i in np.random.randint(4, size=1000)]
+    df["Description"] = "not needed for the classification"
+    df["Quantity"] = np.random.randint(1000, size=1000)
+    # write a folder of parquet files with small row groups
+    df.iloc[:600].to_parquet(tmp_path / "py_part_0.parquet", row_group_size=100)
+    df.iloc[600:].to_parquet(tmp_path / "py_part_1.parquet", row_group_size=100)
+
+    results = aio.abc_analysis_parquet(
+        tmp_path,
+        primary_dimension="Product",
+        secondary_dimensions=["Country"],
+        numeric_dimension="Quantity",
+        batch_size=50,
+    )
+    expected = aio.abc_analysis(
+        df[["Product", "Country", "Quantity"]],
+        primary_dimension="Product",
+        secondary_dimensions=["Country"],
+        numeric_dimension="Quantity",
+    )
+
+    pd.testing.assert_frame_equal(
+        results.sort_values(["Country", "Product"]).reset_index(drop=True),
+        expected.sort_values(["Country", "Product"]).reset_index(drop=True),
+    )
+
+
+def test_abc_analysis_parquet_path_with_filters(tmp_path):
+    np.random.seed(seed=0)
+    df = pd.DataFrame()
+    df["Product"] = ["{:04d}".format(i) for i in np.random.randint(15, size=1000)]
+    df["Country"] = ["{:03d}".format(i) for i in np.random.randint(4, size=1000)]
+    df["Description"] = "not needed for the classification"
+    df["Quantity"] = np.random.randint(1000, size=1000)
+    df.to_parquet(tmp_path / "data.parquet", row_group_size=100)
+
+    results = aio.abc_analysis(
+        tmp_path / "data.parquet",
+        primary_dimension="Product",
+        secondary_dimensions=["Country"],
+        numeric_dimension="Quantity",
+        filters=[("Country", "in", ["000", "001"])],
+    )
+    expected = aio.abc_analysis(
+        df.loc[df["Country"].isin(["000", "001"]), ["Product", "Country", "Quantity"]],
+        primary_dimension="Product",
+        secondary_dimensions=["Country"],
+        numeric_dimension="Quantity",
+    )
+
+    pd.testing.assert_frame_equal(results, expected)
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_abc_analysis_dataframe_with_filters(backend):
+    if backend == "polars":
+        pl = pytest.importorskip("polars")
+    np.random.seed(seed=0)
+    df = pd.DataFrame()
+    df["Product"] = ["{:04d}".format(i) for i in np.random.randint(15, size=1000)]
+    df["Country"] = ["{:03d}".format(i) for i in np.random.randint(4, size=1000)]
+    df["Quantity"] = np.random.randint(1000, size=1000)
+    parameters = dict(primary_dimension="Product", secondary_dimensions=["Country"], numeric_dimension="Quantity")
+    filters = [[("Country", "in", ["000", "001"]), ("Quantity", ">", 100)], [("Product", "=", "0003")]]
+
+    mask = (df["Country"].isin(["000", "001"]) & (df["Quantity"] > 100)) | (df["Product"] == "0003")
+    expected = aio.abc_analysis(df[mask], **parameters)
+
+    if backend == "pandas":
+        pd.testing.assert_frame_equal(aio.abc_analysis(df, filters=filters, **parameters), expected)
+    else:
+        import pyarrow as pa
+
+        for data in [df, pa.Table.from_pandas(df), pl.from_pandas(df), pl.from_pandas(df).lazy()]:
+            results = aio.abc_analysis(data, filters=filters, backend="polars", **parameters)
+            pd.testing.assert_frame_equal(results.to_pandas(), expected)
+
+
+def test_abc_analysis_n_jobs():
+    np.random.seed(seed=0)
+    df = pd.DataFrame()
+    df["Product"] = ["{:04d}".format(i) for i in np.random.randint(15, size=1000)]
+    df["Country"] = ["{:03d}".format(i) for i in np.random.randint(4, size=1000)]
+    df["Region"] = ["{:05d}".format(i) for i in np.random.randint(3, size=1000)]
+    df["Quantity"] = np.random.randint(1000, size=1000)
+
+    parameters = dict(
+        primary_dimension="Product",
+        secondary_dimensions=["Country", "Region"],
+        numeric_dimension="Quantity",
+    )
+    results = aio.abc_analysis(df, n_jobs=3, **parameters)
+    expected = aio.abc_analysis(df, **parameters)
+
+    pd.testing.assert_frame_equal(results, expected)
+
+    for n_jobs in [0, -2]:
+        with pytest.raises(ValueError, match="n_jobs"):
+            aio.abc_analysis(df, n_jobs=n_jobs, **parameters)
+
+
+def test_abc_analysis_n_jobs_single_partition(monkeypatch):
+    import concurrent.futures
+
+    def no_process_pool(*args, **kwargs):
+        raise AssertionError("a single partition runs in the calling process")
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", no_process_pool)
+    np.random.seed(seed=0)
+    df = pd.DataFrame()
+    df["Product"] = ["{:04d}".format(i) for i in np.random.randint(15, size=1000)]
+    df["Quantity"] = np.random.randint(1000, size=1000)
+    parameters = dict(primary_dimension="Product", numeric_dimension="Quantity")
+
+    pd.testing.assert_frame_equal(aio.abc_analysis(df, n_jobs=4, **parameters), aio.abc_analysis(df, **parameters))
+
+
+@pytest.mark.parametrize("secondary_dimensions", [None, ["Country"], ["Country", "Region"]])
+@pytest.mark.parametrize("classified_only", [False, True])
+def test_abc_analysis_polars_backend(secondary_dimensions, classified_only):
+    pl = pytest.importorskip("polars")
+    np.random.seed(seed=0)
+    df = pd.DataFrame()
+    df["Product"] = ["{:04d}".format(i) for i in np.random.randint(50, size=2000)]
+    df["Country"] = ["{:03d}".format(i) for i in np.random.randint(7, size=2000)]
+    df["Region"] = np.random.choice(["North", "South", None], size=2000)
+    df["Quantity"] = np.random.randint(10, size=2000)
+    parameters = dict(
+        primary_dimension="Product",
+        secondary_dimensions=secondary_dimensions,
+        numeric_dimension="Quantity",
+        classified_only=classified_only,
+    )
+
+    expected = aio.abc_analysis(df, **parameters)
+    for data in [df, pl.from_pandas(df), pl.from_pandas(df).lazy()]:
+        results = aio.abc_analysis(data, backend="polars", **parameters)
+        pd.testing.assert_frame_equal(results.to_pandas(), expected)
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_abc_analysis_passthrough_dimensions(backend):
+    if backend == "polars":
+        pytest.importorskip("polars")
+    np.random.seed(seed=0)
+    df = pd.DataFrame()
+    df["Product"] = ["{:04d}".format(i) for i in np.random.randint(15, size=1000)]
+    df["Country"] = ["{:03d}".format(i) for i in np.random.randint(4, size=1000)]
+    df["Quantity"] = np.random.randint(1000, size=1000)
+    df["Description"] = "Product " + df["Product"]
+    df["Comment"] = "not needed for the classification"
+    parameters = dict(
+        primary_dimension="Product",
+        secondary_dimensions=["Country"],
+        numeric_dimension="Quantity",
+        backend=backend,
+    )
+
+    results = aio.abc_analysis(df, passthrough_dimensions=["Description"], **parameters)
+    expected = aio.abc_analysis(df[["Product", "Country", "Quantity"]], **parameters)
+    if backend == "polars":
+        results, expected = results.to_pandas(), expected.to_pandas()
+
+    assert "Comment" not in results.columns
+    assert (results["Description"] == "Product " + results["Product"]).all()
+    pd.testing.assert_frame_equal(results.drop(columns="Description"), expected)
+
+
+def test_abc_analysis_sweep():
+    np.random.seed(seed=0)
+    df = pd.DataFrame()
+    df["Product"] = ["{:04d}".format(i) for i in np.random.randint(15, size=1000)]
+    df["Country"] = ["{:03d}".format(i) for i in np.random.randint(4, size=1000)]
+    df["Quantity"] = np.random.randint(1000, size=1000)
+    thresholds = [(0.6, 0.9), (0.8, 0.95), (0.7, 0.7)]
+    parameters = dict(
+        primary_dimension="Product",
+        secondary_dimensions=["Country"],
+        numeric_dimension="Quantity",
+    )
+
+    results_long = aio.abc_analysis_sweep(df, thresholds=thresholds, **parameters)
+    results_wide = aio.abc_analysis_sweep(df, thresholds=thresholds, output="wide", **parameters)
+
+    assert len(results_long) == 3 * len(results_wide)
+    for A, B in thresholds:
+        expected = aio.abc_analysis(df, A=A, B=B, **parameters)
+        scenario = results_long[(results_long["A"] == A) & (results_long["B"] == B)]
+        pd.testing.assert_frame_equal(
+            scenario.drop(columns=["A", "B"]).reset_index(drop=True), expected
+        )
+        assert (results_wide["Class_{:g}_{:g}".format(A, B)] == expected["Class"]).all()
+
+
+@pytest.mark.parametrize("n_jobs", [None, 2])
+def test_abc_analysis_multiple_numeric_dimensions(n_jobs):
+    np.random.seed(seed=0)
+    df = pd.DataFrame()
+    df["Product"] = ["{:04d}".format(i) for i in np.random.randint(15, size=1000)]
+    df["Country"] = ["{:03d}".format(i) for i in np.random.randint(4, size=1000)]
+    df["Quantity"] = np.random.randint(1000, size=1000)
+    df["Revenue"] = df["Quantity"] * np.random.choice([0.5, 2.0, 10.0], size=1000)
+    df["Order_Lines"] = 1
+    measures = ["Quantity", "Revenue", "Order_Lines"]
+    parameters = dict(primary_dimension="Product", secondary_dimensions=["Country"])
+
+    results = aio.abc_analysis(df, numeric_dimension=measures, n_jobs=n_jobs, **parameters)
+
+    assert results.columns[-3:].tolist() == ["Class_" + measure for measure in measures]
+    for measure in measures:
+        expected = aio.abc_analysis(df, numeric_dimension=measure, **parameters)
+        merged = expected.merge(results, on=["Country", "Product"], suffixes=("", "_multiple"))
+        assert len(merged) == len(expected) == len(results)
+        assert (merged["Class"] == merged["Class_" + measure]).all()
+        for column in ["Cumsum_Sec_Dim", "Relative_Quantity", "Cumsum_Relative_Quantity"]:
+            np.testing.assert_array_equal(merged[column], merged[column + "_" + measure])
+        if measure == "Quantity":
+            pd.testing.assert_series_equal(results["Product"], expected["Product"])
+
+    classified = aio.abc_analysis(df, numeric_dimension=measures, classified_only=True, **parameters)
+    assert classified.columns.tolist() == ["Product"] + measures + ["Country"] + [
+        "Class_" + measure for measure in measures
+    ]
+
+
+def test_abc_analysis_sweep_and_parquet_multiple_numeric_dimensions(tmp_path):
+    np.random.seed(seed=0)
+    df = pd.DataFrame()
+    df["Product"] = ["{:04d}".format(i) for i in np.random.randint(15, size=1000)]
+    df["Country"] = ["{:03d}".format(i) for i in np.random.randint(4, size=1000)]
+    df["Quantity"] = np.random.randint(1000, size=1000)
+    df["Revenue"] = df["Quantity"] * np.random.choice([0.5, 2.0, 10.0], size=1000)
+    df.to_parquet(tmp_path / "data.parquet", row_group_size=100)
+    measures = ["Quantity", "Revenue"]
+    parameters = dict(primary_dimension="Product", secondary_dimensions=["Country"])
+    thresholds = [(0.6, 0.9), (0.8, 0.95)]
+
+    expected = aio.abc_analysis(df, numeric_dimension=measures, **parameters)
+    results = aio.abc_analysis_parquet(
+        tmp_path / "data.parquet", numeric_dimension=measures, batch_size=300, **parameters
+    )
+    pd.testing.assert_frame_equal(results, expected)
+
+    results_long = aio.abc_analysis_sweep(df, numeric_dimension=measures, thresholds=thresholds, **parameters)
+    results_wide = aio.abc_analysis_sweep(
+        df, numeric_dimension=measures, thresholds=thresholds, output="wide", **parameters
+    )
+    for A, B in thresholds:
+        expected = aio.abc_analysis(df, numeric_dimension=measures, A=A, B=B, **parameters)
+        scenario = results_long[(results_long["A"] == A) & (results_long["B"] == B)]
+        pd.testing.assert_frame_equal(scenario.drop(columns=["A", "B"]).reset_index(drop=True), expected)
+        for measure in measures:
+            column = "Class_{}_{:g}_{:g}".format(measure, A, B)
+            assert (results_wide[column] == expected["Class_" + measure]).all()
+
+
+def test_abc_analysis_parquet_read_and_write_output(tmp_path):
+    np.random.seed(seed=0)
+    df = pd.DataFrame()
+    df["Product"] = ["{:04d}".format(i) for i in np.random.randint(15, size=1000)]
+    df["Country"] = ["{:03d}".format(i) for i in np.random.randint(4, size=1000)]
+    df["Quantity"] = np.random.randint(1000, size=1000)
+    df.to_csv(tmp_path / "data.csv", index=False)
+    # all columns are strings without a schema
+    aio.read_and_write("data.csv", tmp_path, tmp_path, to='parquet')
+    parameters = dict(primary_dimension="Product", secondary_dimensions=["Country"], numeric_dimension="Quantity")
+
+    results = aio.abc_analysis_parquet(tmp_path / "py_data.parquet", batch_size=300, **parameters)
+    expected = aio.abc_analysis(df.astype({"Quantity": float}), **parameters)
+
+    pd.testing.assert_frame_equal(results, expected)
+
+    df.loc[0, "Quantity"] = "3,5"
+    df.to_csv(tmp_path / "data.csv", index=False)
+    aio.read_and_write("data.csv", tmp_path, tmp_path, to='parquet')
+    with pytest.raises(ValueError, match="schema"):
+        aio.abc_analysis_parquet(tmp_path / "py_data.parquet", **parameters)
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+import aio
+
+
+def test_abc_xyz_analysis_matches_abc_and_xyz():
+    np.random.seed(seed=42)
+    df = pd.DataFrame()
+    df["Material"] = ["{:04d}".format(i) for i in np.random.randint(50, size=3000)]
+    df["Country"] = np.random.choice(["DE", "FR", "IT"], size=3000)
+    df["Date"] = pd.period_range("2019-07", periods=24, freq="M").astype(str)[
+        np.random.randint(24, size=3000)
+    ]
+    df["Quantity"] = np.random.randint(100, size=3000)
+    parameters = dict(
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        start_date="2020-01-01",
+        periods=12,
+        frequency="M",
+    )
+
+    results = aio.abc_xyz_analysis(
+        df, primary_dimension_keys=["Material", "Country"], secondary_dimensions=["Country"], **parameters
+    )
+
+    expected_xyz = aio.xyz_analysis(
+        df, primary_dimension_keys=["Material", "Country"], method="dense", **parameters
+    )
+    pd.testing.assert_frame_equal(results[expected_xyz.columns], expected_xyz, check_dtype=False)
+
+    in_range = df[(df["Date"] >= "2020-01") & (df["Date"] <= "2020-12")]
+    expected_abc = aio.abc_analysis(
+        in_range[["Material", "Country", "Quantity"]],
+        primary_dimension="Material",
+        secondary_dimensions=["Country"],
+        numeric_dimension="Quantity",
+    )
+    merged = results.merge(expected_abc, on=["Material", "Country"], suffixes=("", "_abc"))
+    assert len(merged) == len(expected_abc)
+    assert (merged["ABC_Class"] == merged["Class"]).all()
+    np.testing.assert_allclose(merged["Cumsum_Relative_Quantity"], merged["Cumsum_Relative_Quantity_abc"])
+    assert (results["ABC_XYZ_Class"] == results["ABC_Class"] + results["XYZ_Class"]).all()
+
+
+def test_abc_xyz_analysis_single_numeric_dimension():
+    df = pd.DataFrame({"Material": ["0001"], "Date": ["2020-01"], "Quantity": [1], "Revenue": [2.0]})
+
+    with pytest.raises(ValueError):
+        aio.abc_xyz_analysis(
+            df,
+            primary_dimension_keys="Material",
+            relevant_numeric_dimension=["Quantity", "Revenue"],
+            relevant_date_dimension="Date",
+            start_date="2020-01-01",
+            periods=12,
+            frequency="M",
+        )
+
+
+def test_abc_xyz_analysis_constant_and_no_demand():
+    df = pd.DataFrame()
+    df["Material"] = ["0001"] * 12 + ["0002"] * 6 + ["0003"]
+    df["Country"] = ["DE"] * 18 + ["FR"]
+    df["Date"] = [str(p) for p in pd.period_range("2020-01", periods=12, freq="M")] * 1 + [
+        str(p) for p in pd.period_range("2020-01", periods=6, freq="M")
+    ] + ["2020-01"]
+    df["Quantity"] = [7] * 12 + [1, 0, 5, 0, 9, 0] + [0]
+
+    results = aio.abc_xyz_analysis(
+        df,
+        primary_dimension_keys=["Material", "Country"],
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        start_date="2020-01-01",
+        periods=12,
+        frequency="M",
+        secondary_dimensions=["Country"],
+    )
+
+    assert results["Coefficient_of_Variation"].iloc[0] == 0
+    assert results["ABC_XYZ_Class"].tolist() == ["BX", "CZ", "CN"]
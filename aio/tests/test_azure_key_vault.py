@@ -1,5 +1,10 @@
 import aio
 import os
+import subprocess
+import sys
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
 
 
 def test_is_running_on_databricks():
@@ -9,4 +14,136 @@ def test_is_running_on_databricks():
 
 def test_is_running_on_devops_pipeline():
     res = aio._is_running_on_devops_pipeline()
-    print(res)
\ No newline at end of file
+    print(res)
+
+class _FakeSecrets:
+    def __init__(self, delay=0):
+        self.calls = 0
+        self.delay = delay
+
+    def get(self, scope, key):
+        self.calls += 1
+        time.sleep(self.delay)
+        return "{}/{}/{}".format(scope, key, self.calls)
+
+
+class _FakeDbutils:
+    def __init__(self, delay=0):
+        self.fs = object()
+        self.secrets = _FakeSecrets(delay)
+
+
+def test_vault_get_secret_cache(monkeypatch):
+    fake_dbutils = _FakeDbutils()
+    monkeypatch.setattr(aio.azure_key_vault, "dbutils", fake_dbutils)
+    aio.vault_invalidate_secret()
+
+    assert aio.vault_get_secret("scope", "key") == "scope/key/1"
+    assert aio.vault_get_secret("scope", "key") == "scope/key/1"
+    assert aio.vault_get_secret("scope", "other-key") == "scope/other-key/2"
+    assert aio.vault_get_secret("scope", "key", ttl=0) == "scope/key/3"
+
+    aio.vault_invalidate_secret("scope", "key")
+    assert aio.vault_get_secret("scope", "key") == "scope/key/4"
+    assert aio.vault_get_secret("scope", "other-key") == "scope/other-key/2"
+    assert fake_dbutils.secrets.calls == 4
+
+    aio.vault_get_secret("scope", "expiring-key", ttl=0.01)
+    time.sleep(0.02)
+    assert aio.vault_get_secret("scope", "expiring-key", ttl=0.01) == "scope/expiring-key/6"
+    aio.vault_invalidate_secret()
+
+
+def test_vault_get_secret_single_flight(monkeypatch):
+    fake_dbutils = _FakeDbutils(delay=0.1)
+    monkeypatch.setattr(aio.azure_key_vault, "dbutils", fake_dbutils)
+    aio.vault_invalidate_secret()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        secrets = list(executor.map(lambda _: aio.vault_get_secret("scope", "key"), range(8)))
+
+    assert secrets == ["scope/key/1"] * 8
+    assert fake_dbutils.secrets.calls == 1
+    aio.vault_invalidate_secret()
+
+
+def test_vault_invalidate_secret_during_fetch(monkeypatch):
+    fake_dbutils = _FakeDbutils(delay=0.2)
+    monkeypatch.setattr(aio.azure_key_vault, "dbutils", fake_dbutils)
+    aio.vault_invalidate_secret()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        fetch = executor.submit(aio.vault_get_secret, "scope", "key")
+        time.sleep(0.05)
+        aio.vault_invalidate_secret("scope", "key")
+        assert fetch.result() == "scope/key/1"
+
+    # the value fetched before the invalidation is not cached
+    fake_dbutils.secrets.delay = 0
+    assert aio.vault_get_secret("scope", "key") == "scope/key/2"
+    assert aio.vault_get_secret("scope", "key") == "scope/key/2"
+    aio.vault_invalidate_secret()
+
+
+def test_secret_client_created_outside_lock(monkeypatch):
+    monkeypatch.setattr(aio.azure_key_vault, "_secret_clients", {})
+
+    def credential():
+        # the lock is free while the credential is created
+        assert aio.azure_key_vault._lock.acquire(blocking=False)
+        aio.azure_key_vault._lock.release()
+        return object()
+
+    # stand-ins for the Azure libraries, not installed with aio
+    monkeypatch.setitem(sys.modules, "azure.identity", types.SimpleNamespace(AzureCliCredential=credential))
+    monkeypatch.setitem(
+        sys.modules,
+        "azure.keyvault.secrets",
+        types.SimpleNamespace(SecretClient=lambda vault_url, credential: (vault_url, credential)),
+    )
+
+    client = aio.azure_key_vault._secret_client("https://vault.vault.azure.net/")
+
+    assert client[0] == "https://vault.vault.azure.net/"
+    assert aio.azure_key_vault._secret_client("https://vault.vault.azure.net/") is client
+
+
+def test_vault_get_secrets_local_client(monkeypatch):
+    monkeypatch.delenv("SYSTEM_JOBID", raising=False)
+    monkeypatch.setattr(aio.azure_key_vault, "_secret_clients", {})
+    aio.vault_invalidate_secret()
+    secrets = {"secret-{}".format(i): "value-{}".format(i) for i in range(10)}
+    client = aio._LocalSecretClient(secrets, delay=0.1)
+    aio._vault_set_client("local-vault", client)
+
+    start = time.perf_counter()
+    result = aio.vault_get_secrets("local-vault", list(secrets))
+
+    assert time.perf_counter() - start < 0.5
+    assert result == secrets
+    assert aio.vault_get_secret("local-vault", "secret-0") == "value-0"
+    assert client.calls == 10
+    aio.vault_invalidate_secret()
+
+
+def test_local_secret_client_counts_concurrent_calls():
+    client = aio._LocalSecretClient({"key": "value"})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: client.get_secret("key"), range(10000)))
+
+    assert client.calls == 10000
+
+
+def test_vault_get_secret_does_not_import_pandas():
+    code = (
+        "import sys, aio; "
+        "assert aio.vault_get_secret('scope', 'my-key') == 'secret'; "
+        "print(sorted(m for m in ('numpy', 'pandas', 'scipy', 'pyarrow') if m in sys.modules))"
+    )
+    env = dict(os.environ, SYSTEM_JOBID="1", MY_KEY="secret")
+    output = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.strip() == "[]"
@@ -1,6 +1,7 @@
 import aio
 import numpy as np
 import pandas as pd
+import pytest
 
 
 def test_create_time_series():
@@ -26,4 +27,57 @@ def test_create_time_series():
         df = df.append(quantities)
 
     assert len(df) == 100 * 12
-    print(len(df))
\ No newline at end of file
+    print(len(df))
+
+def test_create_time_series_batch():
+    df = aio.create_time_series_batch(
+        num_materials=100,
+        distribution="poisson",
+        p_mean=10,
+        num_periods=12,
+        intermittency=0.25,
+        random_state=42,
+    )
+
+    assert len(df) == 100 * 12
+    assert list(df.columns) == ["Material", "Date", "Value", "Quantity", "KEY"]
+    assert (df.groupby("Material")["Quantity"].apply(lambda q: (q == 0).sum()) >= 3).all()
+    pd.testing.assert_frame_equal(
+        df,
+        aio.create_time_series_batch(
+            num_materials=100,
+            distribution="poisson",
+            p_mean=10,
+            num_periods=12,
+            intermittency=0.25,
+            random_state=42,
+        ),
+    )
+
+    table = aio.create_time_series_batch(num_materials=3, num_periods=5, output="arrow")
+    assert table.num_rows == 15
+
+
+@pytest.mark.parametrize("periodicity", ["D", "W", "M", "Q", "Y"])
+def test_create_time_series_periodicity(periodicity):
+    df = aio.create_time_series(num_periods=14, periodicity="M", start_date="2020-01-15")
+
+    assert df["Date"].dtype == pd.PeriodDtype("M")
+    assert df["Date"].astype(str).tolist()[:2] == ["2020-01", "2020-02"]
+    assert df["Date"].astype(str).tolist()[-1] == "2021-02"
+
+    df = aio.create_time_series_batch(
+        num_materials=5, num_periods=4, periodicity=periodicity, random_state=0
+    )
+    result = aio.xyz_analysis(
+        df,
+        primary_dimension_keys=["Material"],
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        start_date="2020-01-01",
+        periods=4,
+        frequency=periodicity,
+    )
+
+    assert len(result) == 5
+    assert (result["Non_Zero_Count"] == 4).all()
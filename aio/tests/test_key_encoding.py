@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+from aio.key_encoding import _encode_keys, _decode_keys
+
+
+def test_encode_and_decode_keys():
+    df = pd.DataFrame()
+    df["Material"] = ["0102-A", "0008", "0102-A", "0008", "0459"]
+    df["Plant"] = ["DE~~~01", "US-01", "DE~~~01", "DE~~~01", "US-01"]
+
+    codes, df_keys = _encode_keys(df, ["Material", "Plant"])
+
+    assert codes.dtype == np.int32
+    assert len(df_keys) == 4
+    assert codes[0] == codes[2]
+    pd.testing.assert_frame_equal(_decode_keys(codes, df_keys), df)
+
+
+def test_encode_keys_sorted_codes():
+    df = pd.DataFrame({"Material": ["c", "a", "b", "a"]})
+
+    codes, df_keys = _encode_keys(df, "Material")
+
+    assert codes.tolist() == [2, 0, 1, 0]
+    assert df_keys["Material"].tolist() == ["a", "b", "c"]
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 import os
+import sys
 from pathlib import Path
 import aio
 
@@ -80,4 +81,219 @@ def test_read_all_sheets():
 
     os.remove(csv_sheet)
     os.remove(parquet_sheets)
-    
\ No newline at end of file
+    
+
+def test_read_and_write_all_max_workers(tmp_path):
+    df = pd.DataFrame(np.random.randint(0, 100, size=(100, 4)), columns=['A', 'B', 'C', 'D'])
+    df.to_csv(tmp_path / "data_0.csv", index=False)
+    df.to_csv(tmp_path / "data_1.csv", index=False)
+    (tmp_path / "broken.xlsx").write_bytes(b"not an excel file")
+
+    summary = aio.read_and_write_all(tmp_path, to='parquet', max_workers=2)
+
+    summary = summary.set_index('File')
+    assert summary.loc['data_0.csv', 'Status'] == 'ok'
+    assert summary.loc['data_1.csv', 'Status'] == 'ok'
+    assert summary.loc['broken.xlsx', 'Status'] == 'failed'
+    assert (summary['Seconds'] >= 0).all()
+    assert (tmp_path / "py_data_0.parquet").exists()
+    assert (tmp_path / "py_data_1.parquet").exists()
+
+
+def test_read_and_write_engines(tmp_path):
+    data_path = Path(__file__).parent.absolute() / "test_data"
+    csv_content = (data_path / "sample_materials_inv_and_demand.csv").read_text()
+    # add a line with too many fields which must be removed and a line with too few
+    # fields which is padded with nulls
+    (tmp_path / "data.csv").write_text(csv_content + "1,2,3,4,5,6,7,8,9,10\n4,5\n")
+
+    results = {}
+    for engine in ['python', 'c', 'pyarrow']:
+        for chunksize in [None, 100]:
+            write_directory = tmp_path / "{}_{}".format(engine, chunksize)
+            write_directory.mkdir()
+            aio.read_and_write("data.csv", tmp_path, write_directory, to='parquet', engine=engine,
+                               chunksize=chunksize)
+            results[engine, chunksize] = pd.read_parquet(write_directory / "py_data.parquet")
+
+    expected = results['python', None]
+    assert len(expected) == 1433
+    assert expected.iloc[-1, :2].tolist() == ['4', '5']
+    assert expected.iloc[-1, 2:].isna().all()
+    assert (expected.dtypes == object).all()
+    for result in results.values():
+        pd.testing.assert_frame_equal(result, expected)
+
+    concatenated = aio.read_and_concat(["data.csv"], tmp_path, parquet=False, backend='pyarrow')
+    pd.testing.assert_frame_equal(concatenated, expected)
+
+
+def test_read_csv_arrow_pads_short_rows_in_place(tmp_path, monkeypatch):
+    from aio.read_and_write import _csv_tables, _read_csv_arrow
+
+    # more rows than one block of the pyarrow reader, with rows with too few fields at the
+    # start, in a row, across blocks and at the end and rows with too many fields in between
+    lines = ["a,b,c"]
+    for i in range(100000):
+        if i % 9973 in (0, 1):
+            lines.append("{},short".format(i))
+        elif i % 7919 == 5:
+            lines.append("{},1,2,long".format(i))
+        else:
+            lines.append("{},{},NA".format(i, i % 7))
+    lines.append('"quoted\nshort"')
+    (tmp_path / "data.csv").write_text("\n".join(lines) + "\n")
+    expected = pd.read_csv(tmp_path / "data.csv", on_bad_lines='skip', engine="c", dtype=str)
+
+    # the rows are read by pyarrow only
+    read_and_write_module = sys.modules["aio.read_and_write"]
+    monkeypatch.setattr(read_and_write_module, "_read_csv", None)
+    pd.testing.assert_frame_equal(_read_csv_arrow(tmp_path / "data.csv").to_pandas(), expected)
+
+    _, tables = _csv_tables(tmp_path / "data.csv", engine='pyarrow', chunksize=1000)
+    result = pd.concat([table.to_pandas() for table in tables], ignore_index=True)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_read_and_write_encoding(tmp_path):
+    (tmp_path / "bom.csv").write_text("Material,Quantity\nMat-1,1\n", encoding="utf-8-sig")
+    (tmp_path / "latin.csv").write_text("Material;Menge\nMaß;1\n", encoding="latin-1")
+
+    for engine in ['python', 'c', 'pyarrow']:
+        for chunksize in [None, 100]:
+            write_directory = tmp_path / "{}_{}".format(engine, chunksize)
+            write_directory.mkdir()
+            aio.read_and_write("bom.csv", tmp_path, write_directory, to='parquet', engine=engine,
+                               chunksize=chunksize)
+            aio.read_and_write("latin.csv", tmp_path, write_directory, to='parquet', engine=engine,
+                               chunksize=chunksize, sep=';', encoding='latin-1')
+            assert pd.read_parquet(write_directory / "py_bom.parquet").columns.tolist() == ["Material", "Quantity"]
+            assert pd.read_parquet(write_directory / "py_latin.parquet").to_dict('list') == {
+                "Material": ["Maß"], "Menge": ["1"]}
+
+    for backend in ['pandas', 'pyarrow']:
+        concatenated = aio.read_and_concat(["latin.csv"], tmp_path, parquet=False, sep=';',
+                                           encoding='latin-1', backend=backend)
+        assert concatenated["Material"].tolist() == ["Maß"]
+
+
+def test_read_and_write_chunksize(tmp_path):
+    import pyarrow.parquet as pq
+    from aio.read_and_write import _csv_tables
+
+    data_path = Path(__file__).parent.absolute() / "test_data"
+    file_name = "sample_materials_inv_and_demand.csv"
+
+    aio.read_and_write(file_name, data_path, tmp_path, to='parquet')
+    expected = pd.read_parquet(tmp_path / "py_sample_materials_inv_and_demand.parquet")
+
+    for engine in ['python', 'pyarrow']:
+        aio.read_and_write(file_name, data_path, tmp_path, to='both', engine=engine,
+                           chunksize=100, row_group_size=500)
+
+        parquet_file = pq.ParquetFile(tmp_path / "py_sample_materials_inv_and_demand.parquet")
+        assert parquet_file.metadata.row_group(0).num_rows == 500
+        _, tables = _csv_tables(data_path / file_name, engine=engine, chunksize=100)
+        assert [table.num_rows for table in tables] == [100] * 14 + [32]
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(tmp_path / "py_sample_materials_inv_and_demand.parquet"), expected)
+        pd.testing.assert_frame_equal(
+            pd.read_csv(tmp_path / "py_sample_materials_inv_and_demand.csv", dtype=str), expected)
+
+
+def test_read_and_write_schema(tmp_path):
+    data_path = Path(__file__).parent.absolute() / "test_data"
+    file_name = "sample_materials_inv_and_demand.csv"
+    parquet_file = tmp_path / "py_sample_materials_inv_and_demand.parquet"
+
+    aio.read_and_write(file_name, data_path, tmp_path, to='parquet', schema='infer')
+    inferred = pd.read_parquet(parquet_file)
+    assert pd.api.types.is_integer_dtype(inferred["Demand_Quantity"])
+    assert pd.api.types.is_datetime64_any_dtype(inferred["Demand_Date"])
+
+    for engine in ['python', 'pyarrow']:
+        aio.read_and_write(file_name, data_path, tmp_path, to='parquet', engine=engine,
+                           chunksize=100, schema='infer')
+        # categories of a stream are in the order of appearance
+        pd.testing.assert_frame_equal(pd.read_parquet(parquet_file), inferred,
+                                      check_categorical=False)
+
+    aio.read_and_write(file_name, data_path, tmp_path, to='parquet',
+                       schema={"Material": "string", "Demand_Quantity": "float"})
+    typed = pd.read_parquet(parquet_file)
+    assert typed["Material"].dtype == object
+    assert typed["Demand_Quantity"].dtype == float
+
+
+def test_read_and_write_schema_widens_later_values(tmp_path):
+    num_rows = 20_000
+    df = pd.DataFrame({
+        "Integer_Then_Float": np.arange(num_rows).astype(str),
+        "Integer_Then_Text": np.arange(num_rows).astype(str),
+        "Date_Then_Text": "2020-01-31",
+        "Month": "2020-01",
+    })
+    df.loc[num_rows - 1, "Integer_Then_Float"] = "1.5"
+    df.loc[num_rows - 1, "Integer_Then_Text"] = "unknown"
+    df.loc[num_rows - 1, "Date_Then_Text"] = "end of month"
+    df.to_csv(tmp_path / "data.csv", index=False)
+    parquet_file = tmp_path / "py_data.parquet"
+
+    for chunksize in [None, 100]:
+        aio.read_and_write("data.csv", tmp_path, tmp_path, to='parquet', chunksize=chunksize,
+                           schema='infer')
+        inferred = pd.read_parquet(parquet_file)
+        assert inferred["Integer_Then_Float"].dtype == float
+        assert inferred["Integer_Then_Float"].iloc[-1] == 1.5
+        assert inferred["Integer_Then_Text"].iloc[-1] == "unknown"
+        assert inferred["Date_Then_Text"].iloc[-1] == "end of month"
+        assert inferred.notna().all().all()
+        # months are periods and stay strings
+        assert inferred["Month"].astype(str).eq("2020-01").all()
+
+
+def test_read_and_concat_pyarrow(tmp_path):
+    df_1 = pd.DataFrame(np.random.randint(0, 100, size=(100, 4)), columns=['A', 'B', 'C', 'D'])
+    df_2 = pd.DataFrame(np.random.randint(0, 100, size=(100, 4)), columns=['A', 'B', 'C', 'D'])
+    df_1.to_parquet(tmp_path / "df_1.parquet")
+    df_2.to_parquet(tmp_path / "df_2.parquet")
+    list_of_files = ["df_1.parquet", "df_2.parquet"]
+
+    expected = aio.read_and_concat(list_of_files, tmp_path).reset_index(drop=True)
+    pd.testing.assert_frame_equal(
+        aio.read_and_concat(list_of_files, tmp_path, backend='pyarrow'), expected)
+
+    filtered = aio.read_and_concat(list_of_files, tmp_path, backend='pyarrow',
+                                   columns=['A', 'B'], filters=[('A', '<', 50)])
+    pd.testing.assert_frame_equal(
+        filtered, expected.loc[expected['A'] < 50, ['A', 'B']].reset_index(drop=True))
+
+
+def test_read_and_concat_columns_and_filters(tmp_path):
+    df = pd.DataFrame(np.random.randint(0, 100, size=(200, 4)), columns=['A', 'B', 'C', 'D'])
+    df.iloc[:100].to_parquet(tmp_path / "df_1.parquet")
+    df.iloc[100:].to_parquet(tmp_path / "df_2.parquet")
+    df.astype(str).iloc[:100].to_csv(tmp_path / "df_1.csv", index=False)
+    df.astype(str).iloc[100:].to_csv(tmp_path / "df_2.csv", index=False)
+    expected = df.loc[(df['A'] < 50) | (df['B'] == 7), ['A', 'B']]
+
+    result = aio.read_and_concat(["df_1.parquet", "df_2.parquet"], tmp_path, columns=['A', 'B'],
+                                 filters=[[('A', '<', 50)], [('B', '=', 7)]])
+    pd.testing.assert_frame_equal(result.reset_index(drop=True), expected.reset_index(drop=True))
+
+    result = aio.read_and_concat(["df_1.csv", "df_2.csv"], tmp_path, parquet=False, columns=['A', 'B'],
+                                 filters=[('B', 'in', ['1', '2'])])
+    pd.testing.assert_frame_equal(
+        result.reset_index(drop=True),
+        df.loc[df['B'].isin([1, 2]), ['A', 'B']].astype(str).reset_index(drop=True))
+
+
+def test_read_and_concat_filter_column_not_read(tmp_path):
+    df = pd.DataFrame({'A': ['1', '2', '3'], 'B': ['2', '2', '1']})
+    df.to_csv(tmp_path / "df.csv", index=False)
+    expected = pd.DataFrame({'A': ['1', '2']})
+
+    for backend in ['pandas', 'pyarrow']:
+        result = aio.read_and_concat(["df.csv"], tmp_path, parquet=False, backend=backend,
+                                     columns=['A'], filters=[('B', '=', '2')])
+        pd.testing.assert_frame_equal(result.reset_index(drop=True), expected)
@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
 import aio
+import pytest
 
 
 def test_xyz_analysis():
@@ -248,3 +249,228 @@ def test_xyz_analysis_weekly():
     )
 
     assert len(result)
+
+
+def test_xyz_analysis_separator_in_keys():
+    df = pd.DataFrame()
+    df["Material"] = ["0001~~~A", "0001~~~A", "0001", "0001"]
+    df["Plant"] = ["01", "01", "A~~~01", "A~~~01"]
+    df["Date"] = ["2020-01", "2020-02", "2020-01", "2020-03"]
+    df["Quantity"] = [10, 20, 30, 40]
+
+    result = aio.xyz_analysis(
+        df=df,
+        primary_dimension_keys=["Material", "Plant"],
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        periods=3,
+        start_date="2020-01",
+        frequency="M",
+    )
+
+    assert len(result) == 2
+    assert set(zip(result["Material"], result["Plant"])) == {
+        ("0001~~~A", "01"),
+        ("0001", "A~~~01"),
+    }
+
+
+def test_xyz_analysis_dense_matches_expanded():
+    np.random.seed(seed=42)
+    df = pd.DataFrame()
+    df["Material"] = ["{:04d}".format(i) for i in np.random.randint(50, size=600)]
+    df["Date"] = pd.period_range("2020-01", periods=12, freq="M").astype(str)[
+        np.random.randint(12, size=600)
+    ]
+    df["Quantity"] = np.random.randint(100, size=600)
+
+    parameters = dict(
+        primary_dimension_keys="Material",
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        periods=12,
+        start_date="2020-01-01",
+        frequency="M",
+    )
+    result_expanded = aio.xyz_analysis(df=df, **parameters)
+    result_dense = aio.xyz_analysis(df=df, method="dense", **parameters)
+
+    pd.testing.assert_frame_equal(result_expanded, result_dense, check_dtype=False)
+
+
+def test_xyz_analysis_parquet_path(tmp_path):
+    np.random.seed(seed=42)
+    df = pd.DataFrame()
+    df["Material"] = ["{:04d}".format(i) for i in np.random.randint(50, size=600)]
+    df["Plant"] = np.random.choice(["P1", "P2"], size=600)
+    df["Date"] = pd.period_range("2020-01", periods=12, freq="M").astype(str)[
+        np.random.randint(12, size=600)
+    ]
+    df["Quantity"] = np.random.randint(100, size=600)
+    df.to_parquet(tmp_path / "data.parquet")
+
+    parameters = dict(
+        primary_dimension_keys="Material",
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        periods=12,
+        start_date="2020-01-01",
+        frequency="M",
+        method="dense",
+    )
+    result = aio.xyz_analysis(tmp_path / "data.parquet", filters=[("Plant", "=", "P1")], **parameters)
+    expected = aio.xyz_analysis(df.loc[df["Plant"] == "P1", ["Material", "Date", "Quantity"]], **parameters)
+
+    pd.testing.assert_frame_equal(result, expected)
+    pd.testing.assert_frame_equal(aio.xyz_analysis(df, filters=[("Plant", "=", "P1")], **parameters), expected)
+
+
+def test_xyz_analysis_dense_with_datetimes():
+    df = pd.DataFrame()
+    df["Material"] = ["0001", "0001", "0001", "0002"]
+    df["Date"] = pd.to_datetime(["2020-01-03", "2020-01-20", "2020-03-01", "2021-01-01"])
+    df["Quantity"] = [10, 20, 30, 40]
+
+    result = aio.xyz_analysis(
+        df=df,
+        primary_dimension_keys="Material",
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        periods=3,
+        start_date="2020-01",
+        frequency="M",
+        method="dense",
+    )
+
+    assert result["Mean"].tolist() == [20, 0]
+    assert result["Non_Zero_Count"].tolist() == [2, 0]
+    assert result["XYZ_Class"].tolist() == ["Y", "N"]
+
+
+def test_xyz_analysis_sparse_matches_dense():
+    np.random.seed(seed=42)
+    df = pd.DataFrame()
+    df["Material"] = ["{:04d}".format(i) for i in np.random.randint(200, size=300)]
+    df["Date"] = pd.period_range("2020-01", periods=52, freq="W").astype(str)[
+        np.random.randint(52, size=300)
+    ]
+    df["Quantity"] = np.random.randint(-10, 100, size=300)
+    # key without any demand
+    df.loc[df["Material"] == df["Material"].iloc[0], "Quantity"] = 0
+
+    parameters = dict(
+        primary_dimension_keys="Material",
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        periods=52,
+        start_date="2020-01",
+        frequency="W",
+    )
+    result_dense = aio.xyz_analysis(df=df, method="dense", **parameters)
+    result_sparse = aio.xyz_analysis(df=df, method="sparse", **parameters)
+
+    pd.testing.assert_frame_equal(result_dense, result_sparse, check_dtype=False)
+    assert (result_sparse["Frequency_Class"] == "Low").all()
+
+
+@pytest.mark.parametrize("primary_dimension_keys", ["Material", ["Material", "Plant"]])
+def test_xyz_analysis_polars_backend(primary_dimension_keys):
+    pl = pytest.importorskip("polars")
+    np.random.seed(seed=42)
+    df = pd.DataFrame()
+    df["Material"] = np.random.choice(["{:04d}".format(i) for i in range(80)] + [None], size=3000)
+    df["Plant"] = np.random.choice(["P1", "P2"], size=3000)
+    df["Date"] = pd.period_range("2019-11", periods=16, freq="M").astype(str)[
+        np.random.randint(16, size=3000)
+    ]
+    df["Quantity"] = np.random.choice([0, 1, 5, 20, np.nan], size=3000)
+    # material without demand in the period range
+    df.loc[df["Material"] == "0003", "Date"] = "2018-01"
+
+    parameters = dict(
+        primary_dimension_keys=primary_dimension_keys,
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        periods=12,
+        start_date="2020-01-01",
+        frequency="M",
+    )
+    expected = aio.xyz_analysis(df=df, method="sparse", **parameters)
+    for data in [df, pl.from_pandas(df)]:
+        results = aio.xyz_analysis(df=data, backend="polars", **parameters)
+        pd.testing.assert_frame_equal(results.to_pandas(), expected)
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_xyz_analysis_passthrough_dimensions(backend):
+    if backend == "polars":
+        pytest.importorskip("polars")
+    np.random.seed(seed=42)
+    df = pd.DataFrame()
+    df["Material"] = ["{:04d}".format(i) for i in np.random.randint(50, size=600)]
+    df["Date"] = pd.period_range("2020-01", periods=12, freq="M").astype(str)[
+        np.random.randint(12, size=600)
+    ]
+    df["Quantity"] = np.random.randint(100, size=600)
+    df["Description"] = "Material " + df["Material"]
+    df["Value"] = df["Quantity"] * 2.5
+
+    parameters = dict(
+        primary_dimension_keys="Material",
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        periods=12,
+        start_date="2020-01-01",
+        frequency="M",
+        backend=backend,
+    )
+    results = aio.xyz_analysis(df=df, passthrough_dimensions=["Description"], **parameters)
+    expected = aio.xyz_analysis(df=df[["Material", "Date", "Quantity"]], **parameters)
+    if backend == "polars":
+        results, expected = results.to_pandas(), expected.to_pandas()
+
+    assert "Value" not in results.columns
+    assert (results["Description"] == "Material " + results["Material"]).all()
+    pd.testing.assert_frame_equal(results.drop(columns="Description"), expected)
+
+
+def test_xyz_analysis_windows_match_dense():
+    np.random.seed(seed=42)
+    df = pd.DataFrame()
+    df["Material"] = ["{:04d}".format(i) for i in np.random.randint(50, size=3000)]
+    df["Date"] = pd.period_range("2019-01", periods=36, freq="M").astype(str)[
+        np.random.randint(36, size=3000)
+    ]
+    df["Quantity"] = np.random.choice([0, 1, 5, 20.5], size=3000)
+    # material with constant demand
+    constant = pd.DataFrame(
+        {"Material": "constant", "Date": pd.period_range("2019-01", periods=36, freq="M").astype(str), "Quantity": 7}
+    )
+    df = pd.concat([df, constant], ignore_index=True)
+    windows = [("2021-07", 6), ("2021-01", 12), ("2020-01", 24), ("2018-06", 10)]
+
+    results = aio.xyz_analysis_windows(
+        df,
+        primary_dimension_keys="Material",
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        windows=windows,
+        frequency="M",
+    )
+
+    assert len(results) == len(windows) * df["Material"].nunique()
+    for start_date, periods in windows:
+        expected = aio.xyz_analysis(
+            df,
+            primary_dimension_keys="Material",
+            relevant_numeric_dimension="Quantity",
+            relevant_date_dimension="Date",
+            start_date=start_date,
+            periods=periods,
+            frequency="M",
+            method="dense",
+        )
+        window = results[(results["Start_Date"] == start_date) & (results["Periods"] == periods)]
+        pd.testing.assert_frame_equal(
+            window.drop(columns=["Start_Date", "Periods"]).reset_index(drop=True), expected, check_dtype=False
+        )
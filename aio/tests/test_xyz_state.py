@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+import pytest
+import aio
+
+
+def _sample_data(periods=24):
+    np.random.seed(seed=42)
+    df = pd.DataFrame()
+    df["Material"] = ["{:04d}".format(i) for i in np.random.randint(50, size=1000)]
+    df["Plant"] = ["{:02d}".format(i) for i in np.random.randint(3, size=1000)]
+    df["Date"] = pd.period_range("2020-01", periods=periods, freq="M").astype(str)[
+        np.random.randint(periods, size=1000)
+    ]
+    df["Quantity"] = np.random.randint(100, size=1000) * (np.random.rand(1000) < 0.4)
+    return df
+
+
+def test_xyz_state_matches_xyz_analysis():
+    df = _sample_data()
+    state = aio.XYZState(
+        primary_dimension_keys=["Material", "Plant"],
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        start_date="2020-01",
+        periods=12,
+        frequency="M",
+    )
+    # update the state period by period
+    for date in sorted(df["Date"].unique()):
+        state.update(df[df["Date"] == date])
+
+    expected = aio.xyz_analysis(
+        df=df,
+        primary_dimension_keys=["Material", "Plant"],
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        periods=12,
+        start_date="2020-01",
+        frequency="M",
+        method="dense",
+    )
+
+    pd.testing.assert_frame_equal(state.classify(), expected, check_dtype=False)
+
+
+def test_xyz_state_rolling_window():
+    df = _sample_data()
+    state = aio.XYZState(
+        primary_dimension_keys="Material",
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        start_date="2020-01",
+        periods=12,
+        frequency="M",
+        rolling=True,
+    )
+    state.update(df[df["Date"] < "2020-07"])
+    for date in sorted(df.loc[df["Date"] >= "2020-07", "Date"].unique()):
+        state.update(df[df["Date"] == date])
+
+    expected = aio.xyz_analysis(
+        df=df,
+        primary_dimension_keys="Material",
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        periods=12,
+        start_date="2021-01",
+        frequency="M",
+        method="dense",
+    )
+
+    assert str(state.start_period) == "2021-01"
+    pd.testing.assert_frame_equal(state.classify(), expected, check_dtype=False)
+
+
+def test_xyz_state_save_and_load(tmp_path):
+    df = _sample_data()
+    state = aio.XYZState(
+        primary_dimension_keys=["Material", "Plant"],
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        start_date="2020-01",
+        periods=12,
+        frequency="M",
+        rolling=True,
+    )
+    state.update(df[df["Date"] < "2021-06"])
+    state.save(tmp_path / "xyz_state.parquet")
+
+    loaded = aio.XYZState.load(tmp_path / "xyz_state.parquet")
+    state.update(df[df["Date"] >= "2021-06"])
+    loaded.update(df[df["Date"] >= "2021-06"])
+
+    pd.testing.assert_frame_equal(loaded.classify(), state.classify())
+
+
+@pytest.mark.filterwarnings("error::DeprecationWarning:aio.xyz_state")
+def test_xyz_state_many_nightly_updates():
+    np.random.seed(seed=0)
+    dates = pd.period_range("2020-01-01", periods=400, freq="D").astype(str)
+    df = pd.DataFrame()
+    df["Material"] = np.repeat(["0001", "0002", "0003"], 400)
+    df["Date"] = np.tile(dates, 3)
+    # high volume with a small variation, constant and intermittent demand
+    df["Quantity"] = np.concatenate(
+        [1e6 + np.random.rand(400), np.full(400, 7.0), np.random.randint(100, size=400) * (np.random.rand(400) < 0.2)]
+    )
+    state = aio.XYZState(
+        primary_dimension_keys="Material",
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        start_date="2020-01-01",
+        periods=30,
+        frequency="D",
+        rolling=True,
+    )
+    for date in dates:
+        state.update(df[df["Date"] == date])
+
+    expected = aio.xyz_analysis(
+        df=df,
+        primary_dimension_keys="Material",
+        relevant_numeric_dimension="Quantity",
+        relevant_date_dimension="Date",
+        periods=30,
+        start_date=str(state.start_period),
+        frequency="D",
+        method="dense",
+    )
+
+    pd.testing.assert_frame_equal(state.classify(), expected, check_dtype=False)
+    assert state.classify()["XYZ_Class"].tolist() == ["X", "0", "Z"]